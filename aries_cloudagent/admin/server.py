@@ -31,6 +31,7 @@ from ..messaging.responder import BaseResponder
 from ..messaging.valid import UUIDFour
 from ..multitenant.base import BaseMultitenantManager, MultitenantManagerError
 from ..storage.error import StorageNotFoundError
+from ..transport.outbound.manager import OutboundTransportManager
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.queue.basic import BasicMessageQueue
@@ -84,6 +85,50 @@ class AdminStatusSchema(OpenAPISchema):
     )
 
 
+class AdminEndpointHealthSchema(OpenAPISchema):
+    """Schema for the health of an outbound endpoint."""
+
+    endpoint = fields.Str(
+        metadata={"description": "Endpoint scheme and host", "example": "http://host"}
+    )
+    state = fields.Str(
+        metadata={
+            "description": "Circuit state",
+            "enum": ["closed", "open", "half-open"],
+            "example": "open",
+        }
+    )
+    failures = fields.Int(
+        metadata={"description": "Consecutive failed deliveries", "example": 5}
+    )
+    total_failures = fields.Int(
+        metadata={"description": "Failed deliveries while tracked", "example": 12}
+    )
+    short_circuited = fields.Int(
+        metadata={"description": "Deliveries held back by the open circuit"}
+    )
+    last_error = fields.Str(
+        allow_none=True, metadata={"description": "Error of the last failed delivery"}
+    )
+    open_for = fields.Float(
+        allow_none=True,
+        metadata={"description": "Seconds since the circuit was opened"},
+    )
+    retry_in = fields.Float(
+        allow_none=True,
+        metadata={"description": "Seconds until the endpoint is probed again"},
+    )
+
+
+class AdminEndpointHealthListSchema(OpenAPISchema):
+    """Schema for the endpoint health endpoint."""
+
+    results = fields.List(
+        fields.Nested(AdminEndpointHealthSchema()),
+        metadata={"description": "Outbound endpoints with failed deliveries"},
+    )
+
+
 class AdminResetSchema(OpenAPISchema):
     """Schema for the reset endpoint."""
 
@@ -442,7 +487,9 @@ class AdminServer(BaseAdminServer):
             if collector:
                 handler = collector.wrap_coro(handler, [handler.__qualname__])
             if self.task_queue:
-                task = await self.task_queue.put(handler(request))
+                task = await self.task_queue.put(
+                    handler(request), group=profile.settings.get("wallet.id")
+                )
                 return await task
             return await handler(request)
 
@@ -463,6 +510,9 @@ class AdminServer(BaseAdminServer):
             web.get("/status", self.status_handler, allow_head=False),
             web.get("/status/config", self.config_handler, allow_head=False),
             web.post("/status/reset", self.status_reset_handler),
+            web.get(
+                "/status/endpoints", self.endpoint_health_handler, allow_head=False
+            ),
             web.get("/status/live", self.liveliness_handler, allow_head=False),
             web.get("/status/ready", self.readiness_handler, allow_head=False),
             web.get("/shutdown", self.shutdown_handler, allow_head=False),
@@ -687,6 +737,8 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
+        if self.multitenant_manager:
+            status["multitenant_auth_cache"] = self.multitenant_manager.auth_cache_stats
         return web.json_response(status)
 
     @docs(tags=["server"], summary="Reset statistics")
@@ -706,6 +758,23 @@ class AdminServer(BaseAdminServer):
             collector.reset()
         return web.json_response({})
 
+    @docs(tags=["server"], summary="Fetch the health of failing outbound endpoints")
+    @response_schema(AdminEndpointHealthListSchema(), 200, description="")
+    async def endpoint_health_handler(self, request: web.BaseRequest):
+        """Request handler for the health of outbound endpoints.
+
+        Args:
+            request: aiohttp request object
+
+        Returns:
+            The web response
+
+        """
+        outbound = self.context.inject_or(OutboundTransportManager)
+        return web.json_response(
+            {"results": outbound.endpoint_health.serialize() if outbound else []}
+        )
+
     async def redirect_handler(self, request: web.BaseRequest):
         """Perform redirect to documentation."""
         raise web.HTTPFound("/api/doc")
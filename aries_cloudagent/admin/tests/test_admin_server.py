@@ -324,6 +324,7 @@ class TestAdminServer(IsolatedAsyncioTestCase):
             "status",
             "status/live",
             "status/ready",
+            "status/endpoints",
             "shutdown",  # mock conductor has magic-mock stop()
         ):
             async with self.client_session.get(
@@ -333,6 +334,28 @@ class TestAdminServer(IsolatedAsyncioTestCase):
 
         await server.stop()
 
+    async def test_endpoint_health(self):
+        outbound = test_module.OutboundTransportManager(
+            InMemoryProfile.test_profile({"transport.circuit_failure_threshold": 1})
+        )
+        outbound.endpoint_health.record_failure("http://down:8020/path", KeyError("x"))
+        context = InjectionContext()
+        context.injector.bind_instance(test_module.OutboundTransportManager, outbound)
+        server = self.get_admin_server({"admin.admin_insecure_mode": True}, context)
+        await server.start()
+
+        async with self.client_session.get(
+            f"http://127.0.0.1:{self.port}/status/endpoints", headers={}
+        ) as response:
+            assert response.status == 200
+            result = await response.json()
+        assert [
+            (health["endpoint"], health["state"], health["failures"])
+            for health in result["results"]
+        ] == [("http://down:8020", "open", 1)]
+
+        await server.stop()
+
     async def test_visit_secure_mode(self):
         settings = {
             "admin.admin_insecure_mode": False,
@@ -385,6 +408,14 @@ class TestAdminServer(IsolatedAsyncioTestCase):
 
         await server.stop()
 
+    async def test_status_multitenant_auth_cache(self):
+        server = self.get_admin_server({"admin.admin_insecure_mode": True})
+        stats = {"tokens": {"hit_ratio": 0.5}, "wallet_records": {"hit_ratio": 0.25}}
+        server.multitenant_manager = async_mock.MagicMock(auth_cache_stats=stats)
+
+        response = await server.status_handler(async_mock.MagicMock())
+        assert json.loads(response.body)["multitenant_auth_cache"] == stats
+
     async def test_query_config(self):
         settings = {
             "admin.admin_insecure_mode": False,
@@ -0,0 +1,99 @@
+"""Caches of the keys used for DIDComm envelopes."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class KeyCache:
+    """Bounded least-recently-used cache of keys, counting hits and misses.
+
+    The cache is shared with the threads packing messages, so all access is
+    serialized with a lock.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize the cache.
+
+        Args:
+            max_size: The maximum number of keys to retain
+
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached keys."""
+        return len(self._keys)
+
+    def get(self, ident: Hashable) -> Any:
+        """Get a cached key, if any."""
+        with self._lock:
+            value = self._keys.get(ident)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._keys.move_to_end(ident)
+            return value
+
+    def put(self, ident: Hashable, value: Any):
+        """Add a key to the cache, evicting the least recently used keys."""
+        with self._lock:
+            self._keys[ident] = value
+            self._keys.move_to_end(ident)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+
+    def get_or_create(self, ident: Hashable, create: Callable[[], Any]) -> Any:
+        """Get a cached key, or create and cache it."""
+        value = self.get(ident)
+        if value is None:
+            value = create()
+            self.put(ident, value)
+        return value
+
+    def discard(self, ident: Hashable):
+        """Remove a key from the cache."""
+        with self._lock:
+            self._keys.pop(ident, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]):
+        """Remove all keys whose identifier matches a predicate."""
+        with self._lock:
+            for ident in [ident for ident in self._keys if predicate(ident)]:
+                del self._keys[ident]
+
+    def clear(self):
+        """Remove all keys and reset the counters."""
+        with self._lock:
+            self._keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache usage counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._keys),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# X25519 public keys converted from Ed25519 verkeys, by verkey
+PUBLIC_KEYS = KeyCache(max_size=10000)
+
+# Ed25519 and X25519 secret keys held by a wallet, by (wallet scope, verkey)
+LOCAL_KEYS = KeyCache(max_size=4096)
+
+
+def key_cache_stats() -> dict:
+    """Summarize the usage of the DIDComm key caches."""
+    return {"public": PUBLIC_KEYS.stats, "local": LOCAL_KEYS.stats}
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from ..key_cache import KeyCache
+
+
+class TestKeyCache(TestCase):
+    def test_lru(self):
+        cache = KeyCache(max_size=2)
+        assert cache.stats["hit_ratio"] is None
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get_or_create("a", lambda: 10) == 1
+        assert cache.get_or_create("b", lambda: 20) == 20
+        assert len(cache) == 2
+        assert cache.stats == {
+            "entries": 2,
+            "max_size": 2,
+            "hits": 2,
+            "misses": 2,
+            "hit_ratio": 0.5,
+        }
+
+        cache.discard("a")
+        cache.discard("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
+
+    def test_discard_where(self):
+        cache = KeyCache(max_size=10)
+        for scope in ("s1", "s2"):
+            for verkey in ("v1", "v2"):
+                cache.put(((scope, None), verkey), verkey)
+        cache.discard_where(lambda ident: ident[0][0] == "s1")
+        assert len(cache) == 2
+        assert cache.get((("s2", None), "v1")) == "v1"
@@ -0,0 +1,95 @@
+import pytest
+
+from aries_askar import Key, KeyAlg, Session
+
+from ....config.injection_context import InjectionContext
+from ....wallet.error import WalletError
+from ....wallet.util import bytes_to_b58
+
+from ...profile import AskarProfileManager
+from .. import v1 as test_module
+from ..key_cache import LOCAL_KEYS, PUBLIC_KEYS
+
+MESSAGE = b"Expecto patronum"
+SCOPE = ("store", None)
+
+
+@pytest.fixture()
+async def session():
+    context = InjectionContext()
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    async with profile.session() as session:
+        yield session.handle
+    del session
+    await profile.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    PUBLIC_KEYS.clear()
+    LOCAL_KEYS.clear()
+    yield
+    PUBLIC_KEYS.clear()
+    LOCAL_KEYS.clear()
+
+
+async def insert_key(session: Session) -> str:
+    key = Key.generate(KeyAlg.ED25519)
+    verkey = bytes_to_b58(key.get_public_bytes())
+    await session.insert_key(verkey, key)
+    return verkey
+
+
+@pytest.mark.askar
+class TestAskarDidCommV1:
+    @pytest.mark.asyncio
+    async def test_round_trip_cached(self, session: Session):
+        alice_vk = await insert_key(session)
+        bob_vk = await insert_key(session)
+        alice_key, alice_xkey = await test_module.local_keys(session, alice_vk, SCOPE)
+
+        for _ in range(3):
+            packed = test_module.pack_message(
+                [bob_vk], alice_key, MESSAGE, from_xkey=alice_xkey
+            )
+            message, recip_vk, sender_vk = await test_module.unpack_message(
+                session, packed, scope=SCOPE
+            )
+            assert (message, recip_vk, sender_vk) == (MESSAGE, bob_vk, alice_vk)
+
+        # the recipient key and the sender key are converted once
+        assert PUBLIC_KEYS.stats["entries"] == 2
+        assert PUBLIC_KEYS.stats["misses"] == 2
+        assert PUBLIC_KEYS.stats["hits"] == 4
+        # the recipient key is only fetched from the wallet for the first message
+        assert LOCAL_KEYS.stats["entries"] == 2
+        assert LOCAL_KEYS.stats["hits"] == 2
+
+        test_module.invalidate_keys(bob_vk, SCOPE)
+        assert bob_vk not in (ident[1] for ident in LOCAL_KEYS._keys)
+        assert PUBLIC_KEYS.get(bob_vk) is None
+
+    @pytest.mark.asyncio
+    async def test_scope(self, session: Session):
+        bob_vk = await insert_key(session)
+        packed = test_module.pack_message([bob_vk], None, MESSAGE)
+        await test_module.unpack_message(session, packed, scope=SCOPE)
+        await session.remove_key(bob_vk)
+
+        # cached for the same wallet only
+        message, _, sender_vk = await test_module.unpack_message(
+            session, packed, scope=SCOPE
+        )
+        assert (message, sender_vk) == (MESSAGE, None)
+        with pytest.raises(WalletError):
+            await test_module.unpack_message(session, packed, scope=("other", None))
+        with pytest.raises(WalletError):
+            await test_module.unpack_message(session, packed)
+        assert await test_module.local_keys(session, bob_vk) is None
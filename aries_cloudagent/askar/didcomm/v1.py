@@ -1,7 +1,7 @@
 """DIDComm v1 envelope handling via Askar backend."""
 
 from collections import OrderedDict
-from typing import Optional, Sequence, Tuple
+from typing import Hashable, Optional, Sequence, Tuple, Union
 
 from aries_askar import (
     crypto_box,
@@ -12,16 +12,70 @@ from aries_askar import (
 from aries_askar.bindings import key_get_secret_bytes
 from marshmallow import ValidationError
 
+from ...utils.crypto_pool import CryptoPool
 from ...utils.jwe import b64url, JweEnvelope, JweRecipient
 from ...wallet.base import WalletError
 from ...wallet.crypto import extract_pack_recipients
 from ...wallet.util import b58_to_bytes, bytes_to_b58
 
+from .key_cache import LOCAL_KEYS, PUBLIC_KEYS
+
+
+def public_xkey(verkey: str) -> Key:
+    """Get the X25519 public key for an Ed25519 verkey, from the cache if possible."""
+    return PUBLIC_KEYS.get_or_create(
+        verkey,
+        lambda: Key.from_public_bytes(KeyAlg.ED25519, b58_to_bytes(verkey)).convert_key(
+            KeyAlg.X25519
+        ),
+    )
+
+
+async def local_keys(
+    session: Session, verkey: str, scope: Hashable = None
+) -> Optional[Tuple[Key, Key]]:
+    """Load the Ed25519 and X25519 secret keys for a verkey held by a wallet.
+
+    Args:
+        session: The Askar session of the wallet
+        verkey: The verkey to look up
+        scope: Identifies the wallet in the key cache, or None to bypass it
+
+    Returns:
+        A tuple of the Ed25519 and X25519 keys, or None if the wallet does not
+        hold the verkey
+
+    """
+    if scope is not None:
+        keys = LOCAL_KEYS.get((scope, verkey))
+        if keys:
+            return keys
+    key_entry = await session.fetch_key(verkey)
+    if not key_entry:
+        return None
+    keys = (key_entry.key, key_entry.key.convert_key(KeyAlg.X25519))
+    if scope is not None:
+        LOCAL_KEYS.put((scope, verkey), keys)
+    return keys
+
+
+def invalidate_keys(verkey: str, scope: Hashable = None):
+    """Remove a verkey from the key caches."""
+    PUBLIC_KEYS.discard(verkey)
+    if scope is not None:
+        LOCAL_KEYS.discard((scope, verkey))
+
 
 def pack_message(
-    to_verkeys: Sequence[str], from_key: Optional[Key], message: bytes
+    to_verkeys: Sequence[str],
+    from_key: Optional[Key],
+    message: bytes,
+    from_xkey: Key = None,
 ) -> bytes:
-    """Encode a message using the DIDComm v1 'pack' algorithm."""
+    """Encode a message using the DIDComm v1 'pack' algorithm.
+
+    The X25519 conversion of the sender key may be provided as `from_xkey`.
+    """
     wrapper = JweEnvelope(with_protected_recipients=True, with_flatten_recipients=False)
     cek = Key.generate(KeyAlg.C20P)
     # avoid converting to bytes object: this way the only copy is zeroed afterward
@@ -29,12 +83,10 @@ def pack_message(
     sender_vk = (
         bytes_to_b58(from_key.get_public_bytes()).encode("utf-8") if from_key else None
     )
-    sender_xk = from_key.convert_key(KeyAlg.X25519) if from_key else None
+    sender_xk = (from_xkey or from_key.convert_key(KeyAlg.X25519)) if from_key else None
 
     for target_vk in to_verkeys:
-        target_xk = Key.from_public_bytes(
-            KeyAlg.ED25519, b58_to_bytes(target_vk)
-        ).convert_key(KeyAlg.X25519)
+        target_xk = public_xkey(target_vk)
         if sender_vk:
             enc_sender = crypto_box.crypto_box_seal(target_xk, sender_vk)
             nonce = crypto_box.random_nonce()
@@ -73,12 +125,26 @@ def pack_message(
     return wrapper.to_json().encode("utf-8")
 
 
-async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str, str]:
-    """Decode a message using the DIDComm v1 'unpack' algorithm."""
-    try:
-        wrapper = JweEnvelope.from_json(enc_message)
-    except ValidationError:
-        raise WalletError("Invalid packed message")
+async def unpack_message(
+    session: Session,
+    enc_message: Union[bytes, JweEnvelope],
+    crypto_pool: CryptoPool = None,
+    scope: Hashable = None,
+) -> Tuple[str, str, str]:
+    """Decode a message using the DIDComm v1 'unpack' algorithm.
+
+    The message may be given as its already decoded JWE envelope. When a
+    crypto pool is given, the decryption runs on one of its workers once the
+    recipient key has been loaded. Recipient keys are cached under `scope`,
+    which identifies the wallet, when it is given.
+    """
+    if isinstance(enc_message, JweEnvelope):
+        wrapper = enc_message
+    else:
+        try:
+            wrapper = JweEnvelope.from_json(enc_message)
+        except ValidationError:
+            raise WalletError("Invalid packed message")
 
     alg = wrapper.protected.get("alg")
     is_authcrypt = alg == "Authcrypt"
@@ -87,22 +153,37 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
 
     recips = extract_pack_recipients(wrapper.recipients)
 
-    payload_key, sender_vk = None, None
+    recip_key = None
     for recip_vk in recips:
-        recip_key_entry = await session.fetch_key(recip_vk)
-        if recip_key_entry:
-            payload_key, sender_vk = _extract_payload_key(
-                recips[recip_vk], recip_key_entry.key
-            )
+        keys = await local_keys(session, recip_vk, scope)
+        if keys:
+            recip_key = keys[1]
             break
 
-    if not payload_key:
+    if not recip_key:
         raise WalletError(
             "No corresponding recipient key found in {}".format(tuple(recips))
         )
+
+    if crypto_pool:
+        message, sender_vk = await crypto_pool.run(
+            _decrypt_message, wrapper, recips[recip_vk], recip_key
+        )
+    else:
+        message, sender_vk = _decrypt_message(wrapper, recips[recip_vk], recip_key)
     if not sender_vk and is_authcrypt:
         raise WalletError("Sender public key not provided for Authcrypt message")
+    return message, recip_vk, sender_vk
+
+
+def _decrypt_message(
+    wrapper: JweEnvelope, sender_cek: dict, recip_x: Key
+) -> Tuple[bytes, str]:
+    """Decrypt the payload of a packed message for a recipient X25519 key.
 
+    Returns: A tuple of the message and sender verkey
+    """
+    payload_key, sender_vk = _extract_payload_key(sender_cek, recip_x)
     cek = Key.from_secret_bytes(KeyAlg.C20P, payload_key)
     message = cek.aead_decrypt(
         wrapper.ciphertext,
@@ -110,23 +191,19 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
         tag=wrapper.tag,
         aad=wrapper.protected_bytes,
     )
-    return message, recip_vk, sender_vk
+    return message, sender_vk
 
 
-def _extract_payload_key(sender_cek: dict, recip_secret: Key) -> Tuple[bytes, str]:
+def _extract_payload_key(sender_cek: dict, recip_x: Key) -> Tuple[bytes, str]:
     """Extract the payload key from pack recipient details.
 
     Returns: A tuple of the CEK and sender verkey
     """
-    recip_x = recip_secret.convert_key(KeyAlg.X25519)
-
     if sender_cek["nonce"] and sender_cek["sender"]:
         sender_vk = crypto_box.crypto_box_seal_open(
             recip_x, sender_cek["sender"]
         ).decode("utf-8")
-        sender_x = Key.from_public_bytes(
-            KeyAlg.ED25519, b58_to_bytes(sender_vk)
-        ).convert_key(KeyAlg.X25519)
+        sender_x = public_xkey(sender_vk)
         cek = crypto_box.crypto_box_open(
             recip_x, sender_x, sender_cek["key"], sender_cek["nonce"]
         )
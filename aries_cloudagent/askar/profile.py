@@ -27,6 +27,7 @@ from ..utils.multi_ledger import get_write_ledger_config_for_profile
 from ..wallet.base import BaseWallet
 from ..wallet.crypto import validate_seed
 
+from .didcomm.key_cache import LOCAL_KEYS
 from .store import AskarStoreConfig, AskarOpenStore
 
 LOGGER = logging.getLogger(__name__)
@@ -66,6 +67,9 @@ class AskarProfile(Profile):
         """Remove the profile."""
         if self.profile_id:
             await self.store.remove_profile(self.profile_id)
+            # drop the secret keys of the removed profile from the envelope cache
+            scope = (self.opened.key_scope, self.profile_id)
+            LOCAL_KEYS.discard_where(lambda ident: ident[0] == scope)
 
     def init_ledger_pool(self):
         """Initialize the ledger pool."""
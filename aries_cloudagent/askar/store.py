@@ -3,6 +3,7 @@
 import json
 import logging
 import urllib
+from uuid import uuid4
 
 from aries_askar import AskarError, AskarErrorCode, Store
 
@@ -10,6 +11,8 @@ from ..core.error import ProfileError, ProfileDuplicateError, ProfileNotFoundErr
 from ..core.profile import Profile
 from ..utils.env import storage_path
 
+from .didcomm.key_cache import LOCAL_KEYS
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -183,6 +186,8 @@ class AskarOpenStore:
         self.config = config
         self.created = created
         self.store = store
+        # identifies the store in the DIDComm key cache
+        self.key_scope = uuid4().hex
 
     @property
     def name(self) -> str:
@@ -194,3 +199,4 @@ class AskarOpenStore:
         if self.store:
             await self.store.close(remove=self.config.auto_remove)
             self.store = None
+            LOCAL_KEYS.discard_where(lambda ident: ident[0][0] == self.key_scope)
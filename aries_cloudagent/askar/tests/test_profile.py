@@ -8,6 +8,7 @@ from ...config.injection_context import InjectionContext
 from ...ledger.base import BaseLedger
 
 from .. import profile as test_module
+from ..didcomm.key_cache import LOCAL_KEYS
 
 
 @pytest.fixture
@@ -73,10 +74,16 @@ async def test_remove_success(open_store):
     remove_profile_stub = asyncio.Future()
     remove_profile_stub.set_result(True)
     openStore.store.remove_profile.return_value = remove_profile_stub
+    openStore.key_scope = "key_scope"
+    LOCAL_KEYS.put((("key_scope", profile_id), "verkey"), "keys")
+    LOCAL_KEYS.put((("key_scope", "other_id"), "verkey"), "other keys")
 
     await askar_profile.remove()
 
     openStore.store.remove_profile.assert_called_once_with(profile_id)
+    assert LOCAL_KEYS.get((("key_scope", profile_id), "verkey")) is None
+    assert LOCAL_KEYS.get((("key_scope", "other_id"), "verkey")) == "other keys"
+    LOCAL_KEYS.clear()
 
 
 @pytest.mark.asyncio
@@ -2,7 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Sequence, Text, Union
+from typing import Any, Mapping, Optional, Sequence, Text, Union
 
 from ..core.error import BaseError
 
@@ -56,9 +56,71 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
-    def acquire(self, key: Text):
-        """Acquire a lock on a given cache key."""
-        result = CacheKeyLock(self, key)
+    async def get_many(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """Get several items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            The records found, or `None` for missing keys, in the order of `keys`
+
+        """
+        return [await self.get(key) for key in keys]
+
+    async def set_many(self, items: Mapping[Text, Any], ttl: Optional[int] = None):
+        """Add several items to the cache with an optional ttl.
+
+        Args:
+            items: a mapping of cache keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """Remove several items from the cache, if present.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        for key in keys:
+            await self.clear(key)
+
+    async def acquire_shared(self, key: Text, timeout: float) -> bool:
+        """Acquire a lock on a cache key which is shared with other processes.
+
+        Caches which are not shared between processes always grant the lock.
+
+        Args:
+            key: the cache key to lock
+            timeout: number of seconds after which the lock is released
+
+        Returns:
+            `True` if the lock was acquired, `False` if it is held elsewhere
+
+        """
+        return True
+
+    async def release_shared(self, key: Text):
+        """Release a lock previously obtained with `acquire_shared`."""
+
+    async def close(self):
+        """Close any connections held by the cache."""
+
+    def acquire(self, key: Text, single_flight: bool = False):
+        """Acquire a lock on a given cache key.
+
+        Args:
+            key: the cache key to lock
+            single_flight: when the key is not cached, also coordinate with other
+                processes sharing the cache so that only one of them produces
+                the value
+
+        """
+        result = CacheKeyLock(self, key, single_flight=single_flight)
         first = self._key_locks.setdefault(key, result)
         if first is not result:
             result.parent = first
@@ -81,12 +143,17 @@ class CacheKeyLock:
     or querying the same semi-expensive data. Not thread safe.
     """
 
-    def __init__(self, cache: BaseCache, key: Text):
+    SHARED_LOCK_TIMEOUT = 10.0
+    SHARED_POLL_INTERVAL = 0.05
+
+    def __init__(self, cache: BaseCache, key: Text, single_flight: bool = False):
         """Initialize the key lock."""
         self.cache = cache
         self.exception: BaseException = None
         self.key = key
         self.released = False
+        self.single_flight = single_flight
+        self._shared = False
         self._future: asyncio.Future = asyncio.get_event_loop().create_future()
         self._parent: "CacheKeyLock" = None
 
@@ -144,10 +211,33 @@ class CacheKeyLock:
                 await self  # wait for parent's done handler to complete
         if not result:
             found = await self.cache.get(self.key)
+            if not found and self.single_flight and not self.parent:
+                found = await self._acquire_shared()
             if found:
                 self._future.set_result(found)
         return self
 
+    async def _acquire_shared(self) -> Any:
+        """Wait until this process holds the shared lock or a value is cached.
+
+        Returns:
+            The value cached by another process, if any
+
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.SHARED_LOCK_TIMEOUT
+        while True:
+            if await self.cache.acquire_shared(self.key, self.SHARED_LOCK_TIMEOUT):
+                self._shared = True
+                return None
+            if loop.time() >= deadline:
+                # holder appears to be stuck; produce the value locally
+                return None
+            await asyncio.sleep(self.SHARED_POLL_INTERVAL)
+            found = await self.cache.get(self.key)
+            if found:
+                return found
+
     def release(self):
         """Release the cache lock."""
         if not self.parent and not self.released:
@@ -163,6 +253,9 @@ class CacheKeyLock:
             self.exception = exc_val
         if not self.done:
             self._future.set_result(None)
+        if self._shared:
+            self._shared = False
+            await self.cache.release_shared(self.key)
         self.release()
 
     def __del__(self):
@@ -1,29 +1,101 @@
 """Basic in-memory cache implementation."""
 
+import heapq
+import sys
 import time
-from typing import Any, Sequence, Text, Union
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Sequence, Text, Union
 
 from .base import BaseCache
 
 
+def _approx_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_approx_size(k) + _approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approx_size(item) for item in value)
+    return size
+
+
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """Basic in-memory cache class.
+
+    Entries are kept in least-recently-used order. Expired entries are removed
+    lazily using a heap ordered by expiry time, so cache operations do not need
+    to scan every entry. When `max_entries` or `max_bytes` is set, the least
+    recently used entries are evicted to stay within the limits.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """Initialize a `InMemoryCache` instance.
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+        Args:
+            max_entries: the maximum number of entries to retain
+            max_bytes: the approximate maximum size of all cached values
+
+        """
         super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self._cache = OrderedDict()
+        # heap of (expires, key) pairs, may contain stale entries
+        self._expiry = []
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache usage counters."""
+        return {
+            "entries": len(self._cache),
+            "size": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
 
     def _remove_expired_cache_items(self):
         """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
-                del self._cache[key]
+        now = time.perf_counter()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = heapq.heappop(self._expiry)
+            item = self._cache.get(key)
+            # skip heap entries superseded by a later set or clear
+            if item is not None and item["expires"] == expires:
+                self._remove(key)
+                self.expirations += 1
+
+    def _remove(self, key: Text):
+        """Remove a single entry from the cache."""
+        item = self._cache.pop(key)
+        self._size -= item.get("size", 0)
+
+    def _evict(self):
+        """Evict least recently used entries until within the configured limits."""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self._size > self.max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self.evictions += 1
+
+    def _compact_expiry(self):
+        """Drop stale heap entries once they outnumber the live ones."""
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (expires, key)
+                for (expires, key) in self._expiry
+                if key in self._cache and self._cache[key]["expires"] == expires
+            ]
+            heapq.heapify(self._expiry)
 
     async def get(self, key: Text):
         """Get an item from the cache.
@@ -36,7 +108,45 @@ class InMemoryCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        item = self._cache.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return item["value"]
+
+    async def get_many(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """Get several items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            The records found, or `None` for missing keys, in the order of `keys`
+
+        """
+        self._remove_expired_cache_items()
+        results = []
+        for key in keys:
+            item = self._cache.get(key)
+            if item is None:
+                self.misses += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                results.append(item["value"])
+        return results
+
+    def _store(self, key: Text, value: Any, expires_ts: Optional[float], size: int):
+        """Store a single entry, replacing any existing one."""
+        if key in self._cache:
+            self._remove(key)
+        self._cache[key] = {"expires": expires_ts, "value": value, "size": size}
+        self._size += size
+        if expires_ts is not None:
+            heapq.heappush(self._expiry, (expires_ts, key))
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """Add an item to the cache with an optional ttl.
@@ -51,8 +161,29 @@ class InMemoryCache(BaseCache):
         """
         self._remove_expired_cache_items()
         expires_ts = time.perf_counter() + ttl if ttl else None
+        size = _approx_size(value) if self.max_bytes else 0
         for key in [keys] if isinstance(keys, Text) else keys:
-            self._cache[key] = {"expires": expires_ts, "value": value}
+            self._store(key, value, expires_ts, size)
+        self._evict()
+        self._compact_expiry()
+
+    async def set_many(self, items: Mapping[Text, Any], ttl: Optional[int] = None):
+        """Add several items to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            items: a mapping of cache keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        self._remove_expired_cache_items()
+        expires_ts = time.perf_counter() + ttl if ttl else None
+        for key, value in items.items():
+            size = _approx_size(value) if self.max_bytes else 0
+            self._store(key, value, expires_ts, size)
+        self._evict()
+        self._compact_expiry()
 
     async def clear(self, key: Text):
         """Remove an item from the cache, if present.
@@ -62,9 +193,22 @@ class InMemoryCache(BaseCache):
 
         """
         if key in self._cache:
-            del self._cache[key]
+            self._remove(key)
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """Remove several items from the cache, if present.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        for key in keys:
+            if key in self._cache:
+                self._remove(key)
 
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry = []
+        self._size = 0
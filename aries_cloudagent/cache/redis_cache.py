@@ -0,0 +1,410 @@
+"""Shared cache implementation using the Redis protocol."""
+
+import asyncio
+import json
+import ssl
+import uuid
+from typing import Any, Mapping, Optional, Sequence, Text, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+from .base import BaseCache, CacheError
+from .in_memory import InMemoryCache
+
+
+class RedisCacheError(CacheError):
+    """Error raised when communicating with the shared cache server."""
+
+
+class RespConnection:
+    """A single connection to a server speaking the Redis (RESP2) protocol.
+
+    Commands passed to `execute` in a single call are pipelined: all of them
+    are written before any reply is read.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Initialize the connection."""
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(
+        cls,
+        host: str,
+        port: int,
+        *,
+        password: str = None,
+        username: str = None,
+        db: int = None,
+        use_ssl: bool = False,
+    ) -> "RespConnection":
+        """Open a connection and perform authentication and database selection."""
+        try:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=ssl.create_default_context() if use_ssl else None
+            )
+        except OSError as err:
+            raise RedisCacheError(
+                f"Error connecting to cache server at {host}:{port}"
+            ) from err
+        conn = cls(reader, writer)
+        setup = []
+        if password:
+            setup.append(
+                ("AUTH", username, password) if username else ("AUTH", password)
+            )
+        if db:
+            setup.append(("SELECT", str(db)))
+        if setup:
+            await conn.execute(*setup)
+        return conn
+
+    @property
+    def closed(self) -> bool:
+        """Accessor for the closed state of the connection."""
+        return self._writer.is_closing()
+
+    @staticmethod
+    def encode_command(args: Sequence[Union[str, bytes]]) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def _read_reply(self):
+        """Read a single reply from the server."""
+        line = await self._reader.readline()
+        if not line:
+            raise RedisCacheError("Connection closed by cache server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            return RedisCacheError(body.decode("utf-8"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisCacheError(f"Unexpected reply from cache server: {line!r}")
+
+    async def execute(self, *commands: Sequence[Union[str, bytes]]) -> list:
+        """Send one or more commands and collect their replies in order."""
+        self._writer.write(b"".join(self.encode_command(cmd) for cmd in commands))
+        try:
+            await self._writer.drain()
+            replies = [await self._read_reply() for _ in commands]
+        except (OSError, asyncio.IncompleteReadError) as err:
+            self.close()
+            raise RedisCacheError("Error communicating with cache server") from err
+        for reply in replies:
+            if isinstance(reply, RedisCacheError):
+                raise reply
+        return replies
+
+    def close(self):
+        """Close the connection."""
+        if not self._writer.is_closing():
+            self._writer.close()
+
+
+class RedisCache(BaseCache):
+    """Cache shared between agent instances through a Redis-compatible server.
+
+    Values are stored as compact JSON, so only JSON-serializable values may be
+    cached. An optional near cache keeps recently used values in process for
+    `near_ttl` seconds to avoid a network round-trip on hot keys; updates made
+    by other instances become visible once the near cache entry expires.
+    """
+
+    LOCK_PREFIX = "lock::"
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        prefix: str = "acapy::cache::",
+        pool_size: int = 10,
+        near_ttl: float = None,
+        near_max_entries: int = 10000,
+    ):
+        """Initialize a `RedisCache` instance.
+
+        Args:
+            url: the server URL, as in `redis://[[user]:password@]host[:port][/db]`
+            prefix: the prefix applied to all keys on the server
+            pool_size: the maximum number of open server connections
+            near_ttl: seconds to retain values in the in-process near cache
+            near_max_entries: the maximum number of near cache entries
+
+        """
+        super().__init__()
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise RedisCacheError(f"Unsupported cache URL scheme: {parsed.scheme}")
+        self._conn_args = {
+            "host": parsed.hostname or "localhost",
+            "port": parsed.port or 6379,
+            "username": unquote(parsed.username) if parsed.username else None,
+            "password": unquote(parsed.password) if parsed.password else None,
+            "db": int(parsed.path.strip("/") or 0),
+            "use_ssl": parsed.scheme == "rediss",
+        }
+        self.prefix = prefix
+        self.pool_size = pool_size
+        self.near_ttl = near_ttl
+        self.near_cache = (
+            InMemoryCache(max_entries=near_max_entries) if near_ttl else None
+        )
+        self._idle = []
+        self._open_count = 0
+        self._pool_cond: asyncio.Condition = None
+        self._lock_tokens = {}
+
+    def _key(self, key: Text) -> str:
+        """Get the server-side key for a cache key."""
+        return self.prefix + key
+
+    @staticmethod
+    def _dump(value: Any) -> bytes:
+        """Serialize a value for storage."""
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _load(value: Optional[bytes]) -> Any:
+        """Deserialize a stored value."""
+        return None if value is None else json.loads(value)
+
+    @staticmethod
+    def _ttl_args(ttl: Optional[float]) -> Tuple[str, ...]:
+        """Get the SET arguments for an optional ttl in seconds."""
+        return ("PX", str(max(int(ttl * 1000), 1))) if ttl else ()
+
+    async def _get_connection(self) -> RespConnection:
+        """Obtain an idle connection from the pool or open a new one."""
+        if not self._pool_cond:
+            self._pool_cond = asyncio.Condition()
+        async with self._pool_cond:
+            while not self._idle and self._open_count >= self.pool_size:
+                await self._pool_cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._open_count += 1
+        try:
+            return await RespConnection.open(**self._conn_args)
+        except Exception:
+            await self._discard_connection(None)
+            raise
+
+    async def _return_connection(self, conn: RespConnection):
+        """Return a connection to the pool."""
+        if conn.closed:
+            await self._discard_connection(conn)
+            return
+        async with self._pool_cond:
+            self._idle.append(conn)
+            self._pool_cond.notify()
+
+    async def _discard_connection(self, conn: Optional[RespConnection]):
+        """Drop a connection from the pool."""
+        if conn:
+            conn.close()
+        async with self._pool_cond:
+            self._open_count -= 1
+            self._pool_cond.notify()
+
+    async def execute(self, *commands: Sequence[Union[str, bytes]]) -> list:
+        """Execute a pipeline of commands on a pooled connection."""
+        conn = await self._get_connection()
+        try:
+            replies = await conn.execute(*commands)
+        except RedisCacheError:
+            await self._return_connection(conn)
+            raise
+        except BaseException:
+            # replies may be left unread, so the connection cannot be reused
+            await self._discard_connection(conn)
+            raise
+        await self._return_connection(conn)
+        return replies
+
+    async def get(self, key: Text):
+        """Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        if self.near_cache:
+            found = await self.near_cache.get(key)
+            if found is not None:
+                return found
+        (reply,) = await self.execute(("GET", self._key(key)))
+        value = self._load(reply)
+        if self.near_cache and value is not None:
+            await self.near_cache.set(key, value, self.near_ttl)
+        return value
+
+    async def set(
+        self, keys: Union[Text, Sequence[Text]], value: Any, ttl: Optional[int] = None
+    ):
+        """Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        keys = [keys] if isinstance(keys, Text) else list(keys)
+        data = self._dump(value)
+        ttl_args = self._ttl_args(ttl)
+        await self.execute(*(("SET", self._key(key), data, *ttl_args) for key in keys))
+        if self.near_cache:
+            near_ttl = min(ttl, self.near_ttl) if ttl else self.near_ttl
+            await self.near_cache.set(keys, value, near_ttl)
+
+    async def get_many(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """Get several items from the cache with a single request.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            The records found, or `None` for missing keys, in the order of `keys`
+
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        results = [None] * len(keys)
+        if self.near_cache:
+            results = await self.near_cache.get_many(keys)
+        missing = [idx for idx, value in enumerate(results) if value is None]
+        if missing:
+            (replies,) = await self.execute(
+                ("MGET", *(self._key(keys[idx]) for idx in missing))
+            )
+            found = {}
+            for idx, reply in zip(missing, replies):
+                results[idx] = self._load(reply)
+                if results[idx] is not None:
+                    found[keys[idx]] = results[idx]
+            if self.near_cache and found:
+                await self.near_cache.set_many(found, self.near_ttl)
+        return results
+
+    async def set_many(self, items: Mapping[Text, Any], ttl: Optional[int] = None):
+        """Add several items to the cache with a single pipelined request.
+
+        Args:
+            items: a mapping of cache keys to the values to store
+            ttl: number of seconds that the records should persist
+
+        """
+        if not items:
+            return
+        ttl_args = self._ttl_args(ttl)
+        await self.execute(
+            *(
+                ("SET", self._key(key), self._dump(value), *ttl_args)
+                for key, value in items.items()
+            )
+        )
+        if self.near_cache:
+            near_ttl = min(ttl, self.near_ttl) if ttl else self.near_ttl
+            await self.near_cache.set_many(items, near_ttl)
+
+    async def clear(self, key: Text):
+        """Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        if self.near_cache:
+            await self.near_cache.clear(key)
+        await self.execute(("DEL", self._key(key)))
+
+    async def clear_many(self, keys: Sequence[Text]):
+        """Remove several items from the cache with a single request.
+
+        Args:
+            keys: the keys to remove
+
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        if self.near_cache:
+            await self.near_cache.clear_many(keys)
+        await self.execute(("DEL", *(self._key(key) for key in keys)))
+
+    async def flush(self):
+        """Remove all items with this cache's prefix from the cache."""
+        if self.near_cache:
+            await self.near_cache.flush()
+        cursor = "0"
+        pattern = self.prefix.replace("*", "\\*") + "*"
+        while True:
+            ((cursor, keys),) = await self.execute(
+                ("SCAN", cursor, "MATCH", pattern, "COUNT", "1000")
+            )
+            if keys:
+                await self.execute(("DEL", *keys))
+            cursor = cursor.decode("utf-8") if isinstance(cursor, bytes) else cursor
+            if cursor == "0":
+                break
+
+    async def acquire_shared(self, key: Text, timeout: float) -> bool:
+        """Acquire a lock on a cache key which is shared with other processes."""
+        token = uuid.uuid4().hex
+        (reply,) = await self.execute(
+            ("SET", self._key(self.LOCK_PREFIX + key), token, "NX")
+            + self._ttl_args(timeout)
+        )
+        if reply == "OK":
+            self._lock_tokens[key] = token
+            return True
+        return False
+
+    async def release_shared(self, key: Text):
+        """Release a lock previously obtained with `acquire_shared`."""
+        token = self._lock_tokens.pop(key, None)
+        if not token:
+            return
+        lock_key = self._key(self.LOCK_PREFIX + key)
+        (holder,) = await self.execute(("GET", lock_key))
+        if holder and holder.decode("utf-8") == token:
+            await self.execute(("DEL", lock_key))
+
+    async def close(self):
+        """Close all idle server connections."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        self._open_count -= len(idle)
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}(host={}, port={})>".format(
+            self.__class__.__name__,
+            self._conn_args["host"],
+            self._conn_args["port"],
+        )
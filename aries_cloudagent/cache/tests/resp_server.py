@@ -0,0 +1,100 @@
+"""Minimal in-process stand-in for a Redis server, used in cache tests."""
+
+import asyncio
+import fnmatch
+import time
+
+
+class StubRespServer:
+    """Serve the subset of Redis commands used by `RedisCache`."""
+
+    def __init__(self):
+        """Initialize the server."""
+        self.data = {}
+        self.commands = []
+        self.server: asyncio.AbstractServer = None
+
+    @property
+    def url(self) -> str:
+        """Accessor for the URL of the running server."""
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}"
+
+    async def start(self):
+        """Start listening on a random local port."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self):
+        """Stop the server."""
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _lookup(self, key: bytes):
+        entry = self.data.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            entry = None
+        return entry and entry[0]
+
+    async def _read_command(self, reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    @staticmethod
+    def _bulk(value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _run(self, args) -> bytes:
+        cmd = args[0].upper()
+        self.commands.append(cmd.decode())
+        if cmd in (b"PING", b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if cmd == b"GET":
+            return self._bulk(self._lookup(args[1]))
+        if cmd == b"MGET":
+            return b"*%d\r\n" % (len(args) - 1) + b"".join(
+                self._bulk(self._lookup(key)) for key in args[1:]
+            )
+        if cmd == b"SET":
+            key, value, opts = args[1], args[2], [a.upper() for a in args[3:]]
+            if b"NX" in opts and self._lookup(key) is not None:
+                return b"$-1\r\n"
+            expires = None
+            if b"PX" in opts:
+                expires = time.monotonic() + int(opts[opts.index(b"PX") + 1]) / 1000
+            self.data[key] = (value, expires)
+            return b"+OK\r\n"
+        if cmd == b"DEL":
+            removed = sum(1 for key in args[1:] if self.data.pop(key, None))
+            return b":%d\r\n" % removed
+        if cmd == b"SCAN":
+            pattern = (
+                args[args.index(b"MATCH") + 1].decode() if b"MATCH" in args else "*"
+            )
+            keys = [k for k in self.data if fnmatch.fnmatchcase(k.decode(), pattern)]
+            return b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys) + b"".join(
+                self._bulk(key) for key in keys
+            )
+        return b"-ERR unknown command\r\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                args = await self._read_command(reader)
+                if args is None:
+                    break
+                writer.write(self._run(args))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -2,7 +2,7 @@ import pytest
 
 from asyncio import sleep, wait_for
 
-from ..base import CacheError
+from ..base import BaseCache, CacheError
 from ..in_memory import InMemoryCache
 
 
@@ -166,3 +166,91 @@ class TestBasicCache:
     @pytest.mark.asyncio
     async def test_repr(self, cache):
         assert isinstance(repr(cache), str)
+
+
+class TestBoundedCache:
+    @pytest.mark.asyncio
+    async def test_evict_lru_max_entries(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1  # "b" is now least recently used
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.stats["evictions"] == 1
+        assert cache.stats["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_evict_max_bytes(self):
+        cache = InMemoryCache(max_bytes=2048)
+        for i in range(10):
+            await cache.set(f"key{i}", "x" * 500)
+        assert cache.stats["size"] <= 2048
+        assert cache.stats["evictions"] > 0
+        assert await cache.get("key9") == "x" * 500
+        assert await cache.get("key0") is None
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache):
+        await cache.get("valid key")
+        await cache.get("missing")
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_ttl(self, cache):
+        await cache.set("key", "value", 0.05)
+        await cache.set("key", "value")
+        await sleep(0.05)
+        assert await cache.get("key") == "value"
+        assert cache.stats["expirations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expire_counter(self, cache):
+        await cache.set(["key1", "key2"], "value", 0.01)
+        await sleep(0.02)
+        assert await cache.get("valid key") == "value"
+        assert cache.stats["expirations"] == 2
+        assert not cache._expiry
+
+    @pytest.mark.asyncio
+    async def test_compact_expiry(self, cache):
+        for _ in range(100):
+            await cache.set("key", "value", 10)
+        assert len(cache._expiry) <= 2 * len(cache._cache) + 64
+        assert await cache.get("key") == "value"
+
+
+class TestBatchCache:
+    @pytest.mark.asyncio
+    async def test_get_many(self, cache):
+        await cache.set("key", "other")
+        assert await cache.get_many(["valid key", "missing", "key"]) == [
+            "value",
+            None,
+            "other",
+        ]
+        assert cache.stats["hits"] == 2
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_many(self, cache):
+        await cache.set_many({"a": 1, "b": {"x": 2}}, 0.05)
+        assert await cache.get_many(["a", "b"]) == [1, {"x": 2}]
+        await sleep(0.05)
+        assert await cache.get_many(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_clear_many(self, cache):
+        await cache.set_many({"a": 1, "b": 2})
+        await cache.clear_many(["a", "b", "missing"])
+        assert await cache.get_many(["a", "b", "valid key"]) == [None, None, "value"]
+
+    @pytest.mark.asyncio
+    async def test_base_fallbacks(self, cache):
+        await BaseCache.set_many(cache, {"a": 1, "b": 2})
+        assert await BaseCache.get_many(cache, ["a", "b", "c"]) == [1, 2, None]
+        await BaseCache.clear_many(cache, ["a"])
+        assert await cache.get("a") is None
@@ -0,0 +1,160 @@
+import pytest
+
+from asyncio import gather, sleep, wait_for
+
+from ..base import CacheKeyLock
+from ..redis_cache import RedisCache, RedisCacheError
+from .resp_server import StubRespServer
+
+
+@pytest.fixture()
+async def server():
+    server = StubRespServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(server.url, pool_size=2)
+    await cache.set("valid key", "value")
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    @pytest.mark.asyncio
+    async def test_get_none(self, cache):
+        assert await cache.get("doesn't exist") is None
+
+    @pytest.mark.asyncio
+    async def test_get_valid(self, cache):
+        assert await cache.get("valid key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_set_dict(self, cache, server):
+        await cache.set("key", {"dictkey": "dval"})
+        assert await cache.get("key") == {"dictkey": "dval"}
+        assert server.data[b"acapy::cache::key"][0] == b'{"dictkey":"dval"}'
+
+    @pytest.mark.asyncio
+    async def test_set_multi_pipelined(self, cache, server):
+        server.commands.clear()
+        await cache.set([f"key{i}" for i in range(4)], {"dictkey": "dval"})
+        assert server.commands == ["SET"] * 4
+        for i in range(4):
+            assert await cache.get(f"key{i}") == {"dictkey": "dval"}
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", "value", 0.05)
+        assert await cache.get("key") == "value"
+        await sleep(0.06)
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_clear(self, cache):
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_flush(self, cache, server):
+        server.data[b"other"] = (b"1", None)
+        await cache.flush()
+        assert await cache.get("valid key") is None
+        assert list(server.data) == [b"other"]
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, cache, server):
+        other = RedisCache(server.url)
+        assert await other.get("valid key") == "value"
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_limit(self, cache):
+        await gather(*(cache.set(f"key{i}", i) for i in range(10)))
+        assert cache._open_count <= 2
+        assert await cache.get("key9") == 9
+
+    @pytest.mark.asyncio
+    async def test_near_cache(self, server):
+        cache = RedisCache(server.url, near_ttl=10)
+        await cache.set("key", "value")
+        server.commands.clear()
+        assert await cache.get("key") == "value"
+        assert server.commands == []
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_batch(self, cache, server):
+        server.commands.clear()
+        await cache.set_many({"a": 1, "b": [2]}, 10)
+        assert await cache.get_many(["a", "missing", "b"]) == [1, None, [2]]
+        await cache.clear_many(["a", "b"])
+        assert await cache.get_many(["a", "b"]) == [None, None]
+        assert server.commands == ["SET", "SET", "MGET", "DEL", "MGET"]
+        assert await cache.get_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_near_cache(self, server):
+        cache = RedisCache(server.url, near_ttl=10)
+        await cache.set("a", 1)
+        server.data[b"acapy::cache::b"] = (b"2", None)
+        server.commands.clear()
+        assert await cache.get_many(["a", "b"]) == [1, 2]
+        assert await cache.get_many(["a", "b"]) == [1, 2]
+        assert server.commands == ["MGET"]
+        await cache.clear_many(["a"])
+        assert await cache.get("a") is None
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_server_error(self, cache):
+        with pytest.raises(RedisCacheError):
+            await cache.execute(("BOGUS",))
+        assert await cache.get("valid key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_connect_error(self):
+        cache = RedisCache("redis://127.0.0.1:1")
+        with pytest.raises(RedisCacheError):
+            await cache.get("key")
+        assert cache._open_count == 0
+
+    def test_bad_url(self):
+        with pytest.raises(RedisCacheError):
+            RedisCache("http://localhost")
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_shared_lock(self, cache):
+        assert await cache.acquire_shared("key", 1)
+        assert not await cache.acquire_shared("key", 1)
+        await cache.release_shared("key")
+        assert await cache.acquire_shared("key", 1)
+
+    @pytest.mark.asyncio
+    async def test_single_flight_across_caches(self, cache, server, monkeypatch):
+        monkeypatch.setattr(CacheKeyLock, "SHARED_POLL_INTERVAL", 0.01)
+        other = RedisCache(server.url)
+        produced = []
+
+        async def fetch(c: RedisCache):
+            async with c.acquire("cold", single_flight=True) as entry:
+                if entry.result:
+                    return entry.result
+                await sleep(0.05)
+                produced.append(c)
+                await entry.set_result("computed")
+                return "computed"
+
+        results = await wait_for(gather(fetch(cache), fetch(other)), 2)
+        assert results == ["computed", "computed"]
+        assert len(produced) == 1
+        assert await cache.acquire_shared("cold", 1)  # lock was released
+        await other.close()
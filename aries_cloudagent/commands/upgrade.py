@@ -520,11 +520,11 @@ async def upgrade_per_profile(
                     )
                     all_records.append(_record)
             async with profile.session() as session:
-                for record in all_records:
-                    await record.save(
-                        session,
-                        reason="re-saving record during the upgrade process",
-                    )
+                await rec_type.save_all(
+                    session,
+                    all_records,
+                    reason="re-saving record during the upgrade process",
+                )
                 if len(all_records) == 0:
                     LOGGER.info(f"No records of {str(rec_type)} found")
                 else:
@@ -624,11 +624,11 @@ async def fix_issue_rev_reg_records(profile: Profile):
     """
     async with profile.session() as session:
         issue_rev_reg_records = await find_affected_issue_rev_reg_records(session)
-        for record in issue_rev_reg_records:
-            await record.save(
-                session,
-                reason="re-saving issue_rev_reg record without issuance type",
-            )
+        await IssuerRevRegRecord.save_all(
+            session,
+            issue_rev_reg_records,
+            reason="re-saving issue_rev_reg record without issuance type",
+        )
 
 
 def execute(argv: Sequence[str] = None):
@@ -175,6 +175,46 @@ class AdminGroup(ArgumentGroup):
                 "admin API. If not specified, webhooks are not published by the agent."
             ),
         )
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WEBHOOK_BATCH_SIZE",
+            help=(
+                "Deliver webhooks in batches of up to <count> events per webhook "
+                "URL, posted as a JSON array of topic and payload objects to "
+                "<url>/topic/batch/. By default each webhook is posted separately."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-interval",
+            type=BoundedInt(min=1),
+            metavar="<milliseconds>",
+            env_var="ACAPY_WEBHOOK_BATCH_INTERVAL",
+            help=(
+                "Time to wait for more webhooks before posting a batch that is "
+                "not full. Requires --webhook-batch-size. Default: 100."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-coalesce",
+            action="store_true",
+            env_var="ACAPY_WEBHOOK_BATCH_COALESCE",
+            help=(
+                "Only post the latest of the record webhooks for the same record "
+                "waiting in a batch. Requires --webhook-batch-size."
+            ),
+        )
+        parser.add_argument(
+            "--webhook-batch-concurrency",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WEBHOOK_BATCH_CONCURRENCY",
+            help=(
+                "Maximum number of batches posted to a webhook URL at the same "
+                "time. Requires --webhook-batch-size. Default: 1."
+            ),
+        )
         parser.add_argument(
             "--admin-client-max-request-size",
             default=1,
@@ -213,6 +253,27 @@ class AdminGroup(ArgumentGroup):
             if hook_url:
                 hook_urls.append(hook_url)
             settings["admin.webhook_urls"] = hook_urls
+            if args.webhook_batch_size:
+                settings["admin.webhook_batch_size"] = args.webhook_batch_size
+                if args.webhook_batch_interval:
+                    settings[
+                        "admin.webhook_batch_interval"
+                    ] = args.webhook_batch_interval
+                if args.webhook_batch_coalesce:
+                    settings["admin.webhook_batch_coalesce"] = True
+                if args.webhook_batch_concurrency:
+                    settings[
+                        "admin.webhook_batch_concurrency"
+                    ] = args.webhook_batch_concurrency
+            elif (
+                args.webhook_batch_interval
+                or args.webhook_batch_coalesce
+                or args.webhook_batch_concurrency
+            ):
+                raise ArgsParseError(
+                    "--webhook-batch-interval, --webhook-batch-coalesce and "
+                    "--webhook-batch-concurrency require --webhook-batch-size"
+                )
 
             settings["admin.admin_client_max_request_size"] = (
                 args.admin_client_max_request_size or 1
@@ -658,6 +719,92 @@ class GeneralGroup(ArgumentGroup):
             env_var="ACAPY_UNIVERSAL_RESOLVER_BEARER_TOKEN",
             help="Bearer token if universal resolver instance requires authentication.",
         ),
+        parser.add_argument(
+            "--cache-backend",
+            type=str,
+            choices=["memory", "redis"],
+            metavar="<cache-backend>",
+            env_var="ACAPY_CACHE_BACKEND",
+            help=(
+                "Specifies the cache backend. 'memory' keeps a cache local to "
+                "this agent process; 'redis' shares the cache between agent "
+                "instances using a Redis-compatible server given by --cache-url. "
+                "Default: 'memory'."
+            ),
+        )
+        parser.add_argument(
+            "--cache-url",
+            type=str,
+            metavar="<cache-url>",
+            env_var="ACAPY_CACHE_URL",
+            help=(
+                "URL of the shared cache server, in the form "
+                "'redis://[[user]:password@]host[:port][/db]'."
+            ),
+        )
+        parser.add_argument(
+            "--cache-near-ttl",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_CACHE_NEAR_TTL",
+            help=(
+                "With a shared cache backend, also keep values in process for up "
+                "to <seconds> to avoid network round-trips for hot keys. "
+                "Default: disabled."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help=(
+                "Maximum number of entries retained by the in-memory cache. "
+                "Least recently used entries are evicted when the limit is "
+                "reached. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-size",
+            type=ByteSize(min=1024),
+            metavar="<cache-size>",
+            env_var="ACAPY_CACHE_MAX_SIZE",
+            help=(
+                "Approximate maximum size in bytes of the values retained by the "
+                "in-memory cache, e.g. '64M'. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--dispatcher-max-active",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_DISPATCHER_MAX_ACTIVE",
+            help=(
+                "Maximum number of inbound message handlers run concurrently. "
+                "With --dispatcher-adaptive this is the initial limit. "
+                "Default: 50."
+            ),
+        )
+        parser.add_argument(
+            "--dispatcher-adaptive",
+            action="store_true",
+            env_var="ACAPY_DISPATCHER_ADAPTIVE",
+            help=(
+                "Adjust the number of concurrent inbound message handlers "
+                "according to observed handler latency, increasing it while "
+                "messages are waiting and reducing it when latency rises."
+            ),
+        )
+        parser.add_argument(
+            "--dispatcher-max-active-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_DISPATCHER_MAX_ACTIVE_LIMIT",
+            help=(
+                "Upper bound on the number of concurrent inbound message handlers "
+                "when --dispatcher-adaptive is enabled. Default: 500."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -718,6 +865,30 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_bearer_token:
             settings["resolver.universal.token"] = args.universal_resolver_bearer_token
 
+        if args.cache_backend == "redis" and not args.cache_url:
+            raise ArgsParseError("--cache-url is required for the redis cache backend")
+        if args.cache_backend:
+            settings["cache.backend"] = args.cache_backend
+        if args.cache_url:
+            settings["cache.url"] = args.cache_url
+        if args.cache_near_ttl:
+            settings["cache.near_ttl"] = args.cache_near_ttl
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_max_size:
+            settings["cache.max_size"] = args.cache_max_size
+
+        if args.dispatcher_max_active:
+            settings["dispatcher.max_active"] = args.dispatcher_max_active
+        if args.dispatcher_adaptive:
+            settings["dispatcher.adaptive"] = True
+        if args.dispatcher_max_active_limit:
+            if not args.dispatcher_adaptive:
+                raise ArgsParseError(
+                    "--dispatcher-max-active-limit requires --dispatcher-adaptive"
+                )
+            settings["dispatcher.max_active_limit"] = args.dispatcher_max_active_limit
+
         return settings
 
 
@@ -1416,6 +1587,112 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--persistent-queue",
+            action="store_true",
+            env_var="ACAPY_PERSISTENT_QUEUE",
+            help=(
+                "Record queued outbound messages, webhooks and undelivered "
+                "messages in the wallet, so that they are delivered after a "
+                "restart. Outbound messages are encoded before being queued."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-backoff",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_RETRY_BACKOFF",
+            help=(
+                "Delay before the first retry of an undelivered outbound message. "
+                "The delay doubles for each further retry, with random jitter. "
+                "Default: 10 seconds."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-backoff-max",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_RETRY_BACKOFF_MAX",
+            help=(
+                "Maximum delay between retries of an undelivered outbound "
+                "message. Default: 600 seconds."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-circuit-failures",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_CIRCUIT_FAILURES",
+            help=(
+                "Number of consecutive failed deliveries after which outbound "
+                "messages to an endpoint are held back until it is probed again, "
+                "or 0 to always attempt delivery. Default: 5."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-circuit-reset",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_CIRCUIT_RESET",
+            help=(
+                "Time to hold back outbound messages to a failing endpoint before "
+                "probing it with another delivery. The time doubles while probes "
+                "fail, up to the maximum retry backoff. Default: 30 seconds."
+            ),
+        )
+        parser.add_argument(
+            "--http-pool-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_HTTP_POOL_LIMIT",
+            help=(
+                "Maximum number of simultaneous connections opened by the HTTP "
+                "outbound transport. Default: 200."
+            ),
+        )
+        parser.add_argument(
+            "--http-pool-limit-per-host",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_HTTP_POOL_LIMIT_PER_HOST",
+            help=(
+                "Maximum number of simultaneous connections opened by the HTTP "
+                "outbound transport to a single endpoint host. Default: 50."
+            ),
+        )
+        parser.add_argument(
+            "--http-keepalive-timeout",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_HTTP_KEEPALIVE_TIMEOUT",
+            help=(
+                "Time to keep idle HTTP outbound connections open for reuse. "
+                "Default: 15 seconds."
+            ),
+        )
+        parser.add_argument(
+            "--http-dns-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_HTTP_DNS_CACHE_TTL",
+            help=(
+                "Time to cache the resolved addresses of HTTP outbound endpoint "
+                "hosts, or 0 to resolve them for every new connection. "
+                "Default: 10 seconds."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_WORKERS",
+            help=(
+                "Number of worker threads encrypting and decrypting DIDComm "
+                "envelopes, allowing a single agent to use several cores for "
+                "message packing. By default, unpacking runs on the event loop "
+                "and packing on the shared executor."
+            ),
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1438,6 +1715,41 @@ class TransportGroup(ArgumentGroup):
                 "after <interval> seconds without a heartbeat ping."
             ),
         )
+        parser.add_argument(
+            "--ws-max-pending",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WS_MAX_PENDING",
+            help=(
+                "When using Websocket Inbound Transport, stop reading from a "
+                "connection while <count> of its messages are being processed. "
+                "A connection left blocked for longer than the heartbeat timeout "
+                "is closed. By default, messages are read as they arrive."
+            ),
+        )
+        parser.add_argument(
+            "--ws-undelivered-batch",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WS_UNDELIVERED_BATCH",
+            help=(
+                "When using Websocket Inbound Transport with the undelivered "
+                "queue, return up to <count> further queued messages to a client "
+                "requesting return_route all after each message it sends, "
+                "instead of one per message."
+            ),
+        )
+        parser.add_argument(
+            "--ws-outbound-sockets",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WS_OUTBOUND_SOCKETS",
+            help=(
+                "Keep up to <count> Websocket outbound connections open for "
+                "reuse, one per endpoint, closing them after a minute unused. "
+                "By default, a connection is opened for every message."
+            ),
+        )
 
     def get_settings(self, args: Namespace):
         """Extract transport settings."""
@@ -1460,10 +1772,42 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.persistent_queue:
+            settings["transport.persistent_queue"] = True
+        if args.outbound_retry_backoff:
+            settings["transport.outbound_retry_backoff"] = args.outbound_retry_backoff
+        if args.outbound_retry_backoff_max:
+            settings[
+                "transport.outbound_retry_backoff_max"
+            ] = args.outbound_retry_backoff_max
+        if args.outbound_circuit_failures is not None:
+            settings[
+                "transport.circuit_failure_threshold"
+            ] = args.outbound_circuit_failures
+        if args.outbound_circuit_reset:
+            settings["transport.circuit_reset_timeout"] = args.outbound_circuit_reset
+        if args.http_pool_limit:
+            settings["transport.http.pool_limit"] = args.http_pool_limit
+        if args.http_pool_limit_per_host:
+            settings[
+                "transport.http.pool_limit_per_host"
+            ] = args.http_pool_limit_per_host
+        if args.http_keepalive_timeout:
+            settings["transport.http.keepalive_timeout"] = args.http_keepalive_timeout
+        if args.http_dns_cache_ttl is not None:
+            settings["transport.http.dns_cache_ttl"] = args.http_dns_cache_ttl
+        if args.crypto_workers:
+            settings["transport.crypto_workers"] = args.crypto_workers
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
             settings["transport.ws.timeout_interval"] = args.ws_timeout_interval
+        if args.ws_max_pending:
+            settings["transport.ws.max_pending"] = args.ws_max_pending
+        if args.ws_undelivered_batch:
+            settings["transport.ws.undelivered_batch"] = args.ws_undelivered_batch
+        if args.ws_outbound_sockets:
+            settings["transport.ws.outbound_sockets"] = args.ws_outbound_sockets
 
         return settings
 
@@ -1807,8 +2151,11 @@ class MultitenantGroup(ArgumentGroup):
                 "Specify multitenancy configuration in key=value pairs. "
                 'For example: "wallet_type=askar-profile wallet_name=askar-profile-name" '
                 "Possible values: wallet_name, wallet_key, cache_size, "
-                'key_derivation_method. "wallet_name" is only used when '
-                '"wallet_type" is "askar-profile"'
+                'key_derivation_method, auth_cache_size, auth_cache_ttl. "wallet_name" '
+                'is only used when "wallet_type" is "askar-profile". '
+                '"auth_cache_size" and "auth_cache_ttl" (seconds) bound the caches of '
+                "verified tokens and wallet records used by tenant admin requests, "
+                "0 disabling them. Default: 1000 entries kept for 10 seconds."
             ),
         )
         parser.add_argument(
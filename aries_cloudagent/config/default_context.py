@@ -2,6 +2,7 @@
 
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.redis_cache import RedisCache
 from ..core.event_bus import EventBus
 from ..core.goal_code_registry import GoalCodeRegistry
 from ..core.plugin_registry import PluginRegistry
@@ -15,6 +16,7 @@ from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..resolver.did_resolver import DIDResolver
 from ..tails.base import BaseTailsServer
 from ..transport.wire_format import BaseWireFormat
+from ..utils.crypto_pool import CryptoPool
 from ..utils.dependencies import is_indy_sdk_module_installed
 from ..utils.stats import Collector
 from ..wallet.default_verification_key_strategy import (
@@ -41,8 +43,24 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache
+        if context.settings.get("cache.backend") == "redis":
+            cache = RedisCache(
+                context.settings["cache.url"],
+                near_ttl=context.settings.get("cache.near_ttl"),
+            )
+        else:
+            cache = InMemoryCache(
+                max_entries=context.settings.get("cache.max_entries"),
+                max_bytes=context.settings.get("cache.max_size"),
+            )
+        context.injector.bind_instance(BaseCache, cache)
+
+        # Worker threads for envelope encryption and decryption
+        if context.settings.get("transport.crypto_workers"):
+            context.injector.bind_instance(
+                CryptoPool, CryptoPool(context.settings["transport.crypto_workers"])
+            )
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -41,6 +41,31 @@ class TestArgParse(AsyncTestCase):
                 "http",
                 "--max-outbound-retry",
                 "5",
+                "--persistent-queue",
+                "--outbound-retry-backoff",
+                "2",
+                "--outbound-retry-backoff-max",
+                "60",
+                "--outbound-circuit-failures",
+                "3",
+                "--outbound-circuit-reset",
+                "20",
+                "--http-pool-limit",
+                "400",
+                "--http-pool-limit-per-host",
+                "100",
+                "--http-keepalive-timeout",
+                "60",
+                "--http-dns-cache-ttl",
+                "0",
+                "--crypto-workers",
+                "4",
+                "--ws-max-pending",
+                "8",
+                "--ws-undelivered-batch",
+                "10",
+                "--ws-outbound-sockets",
+                "1000",
             ]
         )
 
@@ -52,6 +77,19 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
+        assert settings.get("transport.persistent_queue") is True
+        assert settings.get("transport.outbound_retry_backoff") == 2
+        assert settings.get("transport.outbound_retry_backoff_max") == 60
+        assert settings.get("transport.circuit_failure_threshold") == 3
+        assert settings.get("transport.circuit_reset_timeout") == 20
+        assert settings.get("transport.http.pool_limit") == 400
+        assert settings.get("transport.http.pool_limit_per_host") == 100
+        assert settings.get("transport.http.keepalive_timeout") == 60
+        assert settings.get("transport.http.dns_cache_ttl") == 0
+        assert settings.get("transport.crypto_workers") == 4
+        assert settings.get("transport.ws.max_pending") == 8
+        assert settings.get("transport.ws.undelivered_batch") == 10
+        assert settings.get("transport.ws.outbound_sockets") == 1000
 
     async def test_get_genesis_transactions_list_with_ledger_selection(self):
         """Test multiple ledger support related argument parsing."""
@@ -295,6 +333,103 @@ class TestArgParse(AsyncTestCase):
             "methods": ["sov", "btcr"]
         }
 
+    async def test_cache_settings(self):
+        """Test cache argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--cache-backend",
+                "redis",
+                "--cache-url",
+                "redis://localhost:6379/1",
+                "--cache-near-ttl",
+                "5",
+                "--cache-max-entries",
+                "1000",
+                "--cache-max-size",
+                "64M",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["cache.backend"] == "redis"
+        assert settings["cache.url"] == "redis://localhost:6379/1"
+        assert settings["cache.near_ttl"] == 5
+        assert settings["cache.max_entries"] == 1000
+        assert settings["cache.max_size"] == 64 << 20
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--cache-backend", "redis"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_dispatcher_settings(self):
+        """Test dispatcher concurrency argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--dispatcher-max-active",
+                "20",
+                "--dispatcher-adaptive",
+                "--dispatcher-max-active-limit",
+                "100",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["dispatcher.max_active"] == 20
+        assert settings["dispatcher.adaptive"] is True
+        assert settings["dispatcher.max_active_limit"] == 100
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--dispatcher-max-active-limit", "100"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_webhook_batch_settings(self):
+        """Test webhook batching argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.AdminGroup()
+        group.add_arguments(parser)
+
+        args = ["--admin", "0.0.0.0", "8031", "--admin-insecure-mode"]
+        result = parser.parse_args(
+            args
+            + [
+                "--webhook-url",
+                "http://localhost:8022/webhooks",
+                "--webhook-batch-size",
+                "50",
+                "--webhook-batch-interval",
+                "250",
+                "--webhook-batch-coalesce",
+                "--webhook-batch-concurrency",
+                "2",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings["admin.webhook_batch_size"] == 50
+        assert settings["admin.webhook_batch_interval"] == 250
+        assert settings["admin.webhook_batch_coalesce"] is True
+        assert settings["admin.webhook_batch_concurrency"] == 2
+
+        result = parser.parse_args(args + ["--webhook-batch-coalesce"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
     async def test_transport_settings_file(self):
         """Test file argument parsing."""
 
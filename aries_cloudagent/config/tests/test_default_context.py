@@ -6,6 +6,7 @@ from ...cache.base import BaseCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
 from ...transport.wire_format import BaseWireFormat
+from ...utils.crypto_pool import CryptoPool
 
 from ..default_context import DefaultContextBuilder
 from ..injection_context import InjectionContext
@@ -32,7 +33,11 @@ class TestDefaultContext(AsyncTestCase):
                 "timing.enabled": True,
                 "timing.log.file": NamedTemporaryFile().name,
                 "multitenant.admin_enabled": True,
+                "transport.crypto_workers": 2,
             }
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+        crypto_pool = result.inject(CryptoPool)
+        assert crypto_pool.max_workers == 2
+        crypto_pool.shutdown()
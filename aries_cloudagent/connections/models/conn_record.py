@@ -509,9 +509,14 @@ class ConnRecord(BaseRecord):
         """
         await super().post_save(session, *args, **kwargs)
 
-        # clear cache key set by connection manager
-        cache_key = f"connection_target::{self.connection_id}"
-        await self.clear_cached_key(session, cache_key)
+        # clear cache keys set by connection manager and responder
+        await self.clear_cached_keys(
+            session,
+            [
+                f"connection_target::{self.connection_id}",
+                f"conn_rec_state::{self.connection_id}",
+            ],
+        )
 
     async def delete_record(self, session: ProfileSession):
         """Perform connection record deletion actions.
@@ -17,6 +17,8 @@ from qrcode import QRCode
 
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..askar.didcomm.key_cache import key_cache_stats
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import (
@@ -60,6 +62,7 @@ from ..protocols.coordinate_mediation.v1_0.route_manager_provider import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import HSProto, InvitationMessage
+from ..protocols.routing.v1_0.route_index import RouteIndex
 from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
 from ..transport.inbound.manager import InboundTransportManager
@@ -70,11 +73,13 @@ from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
+from ..utils.crypto_pool import CryptoPool
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
+from .event_bus import EventBus
 from .oob_processor import OobMessageProcessor
 from .util import SHUTDOWN_EVENT_TOPIC, STARTUP_EVENT_TOPIC
 
@@ -194,6 +199,9 @@ class Conductor:
             self.root_profile, self.handle_not_delivered
         )
         await self.outbound_transport_manager.setup()
+        context.injector.bind_instance(
+            OutboundTransportManager, self.outbound_transport_manager
+        )
 
         # Initialize dispatcher
         self.dispatcher = Dispatcher(self.root_profile)
@@ -209,6 +217,15 @@ class Conductor:
                 BaseMultitenantManager, MultitenantManagerProvider(self.root_profile)
             )
 
+        # Index the routes to subwallets and mediation clients for relaying
+        if context.settings.get("multitenant.enabled") or context.settings.get(
+            "mediation.open"
+        ):
+            route_index = RouteIndex()
+            route_index.subscribe(context.inject(EventBus))
+            await route_index.load(self.root_profile)
+            context.injector.bind_instance(RouteIndex, route_index)
+
         # Bind route manager provider
         context.injector.bind_provider(
             RouteManager, RouteManagerProvider(self.root_profile)
@@ -285,6 +302,10 @@ class Conductor:
         except Exception:
             LOGGER.exception("Unable to start outbound transports")
             raise
+        try:
+            await self.outbound_transport_manager.replay()
+        except Exception:
+            LOGGER.exception("Unable to restore queued outbound messages")
 
         # Start up Admin server
         if self.admin_server:
@@ -535,8 +556,16 @@ class Conductor:
 
             shutdown.run(self.root_profile.close())
 
+        cache = self.context.inject_or(BaseCache)
+        if cache:
+            shutdown.run(cache.close())
+
         await shutdown.complete(timeout)
 
+        crypto_pool = self.context.inject_or(CryptoPool)
+        if crypto_pool:
+            crypto_pool.shutdown(wait=False)
+
     def inbound_message_router(
         self,
         profile: Profile,
@@ -608,7 +637,17 @@ class Conductor:
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
+            "task_max_active": self.dispatcher.task_queue.max_active,
         }
+        limiter = self.dispatcher.task_queue.limiter
+        if limiter:
+            stats["task_latency"] = limiter.latency
+            stats["task_queue_wait"] = limiter.queue_wait
+        if self.root_profile and self.root_profile.BACKEND_NAME == "askar":
+            stats["didcomm_key_cache"] = key_cache_stats()
+        route_index = self.root_profile and self.root_profile.inject_or(RouteIndex)
+        if route_index is not None:
+            stats["route_index"] = route_index.stats
         for m in self.outbound_transport_manager.outbound_buffer:
             if m.state == QueuedOutboundMessage.STATE_ENCODE:
                 stats["out_encode"] += 1
@@ -24,18 +24,31 @@ from ..messaging.models.base import BaseModelError
 from ..messaging.request_context import RequestContext
 from ..messaging.responder import BaseResponder, SKIP_ACTIVE_CONN_CHECK_MSG_TYPES
 from ..messaging.util import datetime_now
+from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.problem_report.v1_0.message import ProblemReport
+from ..protocols.routing.v1_0.message_types import FORWARD
+from ..protocols.routing.v1_0.messages.forward import Forward
+from ..protocols.trustping.v1_0.message_types import PING, PING_RESPONSE
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..utils.stats import Collector
-from ..utils.task_queue import CompletedTask, PendingTask, TaskQueue
+from ..utils.task_queue import (
+    AdaptiveLimit,
+    CompletedTask,
+    PendingTask,
+    TaskPriority,
+    TaskQueue,
+)
 from ..utils.tracing import get_timer, trace_event
 from .error import ProtocolMinorVersionNotSupported
 from .protocol_registry import ProtocolRegistry
 from .util import get_version_from_message_type, validate_get_response_version
 
 
+HIGH_PRIORITY_MSG_TYPES = {FORWARD, PING, PING_RESPONSE}
+
+
 class ProblemReportParseError(MessageParseError):
     """Error to raise on failure to parse problem-report message."""
 
@@ -60,16 +73,34 @@ class Dispatcher:
     async def setup(self):
         """Perform async instance setup."""
         self.collector = self.profile.inject_or(Collector)
-        max_active = int(os.getenv("DISPATCHER_MAX_ACTIVE", 50))
+        settings = self.profile.settings
+        max_active = settings.get_int("dispatcher.max_active") or int(
+            os.getenv("DISPATCHER_MAX_ACTIVE", 50)
+        )
+        limiter = None
+        if settings.get_bool("dispatcher.adaptive"):
+            maximum = settings.get_int("dispatcher.max_active_limit") or 500
+            limiter = AdaptiveLimit(max_active, maximum=max(maximum, max_active))
         self.task_queue = TaskQueue(
-            max_active=max_active, timed=bool(self.collector), trace_fn=self.log_task
+            max_active=max_active,
+            timed=bool(self.collector),
+            trace_fn=self.log_task,
+            limiter=limiter,
         )
 
     def put_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        *,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        group: str = None,
     ) -> PendingTask:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.put(coro, complete, ident)
+        return self.task_queue.put(
+            coro, complete, ident, priority=priority, group=group
+        )
 
     def run_task(
         self, coro: Coroutine, complete: Callable = None, ident: str = None
@@ -87,9 +118,12 @@ class Dispatcher:
         if self.collector:
             timing = task.timing
             if "queued" in timing:
-                self.collector.log(
-                    "Dispatcher:queued", timing["unqueued"] - timing["queued"]
-                )
+                queued = timing["unqueued"] - timing["queued"]
+                self.collector.log("Dispatcher:queued", queued)
+                if isinstance(task.priority, TaskPriority):
+                    self.collector.log(
+                        f"Dispatcher:queued:{task.priority.name.lower()}", queued
+                    )
             if task.ident:
                 self.collector.log(task.ident, timing["ended"] - timing["started"])
 
@@ -115,8 +149,23 @@ class Dispatcher:
         return self.put_task(
             self.handle_message(profile, inbound_message, send_outbound),
             complete,
+            priority=self.message_priority(inbound_message),
+            group=profile.settings.get("wallet.id"),
         )
 
+    def message_priority(self, inbound_message: InboundMessage) -> TaskPriority:
+        """Determine the task queue priority class of an inbound message.
+
+        Forward messages and trust pings are cheap to handle and latency
+        sensitive, so they are not held up behind other protocol handlers.
+        """
+        payload = inbound_message.payload
+        if isinstance(payload, dict):
+            msg_type = DIDCommPrefix.unqualify(payload.get("@type"))
+            if msg_type in HIGH_PRIORITY_MSG_TYPES:
+                return TaskPriority.HIGH
+        return TaskPriority.NORMAL
+
     async def handle_message(
         self,
         profile: Profile,
@@ -229,6 +278,10 @@ class Dispatcher:
                 connection = await ConnRecord.retrieve_by_id(
                     session, inbound_message.connection_id
                 )
+        elif isinstance(message, Forward) and not inbound_message.receipt.sender_verkey:
+            # anonymous forward messages are relayed to the recipient whatever
+            # connection they were received on, so skip looking it up
+            connection = None
         else:
             connection_mgr = BaseConnectionManager(profile)
             connection = await connection_mgr.find_inbound_connection(
@@ -6,7 +6,7 @@ from weakref import ref
 
 from ...config.injection_context import InjectionContext
 from ...config.provider import ClassProvider
-from ...storage.base import BaseStorage
+from ...storage.base import BaseStorage, BaseStorageSearch
 from ...storage.vc_holder.base import VCHolder
 from ...utils.classloader import DeferLoad
 from ...wallet.base import BaseWallet
@@ -14,6 +14,7 @@ from ...wallet.base import BaseWallet
 from ..profile import Profile, ProfileManager, ProfileSession
 
 STORAGE_CLASS = DeferLoad("aries_cloudagent.storage.in_memory.InMemoryStorage")
+STORAGE_INDEX_CLASS = DeferLoad("aries_cloudagent.storage.in_memory.InMemoryTagIndex")
 WALLET_CLASS = DeferLoad("aries_cloudagent.wallet.in_memory.InMemoryWallet")
 
 
@@ -28,18 +29,26 @@ class InMemoryProfile(Profile):
 
     def __init__(self, *, context: InjectionContext = None, name: str = None):
         """Create a new InMemoryProfile instance."""
-        global STORAGE_CLASS, WALLET_CLASS
+        global STORAGE_CLASS, STORAGE_INDEX_CLASS, WALLET_CLASS
         super().__init__(context=context, name=name, created=True)
         self.keys = {}
         self.local_dids = {}
         self.pair_dids = {}
         self.records = OrderedDict()
+        self.record_index = STORAGE_INDEX_CLASS()
         self.bind_providers()
 
     def bind_providers(self):
         """Initialize the profile-level instance providers."""
         injector = self._context.injector
 
+        injector.bind_provider(
+            BaseStorageSearch,
+            ClassProvider(
+                "aries_cloudagent.storage.in_memory.InMemoryStorage", ref(self)
+            ),
+        )
+
         injector.bind_provider(
             VCHolder,
             ClassProvider(
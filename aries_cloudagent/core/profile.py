@@ -163,6 +163,7 @@ class ProfileSession(ABC):
         self._entered = 0
         self._context = (context or profile.context).start_scope("session", settings)
         self._profile = profile
+        self._committed_events = []
 
     async def _setup(self):
         """Create the underlying session or transaction."""
@@ -197,6 +198,7 @@ class ProfileSession(ABC):
         """Async context manager exit."""
         self._entered -= 1
         if not self._awaited and not self._entered:
+            self._committed_events = []
             await self._teardown()
             self._active = False
 
@@ -232,8 +234,11 @@ class ProfileSession(ABC):
         """
         if not self._active:
             raise ProfileSessionInactiveError()
+        events, self._committed_events = self._committed_events, []
         await self._teardown(commit=True)
         self._active = False
+        for topic, payload in events:
+            await self._profile.notify(topic, payload)
 
     async def rollback(self):
         """Roll back any updates performed within the transaction.
@@ -242,9 +247,21 @@ class ProfileSession(ABC):
         """
         if not self._active:
             raise ProfileSessionInactiveError()
+        self._committed_events = []
         await self._teardown(commit=False)
         self._active = False
 
+    async def notify_committed(self, topic: str, payload: Any):
+        """Signal an event once the updates performed in the session are stored.
+
+        Within a transaction the event is held until the transaction is
+        committed, and dropped if it is rolled back.
+        """
+        if self.is_transaction:
+            self._committed_events.append((topic, payload))
+        else:
+            await self._profile.notify(topic, payload)
+
     def inject(
         self,
         base_cls: Type[InjectType],
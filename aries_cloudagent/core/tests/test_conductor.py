@@ -480,6 +480,7 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                     "task_done",
                     "task_failed",
                     "task_pending",
+                    "task_max_active",
                 ]
             )
 
@@ -1268,6 +1269,28 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
                 test_topic, test_payload, test_endpoint, test_attempts, None
             )
 
+    async def test_setup_route_index_open_mediation(self):
+        for settings, indexed in (
+            (self.test_settings, False),
+            ({**self.test_settings, "mediation.open": True}, True),
+        ):
+            builder: ContextBuilder = StubContextBuilder(settings)
+            conductor = test_module.Conductor(builder)
+
+            with async_mock.patch.object(
+                test_module, "InboundTransportManager", autospec=True
+            ), async_mock.patch.object(
+                test_module, "OutboundTransportManager", autospec=True
+            ) as mock_outbound_mgr, async_mock.patch.object(
+                test_module, "LoggingConfigurator", autospec=True
+            ):
+                mock_outbound_mgr.return_value.registered_transports = {
+                    "test": async_mock.MagicMock(schemes=["http"])
+                }
+                await conductor.setup()
+                route_index = conductor.context.inject_or(test_module.RouteIndex)
+                assert (route_index is not None) == indexed
+
     async def test_shutdown_multitenant_profiles(self):
         builder: ContextBuilder = StubContextBuilder(
             {**self.test_settings, "multitenant.enabled": True}
@@ -1287,6 +1310,7 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             await conductor.setup()
             multitenant_mgr = conductor.context.inject(BaseMultitenantManager)
             assert isinstance(multitenant_mgr, MultitenantManager)
+            assert conductor.context.inject_or(test_module.RouteIndex) is not None
 
             multitenant_mgr._profiles.put(
                 "test1",
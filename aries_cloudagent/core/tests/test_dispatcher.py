@@ -22,10 +22,15 @@ from ...protocols.issue_credential.v2_0.messages.cred_problem_report import (
 )
 from ...protocols.problem_report.v1_0.message import ProblemReport
 from ...protocols.coordinate_mediation.v1_0.route_manager import RouteManager
+from ...protocols.routing.v1_0.handlers.forward_handler import ForwardHandler
+from ...protocols.routing.v1_0.message_types import FORWARD
+from ...protocols.routing.v1_0.messages.forward import Forward
+from ...protocols.trustping.v1_0.message_types import PING
 from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
 from ...transport.outbound.message import OutboundMessage
 from ...utils.stats import Collector
+from ...utils.task_queue import CompletedTask, TaskPriority
 
 from .. import dispatcher as test_module
 
@@ -93,6 +98,21 @@ class StubV1_2AgentMessageHandler:
 
 
 class TestDispatcher(IsolatedAsyncioTestCase):
+    async def test_setup_adaptive(self):
+        profile = make_profile()
+        profile.settings["dispatcher.max_active"] = 20
+        profile.settings["dispatcher.adaptive"] = True
+        profile.settings["dispatcher.max_active_limit"] = 100
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        assert dispatcher.task_queue.max_active == 20
+        assert dispatcher.task_queue.limiter.maximum == 100
+
+        dispatcher = test_module.Dispatcher(make_profile())
+        await dispatcher.setup()
+        assert dispatcher.task_queue.max_active == 50
+        assert not dispatcher.task_queue.limiter
+
     async def test_dispatch(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
@@ -137,6 +157,41 @@ class TestDispatcher(IsolatedAsyncioTestCase):
                 handler_mock.call_args[0][2], test_module.DispatcherResponder
             )
 
+    async def test_dispatch_anonymous_forward(self):
+        profile = make_profile()
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(
+            {pfx.qualify(FORWARD): Forward for pfx in DIDCommPrefix}
+        )
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        rcv = Receiver()
+        message = Forward(to="sample-did", msg={"msg": "sample-message"}).serialize()
+
+        with async_mock.patch.object(
+            ForwardHandler, "handle", autospec=True
+        ) as handler_mock, async_mock.patch.object(
+            test_module, "BaseConnectionManager", autospec=True
+        ) as conn_mgr_mock:
+            conn_mgr_mock.return_value = async_mock.MagicMock(
+                find_inbound_connection=async_mock.AsyncMock(
+                    return_value=async_mock.MagicMock(connection_id="dummy")
+                )
+            )
+            await dispatcher.handle_message(
+                dispatcher.profile, make_inbound(message), rcv.send
+            )
+            handler_mock.assert_awaited_once()
+            context = handler_mock.call_args[0][1]
+            assert isinstance(context.message, Forward)
+            assert context.connection_record is None
+            conn_mgr_mock.return_value.find_inbound_connection.assert_not_called()
+
+            inbound = make_inbound(message)
+            inbound.receipt.sender_verkey = "sender-verkey"
+            await dispatcher.handle_message(dispatcher.profile, inbound, rcv.send)
+            conn_mgr_mock.return_value.find_inbound_connection.assert_awaited_once()
+
     async def test_dispatch_versioned_message(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
@@ -409,6 +464,58 @@ class TestDispatcher(IsolatedAsyncioTestCase):
         )
         dispatcher.log_task(mock_task)
 
+    async def test_message_priority(self):
+        profile = make_profile()
+        profile.settings["wallet.id"] = "wallet-1"
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+
+        for msg_type, priority in (
+            (DIDCommPrefix.NEW.qualify(FORWARD), TaskPriority.HIGH),
+            (DIDCommPrefix.OLD.qualify(PING), TaskPriority.HIGH),
+            (StubAgentMessage.Meta.message_type, TaskPriority.NORMAL),
+        ):
+            assert (
+                dispatcher.message_priority(make_inbound({"@type": msg_type}))
+                == priority
+            )
+        assert dispatcher.message_priority(make_inbound("{}")) == TaskPriority.NORMAL
+
+        with async_mock.patch.object(
+            dispatcher.task_queue, "put", autospec=True
+        ) as mock_put:
+            dispatcher.queue_message(
+                profile,
+                make_inbound({"@type": DIDCommPrefix.NEW.qualify(FORWARD)}),
+                async_mock.MagicMock(),
+            )
+            mock_put.call_args[0][0].close()
+            assert mock_put.call_args[1] == {
+                "priority": TaskPriority.HIGH,
+                "group": "wallet-1",
+            }
+
+    async def test_log_task_priority(self):
+        profile = make_profile()
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+
+        with async_mock.patch.object(
+            dispatcher.collector, "log", autospec=True
+        ) as mock_log:
+            dispatcher.log_task(
+                CompletedTask(
+                    None,
+                    None,
+                    "abc",
+                    {"queued": 1.0, "unqueued": 3.0, "started": 3.0, "ended": 4.0},
+                    TaskPriority.HIGH,
+                )
+            )
+            mock_log.assert_any_call("Dispatcher:queued", 2.0)
+            mock_log.assert_any_call("Dispatcher:queued:high", 2.0)
+            mock_log.assert_any_call("abc", 1.0)
+
     async def test_create_send_outbound(self):
         profile = make_profile()
         context = RequestContext(
@@ -1,4 +1,5 @@
 from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
 
 from ...config.base import InjectionError
 from ...config.injection_context import InjectionContext
@@ -54,6 +55,35 @@ class TestProfileSession(AsyncTestCase):
 
         await session2.rollback()
 
+    async def test_notify_committed(self):
+        profile = MockProfile()
+        profile.notify = async_mock.CoroutineMock()
+
+        async with ProfileSession(profile) as session:
+            await session.notify_committed("topic", {"id": 1})
+        profile.notify.assert_awaited_once_with("topic", {"id": 1})
+        profile.notify.reset_mock()
+
+        with async_mock.patch.object(
+            ProfileSession,
+            "is_transaction",
+            async_mock.PropertyMock(return_value=True),
+        ):
+            txn = await ProfileSession(profile)
+            await txn.notify_committed("topic", {"id": 2})
+            profile.notify.assert_not_called()
+            await txn.commit()
+            profile.notify.assert_awaited_once_with("topic", {"id": 2})
+            profile.notify.reset_mock()
+
+            txn = await ProfileSession(profile)
+            await txn.notify_committed("topic", {"id": 3})
+            await txn.rollback()
+
+            async with ProfileSession(profile) as txn:
+                await txn.notify_committed("topic", {"id": 4})
+        profile.notify.assert_not_called()
+
 
 class TestProfileManagerProvider(AsyncTestCase):
     async def test_basic_wallet_type(self):
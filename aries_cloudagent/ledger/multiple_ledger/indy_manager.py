@@ -159,8 +159,10 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
         """Lookup given DID in configured ledgers in parallel."""
         self.cache = self.profile.inject_or(BaseCache)
         cache_key = f"did_ledger_id_resolver::{did}"
-        if bool(cache_did and self.cache and await self.cache.get(cache_key)):
-            cached_ledger_id = await self.cache.get(cache_key)
+        cached_ledger_id = (
+            await self.cache.get(cache_key) if cache_did and self.cache else None
+        )
+        if cached_ledger_id:
             if cached_ledger_id in self.production_ledgers:
                 return (cached_ledger_id, self.production_ledgers.get(cached_ledger_id))
             elif cached_ledger_id in self.non_production_ledgers:
@@ -5,14 +5,30 @@ import logging
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
 from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME_EXAMPLE, INDY_ISO8601_DATETIME_VALIDATE
@@ -211,6 +227,24 @@ class BaseRecord(BaseModel):
         if cache:
             await cache.clear(cache_key)
 
+    @classmethod
+    async def clear_cached_keys(
+        cls, session: ProfileSession, cache_keys: Sequence[str]
+    ):
+        """Shortcut method to clear several cached key values, if any.
+
+        Args:
+            session: The profile session to use
+            cache_keys: The unique cache identifiers
+        """
+
+        cache_keys = [key for key in cache_keys or () if key]
+        if not cache_keys:
+            return
+        cache = session.inject_or(BaseCache)
+        if cache:
+            await cache.clear_many(cache_keys)
+
     @classmethod
     async def retrieve_by_id(
         cls: Type[RecordType],
@@ -251,16 +285,17 @@ class BaseRecord(BaseModel):
                 with sequence values specifying alternatives to match (hit any)
         """
 
+        query_filter, remaining_filter = cls.plan_query(tag_filter, post_filter)
         storage = session.inject(BaseStorage)
         rows = await storage.find_all_records(
             cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
+            cls.prefix_tag_filter(query_filter),
             options={"forUpdate": for_update, "retrieveTags": False},
         )
         found = None
         for record in rows:
             vals = json.loads(record.value)
-            if match_post_filter(vals, post_filter, alt=False):
+            if match_post_filter(vals, remaining_filter, alt=False):
                 if found:
                     raise StorageDuplicateError(
                         "Multiple {} records located for {}{}".format(
@@ -278,6 +313,53 @@ class BaseRecord(BaseModel):
             )
         return found
 
+    @classmethod
+    def plan_query(
+        cls, tag_filter: dict = None, post_filter: dict = None, alt: bool = False
+    ) -> Tuple[Optional[dict], Optional[dict]]:
+        """Move positive post-filter clauses on tagged fields into the tag filter.
+
+        Only string values can be matched by tag queries, so clauses on other
+        values are left to be applied to the decoded records.
+
+        Args:
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter: Value filters to apply matching positively
+            alt: set to match any of the alternative values in post_filter
+
+        Returns:
+            A tuple of the combined tag filter and the remaining post-filter
+
+        """
+        if not post_filter:
+            return tag_filter, post_filter
+        tag_map = cls.get_tag_map()
+        pushed = {}
+        remaining = {}
+        for k, v in post_filter.items():
+            if k not in tag_map:
+                remaining[k] = v
+            elif not alt and isinstance(v, str):
+                pushed[k] = v
+            elif (
+                alt
+                and isinstance(v, (list, tuple, set))
+                and v
+                and all(isinstance(alt_v, str) and alt_v for alt_v in v)
+            ):
+                pushed[k] = {"$in": list(v)}
+            else:
+                remaining[k] = v
+        if not pushed:
+            return tag_filter, post_filter
+        if not tag_filter:
+            tag_filter = pushed
+        elif any(k in tag_filter for k in pushed):
+            tag_filter = {"$and": [tag_filter, pushed]}
+        else:
+            tag_filter = {**tag_filter, **pushed}
+        return tag_filter, remaining or None
+
     @classmethod
     async def query(
         cls: Type[RecordType],
@@ -287,9 +369,17 @@ class BaseRecord(BaseModel):
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
+        limit: int = None,
+        offset: int = None,
     ) -> Sequence[RecordType]:
         """Query stored records.
 
+        Positive post-filter clauses on tagged fields are evaluated by the
+        storage backend as part of the tag query. When `limit` or `offset` is
+        given, only the requested range of matching records is decoded: a page
+        is fetched directly when no post-filter remains, otherwise the records
+        are read through a single storage search.
+
         Args:
             session: The profile session to use
             tag_filter: An optional dictionary of tag filter clauses
@@ -297,34 +387,154 @@ class BaseRecord(BaseModel):
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
                 values in post_filter
+            limit: The maximum number of records to return, or all when `None`
+            offset: The number of matching records to skip
         """
 
-        storage = session.inject(BaseStorage)
-        rows = await storage.find_all_records(
-            cls.RECORD_TYPE,
-            cls.prefix_tag_filter(tag_filter),
-            options={"retrieveTags": False},
+        tag_filter, post_filter_positive = cls.plan_query(
+            tag_filter, post_filter_positive, alt
         )
+        if (limit is not None or offset is not None) and (
+            limit is None or post_filter_positive or post_filter_negative
+        ):
+            return [
+                record
+                async for record in cls._search(
+                    session,
+                    tag_filter,
+                    post_filter_positive,
+                    post_filter_negative,
+                    alt,
+                    limit=limit,
+                    offset=offset,
+                )
+            ]
+
+        tag_query = cls.prefix_tag_filter(tag_filter)
+        storage = session.inject(BaseStorage)
+        if limit is None:
+            rows = await storage.find_all_records(
+                cls.RECORD_TYPE, tag_query, options={"retrieveTags": False}
+            )
+        else:
+            rows = await storage.find_paginated_records(
+                cls.RECORD_TYPE, tag_query, limit=limit, offset=offset or 0
+            )
+
         result = []
         for record in rows:
             vals = json.loads(record.value)
             if match_post_filter(
-                vals,
-                post_filter_positive,
-                positive=True,
-                alt=alt,
+                vals, post_filter_positive, positive=True, alt=alt
             ) and match_post_filter(
-                vals,
-                post_filter_negative,
-                positive=False,
-                alt=alt,
+                vals, post_filter_negative, positive=False, alt=alt
             ):
-                try:
-                    result.append(cls.from_storage(record.id, vals))
-                except BaseModelError as err:
-                    raise BaseModelError(f"{err}, for record id {record.id}")
+                result.append(cls._load(record, vals))
         return result
 
+    @classmethod
+    async def iter_query(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        limit: int = None,
+        offset: int = None,
+        page_size: int = None,
+    ) -> AsyncIterator[RecordType]:
+        """Iterate over stored records matching a query.
+
+        Unlike `query`, matching records are read from a single storage search
+        and decoded one page at a time, so memory use does not grow with the
+        number of records found.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            limit: The maximum number of records to return, or all when `None`
+            offset: The number of matching records to skip
+            page_size: The number of records to read from storage at a time
+        """
+
+        tag_filter, post_filter_positive = cls.plan_query(
+            tag_filter, post_filter_positive, alt
+        )
+        async for record in cls._search(
+            session,
+            tag_filter,
+            post_filter_positive,
+            post_filter_negative,
+            alt,
+            limit=limit,
+            offset=offset,
+            page_size=page_size,
+        ):
+            yield record
+
+    @classmethod
+    async def _search(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: Optional[dict],
+        post_filter_positive: Optional[dict],
+        post_filter_negative: Optional[dict],
+        alt: bool,
+        *,
+        limit: int = None,
+        offset: int = None,
+        page_size: int = None,
+    ) -> AsyncIterator[RecordType]:
+        """Read the records matching a planned query through a storage search."""
+        if limit is not None and limit <= 0:
+            return
+        skip = offset or 0
+        count = 0
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        search = session.inject(BaseStorageSearch).search_records(
+            cls.RECORD_TYPE, cls.prefix_tag_filter(tag_filter), page_size
+        )
+        try:
+            while True:
+                rows = await search.fetch(page_size)
+                for record in rows:
+                    vals = json.loads(record.value)
+                    if not (
+                        match_post_filter(
+                            vals, post_filter_positive, positive=True, alt=alt
+                        )
+                        and match_post_filter(
+                            vals, post_filter_negative, positive=False, alt=alt
+                        )
+                    ):
+                        continue
+                    if skip:
+                        # skipped matches are not decoded
+                        skip -= 1
+                        continue
+                    yield cls._load(record, vals)
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+                if len(rows) < page_size:
+                    break
+        finally:
+            await search.close()
+
+    @classmethod
+    def _load(cls: Type[RecordType], record: StorageRecord, vals: dict) -> RecordType:
+        """Create a record instance from a stored record and its decoded value."""
+        try:
+            return cls.from_storage(record.id, vals)
+        except BaseModelError as err:
+            raise BaseModelError(f"{err}, for record id {record.id}")
+
     async def save(
         self,
         session: ProfileSession,
@@ -375,6 +585,72 @@ class BaseRecord(BaseModel):
 
         return self._id
 
+    @classmethod
+    async def save_all(
+        cls,
+        session: ProfileSession,
+        records: Sequence["BaseRecord"],
+        *,
+        reason: str = None,
+        log_override: bool = False,
+        event: bool = None,
+    ) -> Sequence[str]:
+        """Persist several records to storage with bulk storage operations.
+
+        New records are added, and existing records updated, in one batch each.
+        Post-save actions and events follow once all of the records are stored.
+
+        Args:
+            session: The profile session to use
+            records: The records to save
+            reason: A reason to add to the log
+            override: Override configured logging regimen, print to stderr instead
+            event: Flag to override whether the events are sent
+
+        Returns:
+            The identifiers of the saved records
+
+        """
+        storage = session.inject(BaseStorage)
+        new_records = [not record._id or record._new_with_id for record in records]
+        added = [record for record, new in zip(records, new_records) if new]
+        updated = [record for record, new in zip(records, new_records) if not new]
+        saved = False
+        try:
+            timestamp = time_now()
+            for record in updated:
+                record.updated_at = timestamp
+            for record in added:
+                if not record._id:
+                    record._id = str(uuid.uuid4())
+                record.created_at = record.updated_at = timestamp
+            if added:
+                await storage.add_records([record.storage_record for record in added])
+                for record in added:
+                    record._new_with_id = False
+            if updated:
+                await storage.update_records(
+                    [record.storage_record for record in updated]
+                )
+            saved = True
+        finally:
+            for record, new in zip(records, new_records):
+                log_reason = reason or ("Created record" if new else "Updated record")
+                if not saved:
+                    log_reason = f"FAILED: {log_reason}"
+                record.log_state(
+                    log_reason,
+                    {record.RECORD_TYPE: record.serialize()},
+                    override=log_override,
+                    settings=session.settings,
+                )
+
+        for record, new in zip(records, new_records):
+            await record.post_save(session, new, record._last_state, event)
+            record._last_state = record.state
+
+        return [record._id for record in records]
+
     async def post_save(
         self,
         session: ProfileSession,
@@ -411,6 +687,25 @@ class BaseRecord(BaseModel):
                 await self.emit_event(session, self.serialize())
             await storage.delete_record(self.storage_record)
 
+    @classmethod
+    async def delete_all(cls, session: ProfileSession, records: Sequence["BaseRecord"]):
+        """Remove several stored records with a bulk storage operation.
+
+        Args:
+            session: The profile session to use
+            records: The records to remove
+        """
+        records = [record for record in records if record._id]
+        if not records:
+            return
+        storage = session.inject(BaseStorage)
+        for record in records:
+            if record.state:
+                record._previous_state = record.state
+                record.state = BaseRecord.STATE_DELETED
+                await record.emit_event(session, record.serialize())
+        await storage.delete_records([record.storage_record for record in records])
+
     async def emit_event(self, session: ProfileSession, payload: Any = None):
         """Emit an event.
 
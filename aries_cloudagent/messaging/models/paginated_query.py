@@ -0,0 +1,119 @@
+"""Pagination and streaming support for admin API list endpoints."""
+
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, Tuple
+
+from aiohttp import web
+from marshmallow import fields, validate
+
+from ...storage.base import DEFAULT_PAGE_SIZE
+from .openapi import OpenAPISchema
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+PageFetcher = Callable[[Optional[int], Optional[int]], Awaitable[Sequence[Any]]]
+ResultIterator = Callable[[Optional[int], Optional[int]], AsyncIterator[Any]]
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated list queries."""
+
+    limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=1),
+        metadata={"description": "Number of results to return", "example": 50},
+    )
+    offset = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata={"description": "Offset for pagination", "example": 0},
+    )
+
+
+def get_limit_offset(request: web.BaseRequest) -> Tuple[Optional[int], Optional[int]]:
+    """Read the pagination parameters from a request query string.
+
+    Returns:
+        A tuple of the limit and offset, each `None` when not given
+
+    """
+    limit = request.query.get("limit")
+    offset = request.query.get("offset")
+    return (
+        int(limit) if limit not in (None, "") else None,
+        int(offset) if offset not in (None, "") else None,
+    )
+
+
+def wants_ndjson(request: web.BaseRequest) -> bool:
+    """Check whether the client asked for a newline-delimited JSON stream."""
+    return NDJSON_CONTENT_TYPE in request.headers.get("Accept", "")
+
+
+async def paginated_response(
+    request: web.BaseRequest,
+    fetch_page: PageFetcher,
+    results_key: str = "results",
+    *,
+    iter_results: ResultIterator = None,
+) -> web.StreamResponse:
+    """Respond to a list request with one page of results or a result stream.
+
+    By default a single page, bounded by the `limit` and `offset` query
+    parameters, is returned as `{"results": [...]}`. Clients that accept
+    `application/x-ndjson` instead receive every result in the requested range,
+    one JSON document per line, written a page at a time. The stream is read
+    from `iter_results` when given, so that a single storage search serves the
+    whole range, and otherwise from successive calls to `fetch_page`.
+
+    Args:
+        request: The admin request
+        fetch_page: A callable returning the serialized results for a limit
+            and offset, where `None` means no limit or offset; each stored
+            record in range must produce one result
+        results_key: The response property holding the list of results
+        iter_results: A callable returning an async iterator over the
+            serialized results for a limit and offset
+
+    """
+    limit, offset = get_limit_offset(request)
+    if not wants_ndjson(request):
+        return web.json_response({results_key: await fetch_page(limit, offset)})
+
+    response = web.StreamResponse(headers={"Content-Type": NDJSON_CONTENT_TYPE})
+    if iter_results:
+        # the response is prepared with the first page, so that errors raised
+        # when the search starts are still reported with an error status
+        page = []
+        async for item in iter_results(limit, offset):
+            page.append(json.dumps(item).encode("utf-8") + b"\n")
+            if len(page) >= DEFAULT_PAGE_SIZE:
+                if not response.prepared:
+                    await response.prepare(request)
+                await response.write(b"".join(page))
+                page = []
+        if not response.prepared:
+            await response.prepare(request)
+        if page:
+            await response.write(b"".join(page))
+        await response.write_eof()
+        return response
+
+    await response.prepare(request)
+    offset = offset or 0
+    while limit is None or limit > 0:
+        page_size = (
+            DEFAULT_PAGE_SIZE if limit is None else min(limit, DEFAULT_PAGE_SIZE)
+        )
+        page = await fetch_page(page_size, offset)
+        if page:
+            await response.write(
+                b"".join(json.dumps(item).encode("utf-8") + b"\n" for item in page)
+            )
+        if len(page) < page_size:
+            break
+        offset += len(page)
+        if limit is not None:
+            limit -= len(page)
+    await response.write_eof()
+    return response
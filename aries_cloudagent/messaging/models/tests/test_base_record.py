@@ -11,6 +11,7 @@ from ....storage.base import (
     StorageDuplicateError,
     StorageRecord,
 )
+from ....storage.in_memory import InMemoryStorage
 from ....messaging.models.base import BaseModelError
 
 from ...util import time_now
@@ -156,6 +157,90 @@ class TestBaseRecord(AsyncTestCase):
             with self.assertRaises(ZeroDivisionError):
                 await rec.save(session)
 
+    async def test_save_all(self):
+        session = InMemoryProfile.test_session()
+        mock_event_bus = MockEventBus()
+        session.profile.context.injector.bind_instance(EventBus, mock_event_bus)
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        existing.b = "1"
+        records = [existing] + [ARecordImpl(a="2", b=str(i)) for i in range(2)]
+        storage = session.inject(BaseStorage)
+
+        with async_mock.patch.object(
+            ARecordImpl, "RECORD_TOPIC", "topic"
+        ), async_mock.patch.object(
+            storage, "add_record", async_mock.CoroutineMock()
+        ) as mock_add, async_mock.patch.object(
+            storage, "update_record", async_mock.CoroutineMock()
+        ) as mock_update:
+            ids = await ARecordImpl.save_all(session, records)
+            mock_add.assert_not_called()
+            mock_update.assert_not_called()
+
+        assert ids == [record._id for record in records]
+        assert all(ids)
+        found = await ARecordImpl.query(session)
+        assert sorted(record.b for record in found) == ["0", "1", "1"]
+        # events only for new records, as no state changed
+        assert [event.payload["ident"] for _, event in mock_event_bus.events] == ids[1:]
+
+        with async_mock.patch.object(
+            storage, "update_records", async_mock.CoroutineMock()
+        ) as mock_update:
+            await ARecordImpl.save_all(session, records, event=False)
+            mock_update.assert_awaited_once()
+            assert len(mock_update.call_args[0][0]) == 3
+
+    async def test_save_all_x(self):
+        session = InMemoryProfile.test_session()
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        new = ARecordImpl(a="2", b="0", code="one")
+        with async_mock.patch.object(
+            new, "post_save", async_mock.CoroutineMock()
+        ) as mock_post_save:
+            with self.assertRaises(StorageDuplicateError):
+                await ARecordImpl.save_all(
+                    session,
+                    [
+                        new,
+                        ARecordImpl(ident=existing._id, a="3", b="0", new_with_id=True),
+                    ],
+                )
+            mock_post_save.assert_not_called()
+        assert len(await ARecordImpl.query(session)) == 1
+
+    async def test_delete_all(self):
+        session = InMemoryProfile.test_session()
+        mock_event_bus = MockEventBus()
+        session.profile.context.injector.bind_instance(EventBus, mock_event_bus)
+        records = [ARecordImpl(a="1", b=str(i), state="active") for i in range(3)]
+        await ARecordImpl.save_all(session, records, event=False)
+        storage = session.inject(BaseStorage)
+
+        with async_mock.patch.object(
+            ARecordImpl, "RECORD_TOPIC", "topic"
+        ), async_mock.patch.object(
+            storage, "delete_record", async_mock.CoroutineMock()
+        ) as mock_delete:
+            await ARecordImpl.delete_all(
+                session, records[:2] + [ARecordImpl(a="2", b="0")]
+            )
+            mock_delete.assert_not_called()
+
+        found = await ARecordImpl.query(session)
+        assert [record._id for record in found] == [records[2]._id]
+        assert [event.topic for _, event in mock_event_bus.events] == [
+            f"acapy::record::topic::{BaseRecord.STATE_DELETED}"
+        ] * 2
+
+        with async_mock.patch.object(
+            storage, "delete_records", async_mock.CoroutineMock()
+        ) as mock_delete:
+            await ARecordImpl.delete_all(session, [])
+            mock_delete.assert_not_called()
+
     async def test_neq(self):
         a_rec = ARecordImpl(a="1", b="0", code="one")
         b_rec = BaseRecordImpl()
@@ -259,6 +344,152 @@ class TestBaseRecord(AsyncTestCase):
         )
         assert not result
 
+    def test_plan_query(self):
+        assert ARecordImpl.plan_query({"a": "x"}, None) == ({"a": "x"}, None)
+        assert ARecordImpl.plan_query(None, {"code": "red", "a": "one"}) == (
+            {"code": "red"},
+            {"a": "one"},
+        )
+        assert ARecordImpl.plan_query({"code": "red"}, {"code": "blue"}) == (
+            {"$and": [{"code": "red"}, {"code": "blue"}]},
+            None,
+        )
+        assert ARecordImpl.plan_query(
+            {"state": "x"}, {"code": ["red", "blue"]}, alt=True
+        ) == ({"state": "x", "code": {"$in": ["red", "blue"]}}, None)
+        # only non-empty string values can be matched by tag queries
+        assert ARecordImpl.plan_query(None, {"code": ["red", ""]}, alt=True) == (
+            None,
+            {"code": ["red", ""]},
+        )
+        assert ARecordImpl.plan_query(None, {"code": None}) == (None, {"code": None})
+
+    async def test_query_post_filter_pushdown(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a=str(i), b="b", code="red" if i % 2 else "blue").save(
+                session
+            )
+
+        result = await ARecordImpl.query(session, post_filter_positive={"code": "red"})
+        assert sorted(rec.a for rec in result) == ["1", "3"]
+
+        result = await ARecordImpl.query(
+            session,
+            post_filter_positive={"code": ["red", "green"], "a": ["1", "2"]},
+            alt=True,
+        )
+        assert [rec.a for rec in result] == ["1"]
+
+        with async_mock.patch.object(
+            session.inject(BaseStorage),
+            "find_all_records",
+            async_mock.CoroutineMock(return_value=[]),
+        ) as mock_find:
+            await ARecordImpl.query(session, post_filter_positive={"code": "red"})
+            mock_find.assert_awaited_once_with(
+                ARecordImpl.RECORD_TYPE,
+                {"code": "red"},
+                options={"retrieveTags": False},
+            )
+
+    async def test_query_limit_offset(self):
+        session = InMemoryProfile.test_session()
+        for i in range(250):
+            await ARecordImpl(a=str(i), b=str(i % 3), code="red").save(session)
+
+        result = await ARecordImpl.query(session, {"code": "red"}, limit=10, offset=5)
+        assert [rec.a for rec in result] == [str(i) for i in range(5, 15)]
+
+        result = await ARecordImpl.query(session, offset=240)
+        assert [rec.a for rec in result] == [str(i) for i in range(240, 250)]
+
+        # remaining post-filter on an untagged field is applied while paging
+        result = await ARecordImpl.query(
+            session, post_filter_positive={"b": "0"}, limit=5, offset=70
+        )
+        assert [rec.a for rec in result] == [str(i) for i in range(210, 225, 3)]
+
+        result = await ARecordImpl.query(
+            session, post_filter_negative={"b": "0"}, offset=160
+        )
+        assert len(result) == 6
+
+        # an offset alone returns every remaining record, with or without post-filter
+        result = await ARecordImpl.query(session, offset=20)
+        assert len(result) == 230
+        result = await ARecordImpl.query(
+            session, post_filter_negative={"b": "3"}, offset=20
+        )
+        assert len(result) == 230
+
+    async def test_query_post_filter_single_search(self):
+        session = InMemoryProfile.test_session()
+        for i in range(250):
+            await ARecordImpl(a=str(i), b=str(i % 3), code="red").save(session)
+
+        storage = session.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage, "find_paginated_records", async_mock.CoroutineMock()
+        ) as mock_find, async_mock.patch.object(
+            InMemoryStorage,
+            "search_records",
+            autospec=True,
+            side_effect=InMemoryStorage.search_records,
+        ) as mock_search:
+            result = await ARecordImpl.query(
+                session, post_filter_positive={"b": "1"}, limit=50, offset=20
+            )
+        assert [rec.a for rec in result] == [str(i) for i in range(61, 211, 3)]
+        mock_find.assert_not_called()
+        mock_search.assert_called_once()
+
+    async def test_iter_query(self):
+        session = InMemoryProfile.test_session()
+        await ARecordImpl.save_all(
+            session,
+            [
+                ARecordImpl(a=str(i), b=str(i % 3), code="red" if i < 20 else "blue")
+                for i in range(25)
+            ],
+        )
+
+        result = [rec async for rec in ARecordImpl.iter_query(session, page_size=4)]
+        assert [rec.a for rec in result] == [str(i) for i in range(25)]
+
+        result = [
+            rec.a
+            async for rec in ARecordImpl.iter_query(
+                session,
+                {"code": "red"},
+                post_filter_negative={"b": "0"},
+                page_size=5,
+            )
+        ]
+        assert result == [str(i) for i in range(20) if i % 3]
+
+        result = [
+            rec.a
+            async for rec in ARecordImpl.iter_query(
+                session,
+                post_filter_negative={"b": "0"},
+                limit=4,
+                offset=3,
+                page_size=2,
+            )
+        ]
+        assert result == ["5", "7", "8", "10"]
+        assert [rec async for rec in ARecordImpl.iter_query(session, limit=0)] == []
+
+        with async_mock.patch.object(
+            ARecordImpl,
+            "from_storage",
+            async_mock.MagicMock(side_effect=BaseModelError),
+        ):
+            with self.assertRaises(BaseModelError):
+                async for _ in ARecordImpl.iter_query(session):
+                    pass
+
     @async_mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
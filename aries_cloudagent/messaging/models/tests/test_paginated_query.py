@@ -0,0 +1,143 @@
+import json
+
+from aiohttp.test_utils import make_mocked_request
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from .. import paginated_query as test_module
+from ..paginated_query import (
+    NDJSON_CONTENT_TYPE,
+    get_limit_offset,
+    paginated_response,
+    wants_ndjson,
+)
+
+
+class TestPaginatedQuery(AsyncTestCase):
+    def setUp(self):
+        self.items = [{"n": n} for n in range(7)]
+        self.calls = []
+
+    async def fetch_page(self, limit, offset):
+        self.calls.append((limit, offset))
+        start = offset or 0
+        end = None if limit is None else start + limit
+        return self.items[start:end]
+
+    def test_get_limit_offset(self):
+        request = make_mocked_request("GET", "/records?limit=5&offset=10")
+        assert get_limit_offset(request) == (5, 10)
+        request = make_mocked_request("GET", "/records")
+        assert get_limit_offset(request) == (None, None)
+
+    def test_wants_ndjson(self):
+        request = make_mocked_request(
+            "GET", "/records", headers={"Accept": NDJSON_CONTENT_TYPE}
+        )
+        assert wants_ndjson(request)
+        assert not wants_ndjson(make_mocked_request("GET", "/records"))
+
+    async def test_json_page(self):
+        request = make_mocked_request("GET", "/records?limit=2&offset=3")
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await paginated_response(request, self.fetch_page)
+        mock_response.assert_called_once_with({"results": [{"n": 3}, {"n": 4}]})
+        assert self.calls == [(2, 3)]
+
+    async def test_json_all_results_key(self):
+        request = make_mocked_request("GET", "/records")
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await paginated_response(request, self.fetch_page, results_key="ids")
+        mock_response.assert_called_once_with({"ids": self.items})
+        assert self.calls == [(None, None)]
+
+    async def test_ndjson_stream(self):
+        request = make_mocked_request(
+            "GET", "/records?offset=1&limit=5", headers={"Accept": NDJSON_CONTENT_TYPE}
+        )
+        with async_mock.patch.object(
+            test_module, "DEFAULT_PAGE_SIZE", 2
+        ), async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_stream:
+            response = mock_stream.return_value
+            response.prepare = async_mock.CoroutineMock()
+            response.write = async_mock.CoroutineMock()
+            response.write_eof = async_mock.CoroutineMock()
+            result = await paginated_response(request, self.fetch_page)
+
+        assert result is response
+        assert self.calls == [(2, 1), (2, 3), (1, 5)]
+        written = b"".join(call.args[0] for call in response.write.call_args_list)
+        lines = written.decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == self.items[1:6]
+        response.write_eof.assert_awaited_once()
+
+    async def test_ndjson_stream_short_page(self):
+        request = make_mocked_request(
+            "GET", "/records", headers={"Accept": NDJSON_CONTENT_TYPE}
+        )
+        with async_mock.patch.object(
+            test_module, "DEFAULT_PAGE_SIZE", 4
+        ), async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_stream:
+            response = mock_stream.return_value
+            response.prepare = async_mock.CoroutineMock()
+            response.write = async_mock.CoroutineMock()
+            response.write_eof = async_mock.CoroutineMock()
+            await paginated_response(request, self.fetch_page)
+
+        assert self.calls == [(4, 0), (4, 4)]
+        assert response.write.await_count == 2
+
+    async def test_ndjson_iter_results(self):
+        async def iter_results(limit, offset):
+            self.calls.append((limit, offset))
+            for item in self.items[offset:]:
+                yield item
+
+        request = make_mocked_request(
+            "GET", "/records?offset=1", headers={"Accept": NDJSON_CONTENT_TYPE}
+        )
+        with async_mock.patch.object(
+            test_module, "DEFAULT_PAGE_SIZE", 4
+        ), async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_stream:
+            response = mock_stream.return_value
+            response.prepared = False
+            response.prepare = async_mock.CoroutineMock()
+            response.write = async_mock.CoroutineMock()
+            response.write_eof = async_mock.CoroutineMock()
+            result = await paginated_response(
+                request, self.fetch_page, iter_results=iter_results
+            )
+
+        assert result is response
+        assert self.calls == [(None, 1)]
+        assert response.write.await_count == 2
+        written = b"".join(call.args[0] for call in response.write.call_args_list)
+        lines = written.decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == self.items[1:]
+        response.prepare.assert_awaited()
+        response.write_eof.assert_awaited_once()
+
+    async def test_ndjson_iter_results_x(self):
+        async def iter_results(limit, offset):
+            raise test_module.web.HTTPBadRequest()
+            yield
+
+        request = make_mocked_request(
+            "GET", "/records", headers={"Accept": NDJSON_CONTENT_TYPE}
+        )
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_stream:
+            response = mock_stream.return_value
+            response.prepared = False
+            response.prepare = async_mock.CoroutineMock()
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await paginated_response(
+                    request, self.fetch_page, iter_results=iter_results
+                )
+        response.prepare.assert_not_called()
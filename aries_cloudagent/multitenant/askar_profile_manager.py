@@ -9,6 +9,7 @@ from ..config.injection_context import InjectionContext
 from ..wallet.models.wallet_record import WalletRecord
 from ..askar.profile import AskarProfile
 from ..multitenant.base import BaseMultitenantManager
+from .cache import ProfileCache
 
 
 class AskarProfileMultitenantManager(BaseMultitenantManager):
@@ -24,6 +25,9 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
         """
         super().__init__(profile)
         self._multitenant_profile: Optional[AskarProfile] = multitenant_profile
+        self._profiles = ProfileCache(
+            profile.settings.get_int("multitenant.cache_size") or 100
+        )
 
     @property
     def open_profiles(self) -> Iterable[Profile]:
@@ -49,7 +53,9 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
         enables multiple "profiles" to share a wallet. Usage of this mechanism
         is what causes this implementation of BaseMultitenantManager.get_wallet_profile
         to look different from others, especially since no explicit clean up is
-        required for profiles that are no longer in use.
+        required for profiles that are no longer in use. The profile instances
+        are only kept in a cache to avoid rebuilding their context and providers
+        for every message and request.
 
         Args:
             base_context: Base context to extend from
@@ -83,13 +89,17 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             profile, _ = await wallet_config(context, provision=False)
             self._multitenant_profile = cast(AskarProfile, profile)
 
-        profile_context = self._multitenant_profile.context.copy()
-
         if provision:
             await self._multitenant_profile.store.create_profile(
                 wallet_record.wallet_id
             )
 
+        profile = self._profiles.get(wallet_record.wallet_id)
+        if profile:
+            return profile
+
+        profile_context = self._multitenant_profile.context.copy()
+
         extra_settings = {
             "admin.webhook_urls": self.get_webhook_urls(base_context, wallet_record),
             "wallet.askar_profile": wallet_record.wallet_id,
@@ -101,11 +111,41 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
 
         assert self._multitenant_profile.opened
 
-        return AskarProfile(
+        profile = AskarProfile(
             self._multitenant_profile.opened,
             profile_context,
             profile_id=wallet_record.wallet_id,
         )
+        self._profiles.put(wallet_record.wallet_id, profile)
+
+        return profile
+
+    async def update_wallet(self, wallet_id: str, new_settings: dict) -> WalletRecord:
+        """Update an existing wallet record and the settings of its profile.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+            new_settings: The context settings to be updated for this wallet
+
+        Returns:
+            WalletRecord: The updated wallet record
+
+        """
+        wallet_record = await super().update_wallet(wallet_id, new_settings)
+
+        # update the profile settings in memory only if loaded
+        profile = self._profiles.get(wallet_id)
+        if profile:
+            profile.settings.update(wallet_record.settings)
+            profile.settings.update(
+                {
+                    "admin.webhook_urls": self.get_webhook_urls(
+                        self._profile.context, wallet_record
+                    ),
+                }
+            )
+
+        return wallet_record
 
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -114,4 +154,7 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             profile: The wallet profile instance
 
         """
+        profile_id = profile.settings.get_str("wallet.askar_profile")
+        if self._profiles.has(profile_id):
+            self._profiles.remove(profile_id)
         await profile.remove()
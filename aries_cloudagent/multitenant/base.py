@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+import hashlib
 import logging
 from typing import Iterable, List, Optional, cast, Tuple
 
@@ -17,10 +18,13 @@ from ..protocols.coordinate_mediation.v1_0.manager import (
 from ..protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
+from ..protocols.routing.v1_0.route_index import RouteIndex
 from ..storage.base import BaseStorage
+from ..storage.error import StorageNotFoundError
 from ..transport.wire_format import BaseWireFormat
 from ..wallet.base import BaseWallet
 from ..wallet.models.wallet_record import WalletRecord
+from .cache import ExpiringCache
 from .error import WalletKeyMissingError
 
 LOGGER = logging.getLogger(__name__)
@@ -43,11 +47,58 @@ class BaseMultitenantManager(ABC):
         if not profile:
             raise MultitenantManagerError("Missing profile")
 
+        # Verified tokens and wallet records looked up by admin requests
+        cache_size = profile.settings.get("multitenant.auth_cache_size")
+        cache_ttl = profile.settings.get("multitenant.auth_cache_ttl")
+        if cache_size is None:
+            cache_size = 1000
+        if cache_ttl is None:
+            cache_ttl = 10
+        self._tokens = ExpiringCache(cache_size, cache_ttl)
+        self._wallet_records = ExpiringCache(cache_size, cache_ttl)
+
     @property
     @abstractmethod
     def open_profiles(self) -> Iterable[Profile]:
         """Return iterator over open profiles."""
 
+    @property
+    def auth_cache_stats(self) -> dict:
+        """Accessor for the usage counters of the token and wallet record caches."""
+        return {
+            "tokens": self._tokens.stats,
+            "wallet_records": self._wallet_records.stats,
+        }
+
+    def _decode_token(self, token: str) -> dict:
+        """Verify a JWT auth token and get its body, caching verified tokens."""
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        token_body = self._tokens.get(digest)
+        if token_body is None:
+            jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
+            token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+            # expiring tokens must be verified every time
+            if "exp" not in token_body:
+                self._tokens.put(digest, token_body)
+        return token_body
+
+    async def _get_wallet_record(self, wallet_id: str) -> WalletRecord:
+        """Retrieve a wallet record by ID, caching it for later requests."""
+        wallet = self._wallet_records.get(wallet_id)
+        if not wallet:
+            async with self._profile.session() as session:
+                wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+            self._wallet_records.put(wallet_id, wallet)
+        return wallet
+
+    def _invalidate_wallet(self, wallet_id: str, tokens: bool = False):
+        """Drop a cached wallet record, and optionally the tokens issued for it."""
+        self._wallet_records.remove(wallet_id)
+        if tokens:
+            self._tokens.remove_where(
+                lambda token_body: token_body.get("wallet_id") == wallet_id
+            )
+
     async def get_default_mediator(self) -> Optional[MediationRecord]:
         """Retrieve the default mediator used for subwallet routing.
 
@@ -227,6 +278,7 @@ class BaseMultitenantManager(ABC):
             wallet_record = await WalletRecord.retrieve_by_id(session, wallet_id)
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
+        self._invalidate_wallet(wallet_id)
 
         return wallet_record
 
@@ -267,8 +319,12 @@ class BaseMultitenantManager(ABC):
             await storage.delete_all_records(
                 RouteRecord.RECORD_TYPE, {"wallet_id": wallet.wallet_id}
             )
+            await self._profile.notify(
+                RouteRecord.EVENT_ROUTE_DELETED, {"wallet_id": wallet.wallet_id}
+            )
 
             await wallet.delete_record(session)
+        self._invalidate_wallet(wallet_id, tokens=True)
 
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
@@ -314,13 +370,14 @@ class BaseMultitenantManager(ABC):
         wallet_record.jwt_iat = iat
         async with self._profile.session() as session:
             await wallet_record.save(session)
+        # tokens issued before are no longer valid
+        self._invalidate_wallet(wallet_record.wallet_id, tokens=True)
 
         return token
 
     def get_wallet_details_from_token(self, token: str) -> Tuple[str, str]:
         """Get the wallet_id and wallet_key from provided token."""
-        jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
-        token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+        token_body = self._decode_token(token)
         wallet_id = token_body.get("wallet_id")
         wallet_key = token_body.get("wallet_key")
         return wallet_id, wallet_key
@@ -330,8 +387,7 @@ class BaseMultitenantManager(ABC):
     ) -> Tuple[WalletRecord, Profile]:
         """Get the wallet_record and profile associated with wallet id and key."""
         extra_settings = {}
-        async with self._profile.session() as session:
-            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+        wallet = await self._get_wallet_record(wallet_id)
         if wallet.requires_external_key:
             if not wallet_key:
                 raise WalletKeyMissingError()
@@ -356,17 +412,15 @@ class BaseMultitenantManager(ABC):
             Profile associated with the token
 
         """
-        jwt_secret = self._profile.context.settings.get("multitenant.jwt_secret")
         extra_settings = {}
 
-        token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"], leeway=1)
+        token_body = self._decode_token(token)
 
         wallet_id = token_body.get("wallet_id")
         wallet_key = token_body.get("wallet_key")
         iat = token_body.get("iat")
 
-        async with self._profile.session() as session:
-            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+        wallet = await self._get_wallet_record(wallet_id)
 
         if wallet.requires_external_key:
             if not wallet_key:
@@ -393,12 +447,19 @@ class BaseMultitenantManager(ABC):
 
         try:
             routing_record = await routing_mgr.get_recipient(recipient_key)
-            async with self._profile.session() as session:
-                wallet = await WalletRecord.retrieve_by_id(
-                    session, routing_record.wallet_id
-                )
-
-            return wallet
+            if not routing_record.wallet_id:
+                # routed for a mediation client of the base wallet
+                return None
+            try:
+                return await self._get_wallet_record(routing_record.wallet_id)
+            except StorageNotFoundError:
+                route_index = self._profile.inject_or(RouteIndex)
+                if route_index is None:
+                    raise
+                # the route may have been removed by another agent instance
+                route_index.remove_key(recipient_key)
+                routing_record = await routing_mgr.get_recipient(recipient_key)
+                return await self._get_wallet_record(routing_record.wallet_id)
         except RouteNotFoundError:
             pass
 
@@ -421,7 +482,8 @@ class BaseMultitenantManager(ABC):
         """Get the wallet records associated with the message boy.
 
         Args:
-            message_body: The body of the message
+            message_body: The body of the message, or the result of
+                `BaseWireFormat.decode_body`
             wire_format: Wire format to use for recipient detection
 
         Returns:
@@ -1,8 +1,9 @@
 """Cache for multitenancy profiles."""
 
 import logging
+import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Any, Callable, Hashable, Optional
 from weakref import WeakValueDictionary
 
 from ..core.profile import Profile
@@ -111,3 +112,73 @@ class ProfileCache:
         """
         del self.profiles[key]
         del self._cache[key]
+
+
+class ExpiringCache:
+    """Least recently used cache whose entries expire, counting hits and misses."""
+
+    def __init__(self, capacity: int, ttl: float):
+        """Initialize ExpiringCache.
+
+        Args:
+            capacity: The maximum number of entries, or 0 to disable the cache
+            ttl: The number of seconds an entry is kept, or 0 to disable the cache
+        """
+        self._cache: OrderedDict[Hashable, tuple] = OrderedDict()
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the cache retains any entries."""
+        return bool(self.capacity and self.ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get the value with associated key from cache, if not expired."""
+        if not self.enabled:
+            return None
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.perf_counter():
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry:
+            del self._cache[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any):
+        """Add value with associated key to the cache."""
+        if not self.enabled:
+            return
+        self._cache[key] = (time.perf_counter() + self.ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def remove(self, key: Hashable):
+        """Remove the value with associated key from the cache, if present."""
+        self._cache.pop(key, None)
+
+    def remove_where(self, predicate: Callable[[Any], bool]):
+        """Remove all values matching a predicate from the cache."""
+        for key in [key for key, entry in self._cache.items() if predicate(entry[1])]:
+            del self._cache[key]
+
+    def clear(self):
+        """Remove all values from the cache."""
+        self._cache.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache usage counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
@@ -151,6 +151,49 @@ class TestAskarProfileMultitenantManager(AsyncTestCase):
                     == multitenant_sub_wallet_name
                 )
 
+    async def test_get_wallet_profile_returns_from_cache(self):
+        wallet_record = WalletRecord(wallet_id="test", settings={})
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.askar_profile_manager.AskarProfile"
+        ) as AskarProfile:
+            sub_wallet_profile = AskarProfile(None, None)
+            sub_wallet_profile.context.copy.return_value = InjectionContext()
+            self.manager._multitenant_profile = sub_wallet_profile
+            AskarProfile.reset_mock()
+
+            profile = await self.manager.get_wallet_profile(
+                self.profile.context, wallet_record
+            )
+            assert (
+                await self.manager.get_wallet_profile(
+                    self.profile.context, wallet_record
+                )
+                is profile
+            )
+            AskarProfile.assert_called_once()
+
+    async def test_update_wallet_update_wallet_profile(self):
+        wallet_record = WalletRecord(
+            settings={"wallet.webhook_urls": ["http://old"]},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        wallet_profile = InMemoryProfile.test_profile(
+            {"wallet.webhook_urls": ["http://old"]}
+        )
+        self.manager._profiles.put(wallet_record.wallet_id, wallet_profile)
+
+        await self.manager.update_wallet(
+            wallet_record.wallet_id,
+            {
+                "wallet.webhook_urls": ["http://new"],
+                "wallet.dispatch_type": "default",
+            },
+        )
+        assert wallet_profile.settings["wallet.webhook_urls"] == ["http://new"]
+        assert wallet_profile.settings["admin.webhook_urls"] == ["http://new"]
+
     async def test_remove_wallet_profile(self):
         test_profile = InMemoryProfile.test_profile({"wallet.id": "test"})
 
@@ -158,6 +201,15 @@ class TestAskarProfileMultitenantManager(AsyncTestCase):
             await self.manager.remove_wallet_profile(test_profile)
             profile_remove.assert_called_once_with()
 
+    async def test_remove_wallet_profile_cached(self):
+        test_profile = InMemoryProfile.test_profile({"wallet.askar_profile": "test"})
+        self.manager._profiles.put("test", test_profile)
+
+        with async_mock.patch.object(InMemoryProfile, "remove") as profile_remove:
+            await self.manager.remove_wallet_profile(test_profile)
+            profile_remove.assert_called_once_with()
+        assert not self.manager._profiles.has("test")
+
     async def test_open_profiles(self):
         assert len(list(self.manager.open_profiles)) == 0
 
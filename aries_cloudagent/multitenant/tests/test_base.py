@@ -567,6 +567,46 @@ class TestBaseMultitenantManager(AsyncTestCase):
 
             assert profile == mock_profile
 
+    async def test_get_profile_for_token_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_MANAGED,
+            settings={"wallet.type": "indy", "wallet.key": "wallet_key"},
+        )
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+        token = await self.manager.create_auth_token(wallet_record)
+
+        with async_mock.patch.object(
+            self.manager, "get_wallet_profile", async_mock.CoroutineMock()
+        ), async_mock.patch.object(
+            test_module.jwt, "decode", wraps=jwt.decode
+        ) as mock_decode, async_mock.patch.object(
+            WalletRecord, "retrieve_by_id", wraps=WalletRecord.retrieve_by_id
+        ) as mock_retrieve:
+            for _ in range(3):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            assert mock_decode.call_count == 1
+            assert mock_retrieve.call_count == 1
+            assert self.manager.auth_cache_stats["tokens"]["hits"] == 2
+            assert self.manager.auth_cache_stats["wallet_records"]["hits"] == 2
+
+            # issuing a new token invalidates the previous one
+            with async_mock.patch.object(test_module, "datetime") as mock_datetime:
+                mock_datetime.utcnow.return_value = datetime(2020, 1, 1)
+                new_token = await self.manager.create_auth_token(wallet_record)
+            with self.assertRaises(MultitenantManagerError):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            await self.manager.get_profile_for_token(self.profile.context, new_token)
+
+            # updating the wallet record refreshes the cached record
+            await self.manager.update_wallet(
+                wallet_record.wallet_id, {"wallet.webhook_urls": ["http://test"]}
+            )
+            mock_retrieve.reset_mock()
+            await self.manager.get_profile_for_token(self.profile.context, new_token)
+            assert mock_retrieve.call_count == 1
+
     async def test_get_profile_for_token_managed_wallet_x_iat_no_match(self):
         iat = 100
 
@@ -1,6 +1,9 @@
+from unittest import mock
+
 from ...core.profile import Profile
 
-from ..cache import ProfileCache
+from .. import cache as test_module
+from ..cache import ExpiringCache, ProfileCache
 
 
 class MockProfile(Profile):
@@ -105,3 +108,51 @@ def test_rescue_open_profile():
     assert cache.get("2") is None
     assert cache.get("3")
     assert cache.get("4")
+
+
+def test_expiring_cache():
+    cache = ExpiringCache(2, 10)
+
+    with mock.patch.object(test_module.time, "perf_counter", return_value=100.0):
+        cache.put("1", "one")
+        cache.put("2", "two")
+        assert cache.get("1") == "one"
+        cache.put("3", "three")
+
+        # least recently used entry is evicted
+        assert cache.get("2") is None
+        assert cache.get("3") == "three"
+
+    with mock.patch.object(test_module.time, "perf_counter", return_value=110.0):
+        assert cache.get("1") is None
+        assert cache.get("3") is None
+
+    assert cache.stats == {
+        "entries": 0,
+        "capacity": 2,
+        "hits": 2,
+        "misses": 3,
+        "hit_ratio": 0.4,
+    }
+
+
+def test_expiring_cache_remove():
+    cache = ExpiringCache(10, 10)
+    cache.put("1", {"wallet_id": "a"})
+    cache.put("2", {"wallet_id": "b"})
+    cache.put("3", {"wallet_id": "a"})
+
+    cache.remove_where(lambda value: value["wallet_id"] == "a")
+    assert cache.get("1") is None
+    assert cache.get("2")
+    assert cache.get("3") is None
+
+    cache.remove("2")
+    assert cache.get("2") is None
+
+
+def test_expiring_cache_disabled():
+    for cache in (ExpiringCache(0, 10), ExpiringCache(10, 0)):
+        assert not cache.enabled
+        cache.put("1", "one")
+        assert cache.get("1") is None
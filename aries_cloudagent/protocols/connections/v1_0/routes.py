@@ -1,7 +1,7 @@
 """Connection handling admin routes."""
 
 import json
-from typing import cast
+from typing import Optional, cast
 
 from aiohttp import web
 from aiohttp_apispec import (
@@ -19,6 +19,10 @@ from ....cache.base import BaseCache
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    paginated_response,
+)
 from ....messaging.valid import (
     ENDPOINT_EXAMPLE,
     ENDPOINT_VALIDATE,
@@ -233,7 +237,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -432,6 +436,9 @@ def connection_sort_key(conn):
 async def connections_list(request: web.BaseRequest):
     """Request handler for searching connection records.
 
+    The full list is sorted by state and creation time, while a page selected
+    with `limit` or `offset`, or a streamed list, is returned in storage order.
+
     Args:
         request: aiohttp request object
 
@@ -467,17 +474,41 @@ async def connections_list(request: web.BaseRequest):
         post_filter["connection_protocol"] = request.query["connection_protocol"]
 
     profile = context.profile
-    try:
-        async with profile.session() as session:
-            records = await ConnRecord.query(
-                session, tag_filter, post_filter_positive=post_filter, alt=True
-            )
-        results = [record.serialize() for record in records]
-        results.sort(key=connection_sort_key)
-    except (StorageError, BaseModelError) as err:
-        raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    async def fetch_page(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                records = await ConnRecord.query(
+                    session,
+                    tag_filter,
+                    post_filter_positive=post_filter,
+                    alt=True,
+                    limit=limit,
+                    offset=offset,
+                )
+            results = [record.serialize() for record in records]
+            if limit is None and offset is None:
+                results.sort(key=connection_sort_key)
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
+        return results
+
+    async def iter_results(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                async for record in ConnRecord.iter_query(
+                    session,
+                    tag_filter,
+                    post_filter_positive=post_filter,
+                    alt=True,
+                    limit=limit,
+                    offset=offset,
+                ):
+                    yield record.serialize()
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+    return await paginated_response(request, fetch_page, iter_results=iter_results)
 
 
 @docs(tags=["connection"], summary="Fetch a single connection record")
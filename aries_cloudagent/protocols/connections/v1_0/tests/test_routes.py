@@ -1,6 +1,7 @@
 import json
 
 from unittest.mock import ANY
+from aiohttp.test_utils import make_mocked_request
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
@@ -104,6 +105,8 @@ class TestConnectionRoutes(AsyncTestCase):
                         "connection_protocol": ConnRecord.Protocol.RFC_0160.aries_protocol,
                     },
                     alt=True,
+                    limit=None,
+                    offset=None,
                 )
                 mock_response.assert_called_once_with(
                     {
@@ -117,6 +120,51 @@ class TestConnectionRoutes(AsyncTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paginated(self):
+        states = [
+            ConnRecord.State.ABANDONED,
+            ConnRecord.State.COMPLETED,
+            ConnRecord.State.INVITATION,
+            ConnRecord.State.COMPLETED,
+            ConnRecord.State.ABANDONED,
+        ]
+        async with self.context.profile.session() as session:
+            conn_ids = [
+                await ConnRecord(state=state, their_label=f"conn-{idx}").save(session)
+                for idx, state in enumerate(states)
+            ]
+
+        # the full list is sorted by state, pages are in storage order
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await test_module.connections_list(self.request)
+        results = mock_response.call_args[0][0]["results"]
+        assert [result["connection_id"] for result in results] == [
+            conn_ids[idx] for idx in (1, 3, 2, 0, 4)
+        ]
+
+        self.request.query = {"limit": "2", "offset": "1"}
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await test_module.connections_list(self.request)
+        results = mock_response.call_args[0][0]["results"]
+        assert [result["connection_id"] for result in results] == conn_ids[1:3]
+
+        request = make_mocked_request(
+            "GET", "/connections?offset=1", headers={"Accept": "application/x-ndjson"}
+        )
+        request["context"] = self.context
+        with async_mock.patch.object(
+            test_module.ConnRecord, "query", async_mock.CoroutineMock()
+        ) as mock_query:
+            await test_module.connections_list(request)
+            mock_query.assert_not_called()
+        written = b"".join(
+            call.args[0] for call in request._payload_writer.write.call_args_list
+        )
+        assert [
+            json.loads(line)["connection_id"]
+            for line in written.decode("utf-8").splitlines()
+        ] == conn_ids[1:]
+
     async def test_connections_list_x(self):
         self.request.query = {
             "their_role": ConnRecord.Role.REQUESTER.rfc160,
@@ -385,7 +433,7 @@ class TestConnectionRoutes(AsyncTestCase):
                 routing_keys=body["routing_keys"],
                 my_endpoint=body["service_endpoint"],
                 metadata=body["metadata"],
-                mediation_id="some-id"
+                mediation_id="some-id",
             )
             mock_response.assert_called_once_with(
                 {
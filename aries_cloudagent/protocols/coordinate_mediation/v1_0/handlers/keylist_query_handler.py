@@ -31,8 +31,11 @@ class KeylistQueryHandler(BaseHandler):
                 record = await MediationRecord.retrieve_by_connection_id(
                     session, context.connection_record.connection_id
                 )
-            keylist = await mgr.get_keylist(record)
-            keylist_response = await mgr.create_keylist_query_response(keylist)
+            paginate = context.message.paginate
+            keylist = await mgr.get_keylist(record, paginate)
+            keylist_response = await mgr.create_keylist_query_response(
+                keylist, paginate
+            )
             await responder.send_reply(keylist_response)
         except (StorageNotFoundError, MediationNotGrantedError):
             reply = CMProblemReport(
@@ -8,6 +8,7 @@ from ......messaging.request_context import RequestContext
 from ......messaging.responder import MockResponder
 from .....routing.v1_0.models.route_record import RouteRecord
 
+from ...messages.inner.keylist_query_paginate import KeylistQueryPaginate
 from ...messages.keylist import Keylist
 from ...messages.keylist_query import KeylistQuery
 from ...messages.problem_report import CMProblemReport, ProblemReportReason
@@ -78,3 +79,22 @@ class TestKeylistQueryHandler(AsyncTestCase):
         assert isinstance(result, Keylist)
         assert len(result.keys) == 1
         assert result.keys[0].recipient_key == TEST_VERKEY_DIDKEY
+
+    async def test_handler_paginated(self):
+        handler, responder = KeylistQueryHandler(), MockResponder()
+        await MediationRecord(
+            state=MediationRecord.STATE_GRANTED, connection_id=TEST_CONN_ID
+        ).save(self.session)
+        await RouteRecord(connection_id=TEST_CONN_ID, recipient_key=TEST_VERKEY).save(
+            self.session
+        )
+        self.context.message = KeylistQuery(
+            paginate=KeylistQueryPaginate(limit=10, offset=1)
+        )
+        await handler.handle(self.context, responder)
+        assert len(responder.messages) == 1
+        result, _target = responder.messages[0]
+        assert isinstance(result, Keylist)
+        assert not result.keys
+        assert result.pagination.limit == 10
+        assert result.pagination.offset == 1
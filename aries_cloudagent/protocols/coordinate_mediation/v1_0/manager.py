@@ -1,18 +1,18 @@
 """Manager for Mediation coordination."""
 import json
 import logging
-from typing import Dict, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
-from ....core.error import BaseError
+from ....core.error import BaseError, ProfileError
 from ....core.profile import Profile, ProfileSession
 from ....storage.base import BaseStorage
-from ....storage.error import StorageNotFoundError
+from ....storage.error import StorageError, StorageNotFoundError
 from ....storage.record import StorageRecord
 from ....wallet.base import BaseWallet
 from ....wallet.did_info import DIDInfo
 from ....wallet.did_method import SOV
 from ....wallet.key_type import ED25519
-from ...routing.v1_0.manager import RoutingManager, RoutingManagerError
+from ...routing.v1_0.manager import RoutingManager
 from ...routing.v1_0.models.route_record import RouteRecord
 from .messages.inner.keylist_key import KeylistKey
 from .messages.inner.keylist_query_paginate import KeylistQueryPaginate
@@ -210,47 +210,42 @@ class MediationManager:
         deny = MediationDeny()
         return mediation_record, deny
 
-    async def _handle_keylist_update_add(
-        self,
-        existing_keys: Dict[str, RouteRecord],
-        client_connection_id: str,
-        recipient_key: str,
-    ):
-        """Handle creation of as directed by a keylist update."""
-        route_mgr = RoutingManager(self._profile)
-        if recipient_key in existing_keys:
-            return KeylistUpdated.RESULT_NO_CHANGE
-        try:
-            await route_mgr.create_route_record(
-                client_connection_id=client_connection_id,
-                recipient_key=recipient_key,
-            )
-        except RoutingManagerError:
-            LOGGER.exception("Error adding route record")
-            return KeylistUpdated.RESULT_SERVER_ERROR
-        return KeylistUpdated.RESULT_SUCCESS
+    async def _get_updated_routes(
+        self, connection_id: str, recipient_keys: Iterable[str]
+    ) -> Dict[str, RouteRecord]:
+        """Get the routes of a client for the keys named in a keylist update.
 
-    async def _handle_keylist_update_remove(
-        self,
-        existing_keys: Dict[str, RouteRecord],
-        recipient_key: str,
-    ):
-        """Handle deletion of as directed by a keylist update."""
+        Routes may be stored with the recipient key in raw or DID key form, so
+        all of the forms are looked up.
+
+        Returns:
+            The routes found, by normalized recipient key
+
+        """
+        key_forms = set()
+        for key in recipient_keys:
+            key_forms.add(key)
+            try:
+                did_key = normalize_to_did_key(key)
+            except Exception:
+                continue
+            key_forms.update((did_key.did, did_key.key_id))
+        if not key_forms:
+            return {}
         route_mgr = RoutingManager(self._profile)
-        if recipient_key not in existing_keys:
-            return KeylistUpdated.RESULT_NO_CHANGE
-        try:
-            await route_mgr.delete_route_record(existing_keys[recipient_key])
-        except RoutingManagerError:
-            LOGGER.exception("Error deleting route record")
-            return KeylistUpdated.RESULT_SERVER_ERROR
-        return KeylistUpdated.RESULT_SUCCESS
+        routes = await route_mgr.get_routes(
+            connection_id, {"recipient_key": sorted(key_forms)}
+        )
+        return {normalize_from_did_key(r.recipient_key): r for r in routes}
 
     async def update_keylist(
         self, record: MediationRecord, updates: Sequence[KeylistUpdateRule]
     ) -> KeylistUpdateResponse:
         """Update routes defined in keylist update rules.
 
+        The rules are applied in order to the current routes of the client, and
+        the resulting routes are then added and removed in a single transaction.
+
         Args:
             record (MediationRecord): record associated with client updating keylist
             updates (Sequence[KeylistUpdateRule]): updates to apply
@@ -264,13 +259,20 @@ class MediationManager:
                 "Mediation has not been granted for this connection."
             )
 
-        route_mgr = RoutingManager(self._profile)
-        routes = await route_mgr.get_routes(record.connection_id)
-        existing_keys = {normalize_from_did_key(r.recipient_key): r for r in routes}
+        normalized_keys = [
+            normalize_from_did_key(update.recipient_key)
+            if update.recipient_key
+            else None
+            for update in updates
+        ]
+        existing_keys = await self._get_updated_routes(
+            record.connection_id, filter(None, normalized_keys)
+        )
 
+        added: Dict[str, RouteRecord] = {}
+        removed: Dict[str, RouteRecord] = {}
         updated = []
-        for update in updates:
-            normalized_key = normalize_from_did_key(update.recipient_key)
+        for update, normalized_key in zip(updates, normalized_keys):
             result = KeylistUpdated(
                 recipient_key=update.recipient_key,
                 action=update.action,
@@ -280,25 +282,54 @@ class MediationManager:
             if not update.recipient_key:
                 result.result = KeylistUpdated.RESULT_CLIENT_ERROR
             elif update.action == KeylistUpdateRule.RULE_ADD:
-                result.result = await self._handle_keylist_update_add(
-                    existing_keys, record.connection_id, normalized_key
-                )
+                if normalized_key in existing_keys:
+                    result.result = KeylistUpdated.RESULT_NO_CHANGE
+                else:
+                    route = RouteRecord(
+                        connection_id=record.connection_id,
+                        recipient_key=normalized_key,
+                    )
+                    existing_keys[normalized_key] = added[normalized_key] = route
+                    result.result = KeylistUpdated.RESULT_SUCCESS
             elif update.action == KeylistUpdateRule.RULE_REMOVE:
-                result.result = await self._handle_keylist_update_remove(
-                    existing_keys, normalized_key
-                )
+                if normalized_key not in existing_keys:
+                    result.result = KeylistUpdated.RESULT_NO_CHANGE
+                else:
+                    route = existing_keys.pop(normalized_key)
+                    if added.get(normalized_key) is route:
+                        del added[normalized_key]
+                    else:
+                        removed[normalized_key] = route
+                    result.result = KeylistUpdated.RESULT_SUCCESS
             else:
                 result.result = KeylistUpdated.RESULT_CLIENT_ERROR
 
             updated.append(result)
 
+        if added or removed:
+            try:
+                async with self._profile.transaction() as txn:
+                    await RouteRecord.delete_all(txn, list(removed.values()))
+                    await RouteRecord.save_all(
+                        txn, list(added.values()), reason="Created new route"
+                    )
+                    await txn.commit()
+            except (ProfileError, StorageError):
+                LOGGER.exception("Error updating route records")
+                for result in updated:
+                    if result.result == KeylistUpdated.RESULT_SUCCESS:
+                        result.result = KeylistUpdated.RESULT_SERVER_ERROR
+
         return KeylistUpdateResponse(updated=updated)
 
-    async def get_keylist(self, record: MediationRecord) -> Sequence[RouteRecord]:
+    async def get_keylist(
+        self, record: MediationRecord, paginate: KeylistQueryPaginate = None
+    ) -> Sequence[RouteRecord]:
         """Retrieve keylist for mediation client.
 
         Args:
             record (MediationRecord): record associated with client keylist
+            paginate (KeylistQueryPaginate): the range of routes to retrieve
 
         Returns:
             Sequence[RouteRecord]: sequence of routes (the keylist)
@@ -309,22 +340,32 @@ class MediationManager:
                 "Mediation has not been granted for this connection."
             )
         route_mgr = RoutingManager(self._profile)
-        return await route_mgr.get_routes(record.connection_id)
+        return await route_mgr.get_routes(
+            record.connection_id,
+            limit=paginate and paginate.limit,
+            offset=paginate and paginate.offset,
+        )
 
     async def create_keylist_query_response(
-        self, keylist: Sequence[RouteRecord]
+        self, keylist: Sequence[RouteRecord], paginate: KeylistQueryPaginate = None
     ) -> Keylist:
         """Prepare a keylist message from keylist.
 
         Args:
             keylist (Sequence[RouteRecord]): keylist to format into message
+            paginate (KeylistQueryPaginate): the range of routes in the keylist
 
         Returns:
             Keylist: message to return to client
 
         """
         keys = [KeylistKey(recipient_key=key.recipient_key) for key in keylist]
-        return Keylist(keys=keys, pagination=None)
+        pagination = None
+        if paginate:
+            pagination = KeylistQueryPaginate(
+                limit=paginate.limit, offset=paginate.offset or 0
+            )
+        return Keylist(keys=keys, pagination=pagination)
 
     # }}}
 
@@ -7,10 +7,12 @@ import pytest
 
 from .. import manager as test_module
 from .....core.event_bus import EventBus, MockEventBus
+from .....core.error import ProfileError
 from .....core.in_memory import InMemoryProfile
+from .....core.in_memory.profile import InMemoryProfileSession
 from .....core.profile import Profile, ProfileSession
 from .....did.did_key import DIDKey
-from .....storage.error import StorageNotFoundError
+from .....storage.error import StorageError, StorageNotFoundError
 from ....routing.v1_0.models.route_record import RouteRecord
 from ..manager import (
     MediationAlreadyExists,
@@ -18,6 +20,7 @@ from ..manager import (
     MediationManagerError,
     MediationNotGrantedError,
 )
+from ..messages.inner.keylist_query_paginate import KeylistQueryPaginate
 from ..messages.inner.keylist_update_rule import KeylistUpdateRule
 from ..messages.inner.keylist_updated import KeylistUpdated
 from ..messages.mediate_deny import MediationDeny
@@ -185,6 +188,110 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
         assert results[0].action == KeylistUpdateRule.RULE_ADD
         assert results[0].result == KeylistUpdated.RESULT_NO_CHANGE
 
+    async def test_update_keylist_batch(self, session, manager, record, mock_event_bus):
+        """test_update_keylist_batch."""
+        await RouteRecord(
+            connection_id=TEST_CONN_ID, recipient_key=TEST_BASE58_VERKEY
+        ).save(session)
+        mock_event_bus.events.clear()
+        other_key = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRy"
+        add, remove = KeylistUpdateRule.RULE_ADD, KeylistUpdateRule.RULE_REMOVE
+        updates = [
+            (TEST_ROUTE_VERKEY, add),
+            (TEST_ROUTE_RECORD_VERKEY, add),
+            (TEST_VERKEY, remove),
+            (TEST_BASE58_VERKEY, remove),
+            (other_key, add),
+            (other_key, remove),
+        ]
+        response = await manager.update_keylist(
+            record=record,
+            updates=[
+                KeylistUpdateRule(recipient_key=key, action=action)
+                for key, action in updates
+            ],
+        )
+        assert [result.result for result in response.updated] == [
+            KeylistUpdated.RESULT_SUCCESS,
+            KeylistUpdated.RESULT_NO_CHANGE,
+            KeylistUpdated.RESULT_SUCCESS,
+            KeylistUpdated.RESULT_NO_CHANGE,
+            KeylistUpdated.RESULT_SUCCESS,
+            KeylistUpdated.RESULT_SUCCESS,
+        ]
+
+        routes = await RouteRecord.query(session, {"connection_id": TEST_CONN_ID})
+        assert [route.recipient_key for route in routes] == [TEST_ROUTE_RECORD_VERKEY]
+        events = {
+            event.topic: event.payload["routes"] for _, event in mock_event_bus.events
+        }
+        assert [
+            route["recipient_key"] for route in events[RouteRecord.EVENT_ROUTE_SAVED]
+        ] == [TEST_ROUTE_RECORD_VERKEY]
+        assert [
+            route["recipient_key"] for route in events[RouteRecord.EVENT_ROUTE_DELETED]
+        ] == [TEST_BASE58_VERKEY]
+        assert len(mock_event_bus.events) == 2
+
+    async def test_update_keylist_x_storage(self, session, manager, record):
+        """test_update_keylist_x_storage."""
+        await RouteRecord(
+            connection_id=TEST_CONN_ID, recipient_key=TEST_BASE58_VERKEY
+        ).save(session)
+        with async_mock.patch.object(
+            RouteRecord, "save_all", async_mock.CoroutineMock(side_effect=StorageError)
+        ):
+            response = await manager.update_keylist(
+                record=record,
+                updates=[
+                    KeylistUpdateRule(
+                        recipient_key=TEST_VERKEY, action=KeylistUpdateRule.RULE_ADD
+                    ),
+                    KeylistUpdateRule(
+                        recipient_key=TEST_ROUTE_VERKEY,
+                        action=KeylistUpdateRule.RULE_ADD,
+                    ),
+                ],
+            )
+        assert [result.result for result in response.updated] == [
+            KeylistUpdated.RESULT_NO_CHANGE,
+            KeylistUpdated.RESULT_SERVER_ERROR,
+        ]
+        assert len(await RouteRecord.query(session)) == 1
+
+    async def test_update_keylist_x_commit(self, manager, record, mock_event_bus):
+        """test_update_keylist_x_commit."""
+
+        async def _teardown(commit: bool = None):
+            if commit:
+                raise ProfileError("Error committing transaction")
+
+        with async_mock.patch.object(
+            InMemoryProfileSession,
+            "is_transaction",
+            async_mock.PropertyMock(return_value=True),
+        ), async_mock.patch.object(
+            InMemoryProfileSession,
+            "_teardown",
+            async_mock.CoroutineMock(side_effect=_teardown),
+        ):
+            response = await manager.update_keylist(
+                record=record,
+                updates=[
+                    KeylistUpdateRule(
+                        recipient_key=TEST_VERKEY, action=KeylistUpdateRule.RULE_ADD
+                    )
+                ],
+            )
+        assert [result.result for result in response.updated] == [
+            KeylistUpdated.RESULT_SERVER_ERROR
+        ]
+        assert not [
+            event
+            for _, event in mock_event_bus.events
+            if event.topic == RouteRecord.EVENT_ROUTE_SAVED
+        ]
+
     async def test_update_keylist_x_not_granted(
         self, manager: MediationManager, record: MediationRecord
     ):
@@ -226,6 +333,27 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
         response = await manager.create_keylist_query_response([])
         assert not response.keys
 
+    async def test_get_keylist_paginated(self, session, manager, record):
+        """test_get_keylist_paginated."""
+        keys = [TEST_BASE58_VERKEY, TEST_ROUTE_RECORD_VERKEY, TEST_VERKEY]
+        for key in keys:
+            await RouteRecord(connection_id=TEST_CONN_ID, recipient_key=key).save(
+                session
+            )
+        paginate = KeylistQueryPaginate(limit=2, offset=1)
+        results = await manager.get_keylist(record, paginate)
+        assert len(results) == 2
+        assert {route.recipient_key for route in results} < set(keys)
+
+        response = await manager.create_keylist_query_response(results, paginate)
+        assert len(response.keys) == 2
+        assert response.pagination.limit == 2
+        assert response.pagination.offset == 1
+        assert response.serialize()["pagination"] == {"limit": 2, "offset": 1}
+
+        response = await manager.create_keylist_query_response(results)
+        assert response.pagination is None
+
     async def test_get_set_get_default_mediator(
         self,
         session: ProfileSession,
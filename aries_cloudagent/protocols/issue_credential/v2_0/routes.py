@@ -2,7 +2,7 @@
 
 import logging
 from json.decoder import JSONDecodeError
-from typing import Mapping
+from typing import Mapping, Optional
 
 from aiohttp import web
 from aiohttp_apispec import (
@@ -24,6 +24,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    paginated_response,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID_EXAMPLE,
     INDY_CRED_DEF_ID_VALIDATE,
@@ -61,7 +65,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.UUID(
@@ -515,24 +519,43 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
-    try:
-        async with profile.session() as session:
-            cred_ex_records = await V20CredExRecord.query(
-                session=session,
-                tag_filter=tag_filter,
-                post_filter_positive=post_filter,
-            )
+    async def fetch_page(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                cred_ex_records = await V20CredExRecord.query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                    limit=limit,
+                    offset=offset,
+                )
 
-        results = []
-        for cxr in cred_ex_records:
-            details = await _get_attached_credentials(profile, cxr)
-            result = _format_result_with_details(cxr, details)
-            results.append(result)
+            results = []
+            for cxr in cred_ex_records:
+                details = await _get_attached_credentials(profile, cxr)
+                result = _format_result_with_details(cxr, details)
+                results.append(result)
 
-    except (StorageError, BaseModelError) as err:
-        raise web.HTTPBadRequest(reason=err.roll_up) from err
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
+        return results
+
+    async def iter_results(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                async for cxr in V20CredExRecord.iter_query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                    limit=limit,
+                    offset=offset,
+                ):
+                    details = await _get_attached_credentials(profile, cxr)
+                    yield _format_result_with_details(cxr, details)
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return await paginated_response(request, fetch_page, iter_results=iter_results)
 
 
 @docs(
@@ -1,12 +1,17 @@
+import json
+
 from .....vc.ld_proofs.error import LinkedDataProofException
+from aiohttp.test_utils import make_mocked_request
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
 from .....admin.request_context import AdminRequestContext
+from .....messaging.models import paginated_query
 
 from .. import routes as test_module
 from ..formats.indy.handler import IndyCredFormatHandler
 from ..formats.ld_proof.handler import LDProofCredFormatHandler
 from ..messages.cred_format import V20CredFormat
+from ..models.cred_ex_record import V20CredExRecord
 
 from . import (
     LD_PROOF_VC_DETAIL,
@@ -113,6 +118,37 @@ class TestV20CredRoutes(AsyncTestCase):
                     }
                 )
 
+    async def test_credential_exchange_list_paginated(self):
+        async with self.context.profile.session() as session:
+            cred_ex_ids = []
+            for idx in range(7):
+                cx_rec = V20CredExRecord(connection_id="other" if idx % 3 else "conn")
+                await cx_rec.save(session)
+                if not idx % 3:
+                    cred_ex_ids.append(cx_rec.cred_ex_id)
+        assert len(cred_ex_ids) == 3
+
+        self.request.query = {"connection_id": "conn", "limit": "1", "offset": "1"}
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await test_module.credential_exchange_list(self.request)
+        results = mock_response.call_args[0][0]["results"]
+        assert [r["cred_ex_record"]["cred_ex_id"] for r in results] == cred_ex_ids[1:2]
+
+        request = make_mocked_request(
+            "GET",
+            "/issue-credential-2.0/records?connection_id=conn&offset=1",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        request["context"] = self.context
+        with async_mock.patch.object(paginated_query, "DEFAULT_PAGE_SIZE", 1):
+            await test_module.credential_exchange_list(request)
+        written = [
+            json.loads(call.args[0])
+            for call in request._payload_writer.write.call_args_list
+        ]
+        assert [r["cred_ex_record"]["cred_ex_id"] for r in written] == cred_ex_ids[1:]
+        assert written[0]["indy"] is None
+
     async def test_credential_exchange_list_x(self):
         self.request.query = {
             "thread_id": "dummy",
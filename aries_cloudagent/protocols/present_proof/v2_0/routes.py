@@ -1,7 +1,7 @@
 """Admin routes for presentations."""
 
 import json
-from typing import Mapping, Sequence, Tuple
+from typing import Mapping, Optional, Sequence, Tuple
 
 from aiohttp import web
 from aiohttp_apispec import (
@@ -25,6 +25,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    paginated_response,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL_EXAMPLE,
     INDY_EXTRA_WQL_VALIDATE,
@@ -69,7 +73,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -446,18 +450,36 @@ async def present_proof_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
-    try:
-        async with profile.session() as session:
-            records = await V20PresExRecord.query(
-                session=session,
-                tag_filter=tag_filter,
-                post_filter_positive=post_filter,
-            )
-        results = [record.serialize() for record in records]
-    except (StorageError, BaseModelError) as err:
-        raise web.HTTPBadRequest(reason=err.roll_up) from err
+    async def fetch_page(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                records = await V20PresExRecord.query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                    limit=limit,
+                    offset=offset,
+                )
+            results = [record.serialize() for record in records]
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
+        return results
+
+    async def iter_results(limit: Optional[int], offset: Optional[int]):
+        try:
+            async with profile.session() as session:
+                async for record in V20PresExRecord.iter_query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                    limit=limit,
+                    offset=offset,
+                ):
+                    yield record.serialize()
+        except (StorageError, BaseModelError) as err:
+            raise web.HTTPBadRequest(reason=err.roll_up) from err
 
-    return web.json_response({"results": results})
+    return await paginated_response(request, fetch_page, iter_results=iter_results)
 
 
 @docs(
@@ -1,4 +1,7 @@
+import json
+
 from copy import deepcopy
+from aiohttp.test_utils import make_mocked_request
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 from marshmallow import ValidationError
@@ -10,6 +13,7 @@ from .....indy.holder import IndyHolder
 from .....indy.models.proof_request import IndyProofReqAttrSpecSchema
 from .....indy.verifier import IndyVerifier
 from .....ledger.base import BaseLedger
+from .....messaging.models import paginated_query
 from .....storage.error import StorageNotFoundError
 from .....storage.vc_holder.base import VCHolder
 from .....storage.vc_holder.vc_record import VCRecord
@@ -268,6 +272,38 @@ class TestPresentProofRoutes(AsyncTestCase):
                 {"results": [mock_pres_ex_rec_inst.serialize.return_value]}
             )
 
+    async def test_present_proof_list_paginated(self):
+        async with self.profile.session() as session:
+            pres_ex_ids = []
+            for idx in range(7):
+                pres_ex_rec = V20PresExRecord(
+                    connection_id="other" if idx % 3 else "conn"
+                )
+                await pres_ex_rec.save(session)
+                if not idx % 3:
+                    pres_ex_ids.append(pres_ex_rec.pres_ex_id)
+        assert len(pres_ex_ids) == 3
+
+        self.request.query = {"connection_id": "conn", "limit": "1", "offset": "1"}
+        with async_mock.patch.object(test_module.web, "json_response") as mock_response:
+            await test_module.present_proof_list(self.request)
+        results = mock_response.call_args[0][0]["results"]
+        assert [result["pres_ex_id"] for result in results] == pres_ex_ids[1:2]
+
+        request = make_mocked_request(
+            "GET",
+            "/present-proof-2.0/records?connection_id=conn&offset=1",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        request["context"] = self.context
+        with async_mock.patch.object(paginated_query, "DEFAULT_PAGE_SIZE", 1):
+            await test_module.present_proof_list(request)
+        written = [
+            json.loads(call.args[0])
+            for call in request._payload_writer.write.call_args_list
+        ]
+        assert [result["pres_ex_id"] for result in written] == pres_ex_ids[1:]
+
     async def test_present_proof_list_x(self):
         self.request.query = {
             "thread_id": "thread_id_0",
@@ -1,7 +1,5 @@
 """Handler for incoming forward messages."""
 
-import json
-
 from .....messaging.base_handler import (
     BaseHandler,
     BaseResponder,
@@ -23,12 +21,12 @@ class ForwardHandler(BaseHandler):
 
         if not context.message_receipt.recipient_verkey:
             raise HandlerException("Cannot forward message: unknown recipient")
-        self._logger.info(
+        self._logger.debug(
             "Received forward for: %s", context.message_receipt.recipient_verkey
         )
 
-        packed = context.message.msg
-        packed = json.dumps(packed).encode("ascii")
+        # relay the message as it was received, without encoding it again
+        packed = context.message.relay_payload(context.message_receipt.raw_message)
         rt_mgr = RoutingManager(context.profile)
         target = context.message.to
 
@@ -47,8 +45,8 @@ class ForwardHandler(BaseHandler):
         connection_verkey = connection_targets[0].recipient_keys[0]
 
         # Note: not currently vetting the state of the connection here
-        self._logger.info(
-            f"Forwarding message to connection: {recipient.connection_id}"
+        self._logger.debug(
+            "Forwarding message to connection: %s", recipient.connection_id
         )
 
         send_status = await responder.send(
@@ -66,6 +66,35 @@ class TestForwardHandler(AsyncTestCase):
             assert json.loads(result) == self.context.message.msg
             assert target["connection_id"] == "dummy"
 
+    async def test_handle_relay_raw_message(self):
+        msg = '{"msg":  "sample-message"}'
+        self.context.message_receipt = MessageReceipt(
+            recipient_verkey=TEST_VERKEY,
+            raw_message=f'{{"to": "sample-did", "msg": {msg}}}',
+        )
+        handler = test_module.ForwardHandler()
+
+        responder = MockResponder()
+        with async_mock.patch.object(
+            test_module, "RoutingManager", autospec=True
+        ) as mock_mgr, async_mock.patch.object(
+            test_module, "ConnectionManager", autospec=True
+        ) as mock_connection_mgr:
+            mock_mgr.return_value.get_recipient = async_mock.CoroutineMock(
+                return_value=RouteRecord(connection_id="dummy")
+            )
+            mock_connection_mgr.return_value.get_connection_targets = (
+                async_mock.CoroutineMock(
+                    return_value=[ConnectionTarget(recipient_keys=["recip_key"])]
+                )
+            )
+
+            await handler.handle(self.context, responder)
+
+            (result, target) = responder.messages[0]
+            assert result == msg.encode("utf-8")
+            assert target["connection_id"] == "dummy"
+
     async def test_handle_receipt_no_recipient_verkey(self):
         self.context.message_receipt = MessageReceipt()
         handler = test_module.ForwardHandler()
@@ -12,6 +12,7 @@ from ....storage.error import (
 )
 
 from .models.route_record import RouteRecord
+from .route_index import IndexedRoute, RouteIndex
 
 
 LOGGER = logging.getLogger(__name__)
@@ -56,39 +57,76 @@ class RoutingManager:
         if not recip_verkey:
             raise RoutingManagerError("Must pass non-empty recip_verkey")
 
+        route_index = self._profile.inject_or(RouteIndex)
+        if route_index is not None and not route_index.covers(self._profile):
+            route_index = None
+        if route_index is not None:
+            route = route_index.get(recip_verkey)
+            if route:
+                return self._indexed_record(recip_verkey, route)
+
         i = 0
         record = None
         while not record:
             try:
-                LOGGER.info(">>> fetching routing record for verkey: " + recip_verkey)
+                LOGGER.debug("Fetching routing record for verkey: %s", recip_verkey)
                 async with self._profile.session() as session:
                     record = await RouteRecord.retrieve_by_recipient_key(
                         session, recip_verkey
                     )
-                LOGGER.info(">>> FOUND routing record for verkey: " + recip_verkey)
+                LOGGER.debug("Found routing record for verkey: %s", recip_verkey)
                 return record
             except StorageDuplicateError:
-                LOGGER.info(">>> DUPLICATE routing record for verkey: " + recip_verkey)
+                LOGGER.debug("Duplicate routing record for verkey: %s", recip_verkey)
                 raise RouteNotFoundError(
                     f"More than one route record found with recipient key: {recip_verkey}"
                 )
             except StorageNotFoundError:
-                LOGGER.info(">>> NOT FOUND routing record for verkey: " + recip_verkey)
+                LOGGER.debug("No routing record for verkey: %s", recip_verkey)
                 i += 1
                 if i > RECIP_ROUTE_RETRY:
                     raise RouteNotFoundError(
                         f"No route found with recipient key: {recip_verkey}"
                     )
-                await asyncio.sleep(RECIP_ROUTE_PAUSE)
+                if route_index is None:
+                    await asyncio.sleep(RECIP_ROUTE_PAUSE)
+                    continue
+                # a route being created by this agent is announced when saved,
+                # so wait for it instead of polling storage
+                route = await route_index.wait_for(
+                    recip_verkey, RECIP_ROUTE_PAUSE * RECIP_ROUTE_RETRY
+                )
+                if route:
+                    return self._indexed_record(recip_verkey, route)
+                # check storage a last time for routes saved by other instances
+                i = RECIP_ROUTE_RETRY
+
+    @staticmethod
+    def _indexed_record(recip_verkey: str, route: IndexedRoute) -> RouteRecord:
+        """Create a route record from an indexed route."""
+        return RouteRecord(
+            record_id=route.record_id,
+            role=route.role,
+            connection_id=route.connection_id,
+            wallet_id=route.wallet_id,
+            recipient_key=recip_verkey,
+        )
 
     async def get_routes(
-        self, client_connection_id: str = None, tag_filter: dict = None
+        self,
+        client_connection_id: str = None,
+        tag_filter: dict = None,
+        *,
+        limit: int = None,
+        offset: int = None,
     ) -> Sequence[RouteRecord]:
         """Fetch all routes associated with the current connection.
 
         Args:
             client_connection_id: The ID of the connection record
             tag_filter: An optional dictionary of tag filters
+            limit: The maximum number of routes to return
+            offset: The number of routes to skip
 
         Returns:
             A sequence of route records found by the query
@@ -113,7 +151,9 @@ class RoutingManager:
                     )
 
         async with self._profile.session() as session:
-            results = await RouteRecord.query(session, tag_filter=filters)
+            results = await RouteRecord.query(
+                session, tag_filter=filters, limit=limit, offset=offset
+            )
 
         return results
 
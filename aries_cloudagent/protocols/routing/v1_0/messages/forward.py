@@ -1,17 +1,28 @@
 """Represents a forward message."""
 
 import json
+import re
 
-from typing import Union
+from functools import lru_cache
+from json.decoder import scanstring
+from typing import Optional, Union
+from uuid import uuid4
 
 from marshmallow import EXCLUDE, fields, pre_load
 
 from .....messaging.agent_message import AgentMessage, AgentMessageSchema
+from .....messaging.base_message import DIDCommVersion
+from ....didcomm_prefix import DIDCommPrefix
 
 from ..message_types import FORWARD, PROTOCOL_PACKAGE
 
 HANDLER_CLASS = f"{PROTOCOL_PACKAGE}.handlers.forward_handler.ForwardHandler"
 
+# the members of a forward message which can be read without the schema
+PLAIN_MEMBERS = frozenset(("@type", "@id", "to", "msg"))
+
+JSON_TOKEN = re.compile(r'["{}\[\],]')
+
 
 class Forward(AgentMessage):
     """Represents a request to forward a message to a connected agent."""
@@ -36,6 +47,113 @@ class Forward(AgentMessage):
             msg = json.loads(msg)
         self.msg = msg
 
+    @classmethod
+    def deserialize(
+        cls, value: dict, msg_format: DIDCommVersion = DIDCommVersion.v1, **kwargs
+    ) -> "Forward":
+        """Return a forward message deserialized from a parsed message.
+
+        Forward messages without decorators are read directly rather than
+        through the message schema, as every message relayed by a mediator is
+        one of them.
+        """
+        if (
+            msg_format is DIDCommVersion.v1
+            and not kwargs
+            and value.keys() <= PLAIN_MEMBERS
+            and isinstance(value.get("@id"), str)
+            and isinstance(value.get("to"), str)
+            and isinstance(value.get("msg"), dict)
+        ):
+            return cls(_id=value["@id"], to=value["to"], msg=value["msg"])
+        return super().deserialize(value, msg_format, **kwargs)
+
+    def relay_payload(self, message_json: Union[str, bytes, None] = None) -> bytes:
+        """Get the encoded message to relay to the recipient.
+
+        Args:
+            message_json: The encoded forward message, if available, from which
+                the message is taken as is rather than encoded again
+
+        """
+        if message_json:
+            if not isinstance(message_json, str):
+                message_json = bytes(message_json).decode("utf-8")
+            try:
+                msg = _find_object(message_json, "msg")
+            except ValueError:
+                msg = None
+            if msg:
+                return msg.encode("utf-8")
+        return json.dumps(self.msg).encode("ascii")
+
+    @classmethod
+    def wrap_json(cls, to: str, msg: Union[str, bytes]) -> str:
+        """Serialize a forward message around an already encoded message.
+
+        This is equivalent to `Forward(to=to, msg=msg).to_json()`, but the
+        encoded message is embedded as is instead of being decoded and
+        encoded again.
+
+        Args:
+            to: Recipient DID
+            msg: The encoded message, which must be a JSON object
+
+        """
+        if isinstance(msg, bytes):
+            msg = msg.decode("utf-8")
+        return (
+            f"{_json_template(DIDCommPrefix.qualify_current(FORWARD))}{uuid4()}"
+            f'", "to": {json.dumps(to)}, "msg": {msg}}}'
+        )
+
+
+def _find_object(text: str, name: str) -> Optional[str]:
+    """Find an object member of an encoded JSON object without decoding it.
+
+    Only the strings are scanned, to tell the structure of the document apart
+    from their contents. As when decoding, the last of duplicate members wins.
+    """
+    depth = 0
+    expect_key = False
+    key = start = found = None
+    match = JSON_TOKEN.search(text)
+    while match:
+        pos = match.start()
+        token = text[pos]
+        if token == '"':
+            value, pos = scanstring(text, pos + 1)
+            if depth == 1 and expect_key:
+                key = value
+                expect_key = False
+                if key == name:
+                    found = None
+            match = JSON_TOKEN.search(text, pos)
+            continue
+        if token == "{" or token == "[":
+            depth += 1
+            if depth == 1:
+                expect_key = token == "{"
+            elif depth == 2 and token == "{" and key == name:
+                start = pos
+        elif token == "}" or token == "]":
+            depth -= 1
+            if depth == 1 and start is not None:
+                found = text[start : pos + 1]
+                start = None
+            if depth < 1:
+                return found
+        elif depth == 1:
+            expect_key = True
+        match = JSON_TOKEN.search(text, pos + 1)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _json_template(message_type: str) -> str:
+    """Get the leading part of a forward message serialized to JSON."""
+    return f'{{"@type": {json.dumps(message_type)}, "@id": "'
+
 
 class ForwardSchema(AgentMessageSchema):
     """Forward message schema used in serialization/deserialization."""
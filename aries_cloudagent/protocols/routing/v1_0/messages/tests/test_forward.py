@@ -21,6 +21,19 @@ class TestForward(TestCase):
     def test_type(self):
         assert self.message._type == DIDCommPrefix.qualify_current(FORWARD)
 
+    def test_wrap_json(self):
+        for msg in (json.dumps(self.msg), json.dumps(self.msg).encode("utf-8")):
+            wrapped = json.loads(Forward.wrap_json('to "quoted"', msg))
+            expected = Forward(to='to "quoted"', msg=self.msg).serialize()
+            assert wrapped.pop("@id") != expected.pop("@id")
+            assert wrapped == expected
+
+        with mock.patch.object(DIDCommPrefix, "qualify_current") as mock_qualify:
+            mock_qualify.return_value = "https://didcomm.org/routing/1.0/forward"
+            wrapped = json.loads(Forward.wrap_json(self.to, json.dumps(self.msg)))
+            assert wrapped["@type"] == "https://didcomm.org/routing/1.0/forward"
+        assert Forward.deserialize(wrapped).msg == self.msg
+
     @mock.patch(f"{PROTOCOL_PACKAGE}.messages.forward.ForwardSchema.load")
     def test_deserialize(self, message_schema_load):
         obj = {"obj": "obj"}
@@ -30,6 +43,50 @@ class TestForward(TestCase):
 
         assert message is message_schema_load.return_value
 
+    @mock.patch(f"{PROTOCOL_PACKAGE}.messages.forward.ForwardSchema.load")
+    def test_deserialize_plain(self, message_schema_load):
+        data = self.message.serialize()
+
+        message = Forward.deserialize(data)
+        message_schema_load.assert_not_called()
+        assert message._id == data["@id"]
+        assert message.to == self.to
+        assert message.msg == self.msg
+        assert message.serialize() == data
+
+        data["~thread"] = {"thid": "thread-id"}
+        Forward.deserialize(data)
+        message_schema_load.assert_called_once_with(data)
+
+    def test_relay_payload(self):
+        msg = '{"protected": "a\\"}{", "iv": "[msg]", "x": [{"msg": {}}]}'
+        message_json = (
+            '{"@type": "forward", "~transport": {"msg": {"y": 1}}, '
+            f'"to": "msg", "msg":{msg} , "@id": "}}"}}'
+        )
+        message = Forward.deserialize(json.loads(message_json))
+        for raw in (message_json, message_json.encode("utf-8")):
+            assert message.relay_payload(raw) == msg.encode("utf-8")
+
+        assert json.loads(message.relay_payload()) == message.msg
+        for raw in ('{"msg": "string"}', '["msg", {}]', '{"msg": {"a": "'):
+            assert json.loads(message.relay_payload(raw)) == message.msg
+
+    def test_relay_payload_duplicate_msg(self):
+        message_json = (
+            '{"@type": "forward", "msg": {"a": 1}, "to": "to", "msg": {"b": 2}}'
+        )
+        message = Forward.deserialize(json.loads(message_json))
+        assert message.msg == {"b": 2}
+        assert message.relay_payload(message_json) == b'{"b": 2}'
+
+        message_json = (
+            '{"@type": "forward", "to": "to", "msg": {"a": 1}, "msg": "{\\"b\\": 2}"}'
+        )
+        message = Forward.deserialize(json.loads(message_json))
+        assert message.msg == {"b": 2}
+        assert json.loads(message.relay_payload(message_json)) == {"b": 2}
+
     @mock.patch(f"{PROTOCOL_PACKAGE}.messages.forward.ForwardSchema.dump")
     def test_serialize(self, message_schema_dump):
         message_dict = self.message.serialize()
@@ -1,6 +1,8 @@
 """An object for containing information on an individual route."""
 
 
+from typing import Optional, Sequence
+
 from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
 
 from .....core.profile import ProfileSession
@@ -20,6 +22,8 @@ class RouteRecord(BaseRecord):
     ROLE_CLIENT = "client"
     ROLE_SERVER = "server"
     TAG_NAMES = {"connection_id", "role", "recipient_key", "wallet_id"}
+    EVENT_ROUTE_SAVED = "acapy::route::saved"
+    EVENT_ROUTE_DELETED = "acapy::route::deleted"
 
     def __init__(
         self,
@@ -29,7 +33,7 @@ class RouteRecord(BaseRecord):
         connection_id: str = None,
         wallet_id: str = None,
         recipient_key: str = None,
-        **kwargs
+        **kwargs,
     ):
         """Initialize route record.
 
@@ -96,6 +100,71 @@ class RouteRecord(BaseRecord):
         tag_filter = {"connection_id": connection_id}
         return await cls.retrieve_by_tag_filter(session, tag_filter)
 
+    @property
+    def route_info(self) -> dict:
+        """Accessor for the route details sent with route events."""
+        return {
+            "record_id": self.record_id,
+            "role": self.role,
+            "connection_id": self.connection_id,
+            "wallet_id": self.wallet_id,
+            "recipient_key": self.recipient_key,
+        }
+
+    async def post_save(
+        self,
+        session: ProfileSession,
+        new_record: bool,
+        last_state: Optional[str],
+        event: bool = None,
+    ):
+        """Perform post-save actions, announcing the saved route once stored."""
+        await super().post_save(session, new_record, last_state, event)
+        if event is not False:
+            await session.notify_committed(
+                self.EVENT_ROUTE_SAVED, {"routes": [self.route_info]}
+            )
+
+    @classmethod
+    async def save_all(
+        cls,
+        session: ProfileSession,
+        records: Sequence["RouteRecord"],
+        *,
+        reason: str = None,
+        log_override: bool = False,
+        event: bool = None,
+    ) -> Sequence[str]:
+        """Persist several routes, announcing them together once stored."""
+        record_ids = await super().save_all(
+            session, records, reason=reason, log_override=log_override, event=False
+        )
+        if records and event is not False:
+            await session.notify_committed(
+                cls.EVENT_ROUTE_SAVED,
+                {"routes": [record.route_info for record in records]},
+            )
+        return record_ids
+
+    async def delete_record(self, session: ProfileSession):
+        """Remove the stored record, announcing the deleted route once removed."""
+        route_info = self.route_info
+        await super().delete_record(session)
+        if route_info["record_id"]:
+            await session.notify_committed(
+                self.EVENT_ROUTE_DELETED, {"routes": [route_info]}
+            )
+
+    @classmethod
+    async def delete_all(
+        cls, session: ProfileSession, records: Sequence["RouteRecord"]
+    ):
+        """Remove several stored routes, announcing them together once deleted."""
+        routes = [record.route_info for record in records if record.record_id]
+        await super().delete_all(session, records)
+        if routes:
+            await session.notify_committed(cls.EVENT_ROUTE_DELETED, {"routes": routes})
+
     @property
     def record_value(self) -> dict:
         """Accessor for JSON record value."""
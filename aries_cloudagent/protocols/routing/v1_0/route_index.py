@@ -0,0 +1,199 @@
+"""In-memory index of the routes held by the base wallet."""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from ....core.event_bus import Event, EventBus
+from ....core.profile import Profile
+from ....storage.base import BaseStorageSearch
+
+from .models.route_record import RouteRecord
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IndexedRoute(NamedTuple):
+    """The parts of a route record needed to deliver a message."""
+
+    record_id: str
+    role: str
+    connection_id: Optional[str]
+    wallet_id: Optional[str]
+
+
+class RouteIndex:
+    """Index of the route records of the base wallet by recipient key.
+
+    The index is loaded once at startup and then kept up to date as route
+    records are saved and deleted, so resolving the recipient of an inbound
+    message does not need a storage query. Only the routes of the base wallet
+    are indexed: the routes stored by subwallets are still looked up in
+    storage, as are recipient keys missing from the index, which may have
+    been added by another agent instance sharing the storage.
+    """
+
+    PAGE_SIZE = 1000
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # None marks a recipient key with several routes, left to storage
+        self._routes: Dict[str, Optional[IndexedRoute]] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed recipient keys."""
+        return len(self._routes)
+
+    @staticmethod
+    def covers(profile: Profile) -> bool:
+        """Check whether the routes stored by a profile are indexed."""
+        return not profile.settings.get("wallet.id")
+
+    async def load(self, profile: Profile) -> int:
+        """Index all of the route records stored by the base wallet.
+
+        Returns:
+            The number of route records read
+
+        """
+        count = 0
+        async with profile.session() as session:
+            search = session.inject(BaseStorageSearch).search_records(
+                RouteRecord.RECORD_TYPE, None, self.PAGE_SIZE
+            )
+            try:
+                while True:
+                    rows = await search.fetch(self.PAGE_SIZE)
+                    for row in rows:
+                        value = json.loads(row.value)
+                        self._add(
+                            value.get("recipient_key"),
+                            IndexedRoute(
+                                row.id,
+                                value.get("role") or RouteRecord.ROLE_SERVER,
+                                value.get("connection_id"),
+                                value.get("wallet_id"),
+                            ),
+                        )
+                    count += len(rows)
+                    if len(rows) < self.PAGE_SIZE:
+                        break
+            finally:
+                await search.close()
+        LOGGER.info("Indexed %d routes", count)
+        return count
+
+    def _add(self, recipient_key: str, route: IndexedRoute):
+        """Add a route to the index."""
+        if not recipient_key:
+            return
+        current = self._routes.get(recipient_key, route)
+        if current and current.record_id == route.record_id:
+            self._routes[recipient_key] = route
+        else:
+            self._routes[recipient_key] = None
+
+    def subscribe(self, event_bus: EventBus):
+        """Follow the route record events to keep the index up to date."""
+        event_bus.subscribe(
+            re.compile(f"^{re.escape(RouteRecord.EVENT_ROUTE_SAVED)}$"),
+            self.route_saved,
+        )
+        event_bus.subscribe(
+            re.compile(f"^{re.escape(RouteRecord.EVENT_ROUTE_DELETED)}$"),
+            self.route_deleted,
+        )
+
+    async def route_saved(self, profile: Profile, event: Event):
+        """Add or update the saved route records."""
+        if not self.covers(profile):
+            return
+        for route in event.payload["routes"]:
+            recipient_key = route["recipient_key"]
+            self._add(
+                recipient_key,
+                IndexedRoute(
+                    route["record_id"],
+                    route["role"],
+                    route["connection_id"],
+                    route["wallet_id"],
+                ),
+            )
+            for waiter in self._waiters.pop(recipient_key, ()):
+                if not waiter.done():
+                    waiter.set_result(self._routes.get(recipient_key))
+
+    async def route_deleted(self, profile: Profile, event: Event):
+        """Remove the deleted route records, or all of the routes to a subwallet."""
+        if not self.covers(profile):
+            return
+        for route in event.payload.get("routes", ()):
+            current = self._routes.get(route["recipient_key"])
+            if current is None or current.record_id == route["record_id"]:
+                self._routes.pop(route["recipient_key"], None)
+        wallet_id = event.payload.get("wallet_id")
+        if wallet_id:
+            for key in [
+                key
+                for key, current in self._routes.items()
+                if current and current.wallet_id == wallet_id
+            ]:
+                del self._routes[key]
+
+    def remove_key(self, recipient_key: str):
+        """Drop the route for a recipient key, found to be out of date."""
+        self._routes.pop(recipient_key, None)
+
+    async def wait_for(
+        self, recipient_key: str, timeout: float
+    ) -> Optional[IndexedRoute]:
+        """Wait for a route to a recipient key to be saved by this agent.
+
+        Args:
+            recipient_key: The recipient key
+            timeout: The maximum time to wait, in seconds
+
+        Returns:
+            The indexed route, or None if no single route was saved in time
+
+        """
+        route = self._routes.get(recipient_key)
+        if route:
+            return route
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.setdefault(recipient_key, []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(recipient_key)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[recipient_key]
+
+    def get(self, recipient_key: str) -> Optional[IndexedRoute]:
+        """Get the indexed route for a recipient key, if any."""
+        route = self._routes.get(recipient_key)
+        if route:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return route
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the index usage counters."""
+        lookups = self.hits + self.misses
+        return {
+            "routes": len(self._routes),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
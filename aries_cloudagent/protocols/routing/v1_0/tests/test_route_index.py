@@ -0,0 +1,152 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from .....core.event_bus import EventBus
+from .....core.in_memory import InMemoryProfile
+
+from .. import manager as test_module
+from ..manager import RouteNotFoundError, RoutingManager
+from ..models.route_record import RouteRecord
+from ..route_index import IndexedRoute, RouteIndex
+
+TEST_CONN_ID = "conn-id"
+TEST_WALLET_ID = "wallet-id"
+TEST_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+TEST_ROUTE_VERKEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+
+
+class TestRouteIndex(AsyncTestCase):
+    async def setUp(self):
+        self.route_index = RouteIndex()
+        event_bus = EventBus()
+        self.route_index.subscribe(event_bus)
+        self.profile = InMemoryProfile.test_profile(bind={EventBus: event_bus})
+        self.profile.context.injector.bind_instance(RouteIndex, self.route_index)
+
+    async def test_load(self):
+        route = RouteRecord(connection_id=TEST_CONN_ID, recipient_key=TEST_VERKEY)
+        async with self.profile.session() as session:
+            await route.save(session)
+
+        route_index = RouteIndex()
+        assert await route_index.load(self.profile) == 1
+        assert route_index.get(TEST_VERKEY) == IndexedRoute(
+            route.record_id, RouteRecord.ROLE_SERVER, TEST_CONN_ID, None
+        )
+        assert route_index.get(TEST_ROUTE_VERKEY) is None
+        assert route_index.stats == {
+            "routes": 1,
+            "hits": 1,
+            "misses": 1,
+            "hit_ratio": 0.5,
+        }
+
+    async def test_route_events(self):
+        route = RouteRecord(wallet_id=TEST_WALLET_ID, recipient_key=TEST_VERKEY)
+        async with self.profile.session() as session:
+            await route.save(session)
+            assert self.route_index.get(TEST_VERKEY).wallet_id == TEST_WALLET_ID
+
+            await route.delete_record(session)
+            assert self.route_index.get(TEST_VERKEY) is None
+
+    async def test_route_events_batch(self):
+        routes = [
+            RouteRecord(connection_id=TEST_CONN_ID, recipient_key=key)
+            for key in (TEST_VERKEY, TEST_ROUTE_VERKEY)
+        ]
+        async with self.profile.session() as session:
+            await RouteRecord.save_all(session, routes)
+            assert len(self.route_index) == 2
+            assert self.route_index.get(TEST_ROUTE_VERKEY).record_id == (
+                routes[1].record_id
+            )
+
+            await RouteRecord.delete_all(session, routes)
+            assert len(self.route_index) == 0
+
+    async def test_route_events_duplicate(self):
+        async with self.profile.session() as session:
+            for connection_id in ("conn-1", "conn-2"):
+                await RouteRecord(
+                    connection_id=connection_id, recipient_key=TEST_VERKEY
+                ).save(session)
+        assert len(self.route_index) == 1
+        assert self.route_index.get(TEST_VERKEY) is None
+
+    async def test_route_events_remove_wallet(self):
+        async with self.profile.session() as session:
+            for key in (TEST_VERKEY, TEST_ROUTE_VERKEY):
+                await RouteRecord(wallet_id=TEST_WALLET_ID, recipient_key=key).save(
+                    session
+                )
+        assert len(self.route_index) == 2
+
+        await self.profile.notify(
+            RouteRecord.EVENT_ROUTE_DELETED, {"wallet_id": TEST_WALLET_ID}
+        )
+        assert len(self.route_index) == 0
+
+    async def test_route_events_subwallet(self):
+        subwallet_profile = InMemoryProfile.test_profile(
+            {"wallet.id": TEST_WALLET_ID},
+            bind={EventBus: self.profile.inject(EventBus)},
+        )
+        async with subwallet_profile.session() as session:
+            await RouteRecord(
+                connection_id=TEST_CONN_ID, recipient_key=TEST_VERKEY
+            ).save(session)
+        assert len(self.route_index) == 0
+
+    async def test_get_recipient(self):
+        manager = RoutingManager(self.profile)
+        route = await manager.create_route_record(TEST_CONN_ID, TEST_VERKEY)
+
+        with async_mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            recipient = await manager.get_recipient(TEST_VERKEY)
+            mock_retrieve.assert_not_called()
+        assert recipient.record_id == route.record_id
+        assert recipient.connection_id == TEST_CONN_ID
+        assert recipient.recipient_key == TEST_VERKEY
+
+    async def test_wait_for(self):
+        route = RouteRecord(connection_id=TEST_CONN_ID, recipient_key=TEST_VERKEY)
+        waiter = asyncio.ensure_future(self.route_index.wait_for(TEST_VERKEY, 5))
+        await asyncio.sleep(0)
+        async with self.profile.session() as session:
+            await route.save(session)
+        assert (await waiter).record_id == route.record_id
+        assert await self.route_index.wait_for(TEST_VERKEY, 5) == await waiter
+
+        assert await self.route_index.wait_for(TEST_ROUTE_VERKEY, 0.01) is None
+        assert not self.route_index._waiters
+
+    async def test_get_recipient_wait(self):
+        manager = RoutingManager(self.profile)
+        recipient = asyncio.ensure_future(manager.get_recipient(TEST_VERKEY))
+        await asyncio.sleep(0.01)
+        assert not recipient.done()
+
+        with async_mock.patch.object(
+            test_module.asyncio, "sleep", async_mock.CoroutineMock()
+        ) as mock_sleep:
+            route = await manager.create_route_record(TEST_CONN_ID, TEST_VERKEY)
+            assert (await recipient).record_id == route.record_id
+            mock_sleep.assert_not_called()
+
+    async def test_get_recipient_not_found(self):
+        manager = RoutingManager(self.profile)
+        with async_mock.patch.object(
+            test_module, "RECIP_ROUTE_PAUSE", 0.001
+        ), async_mock.patch.object(
+            RouteRecord,
+            "retrieve_by_recipient_key",
+            async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError()),
+        ) as mock_retrieve:
+            with self.assertRaises(RouteNotFoundError):
+                await manager.get_recipient(TEST_VERKEY)
+        assert mock_retrieve.call_count == 2
@@ -6,6 +6,7 @@ import os
 import re
 import shutil
 from asyncio import shield
+from typing import Optional
 
 from aiohttp import web
 from aiohttp_apispec import (
@@ -30,6 +31,10 @@ from ..ledger.multiple_ledger.base_manager import BaseMultipleLedgerManager
 from ..messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from ..messaging.models.base import BaseModelError
 from ..messaging.models.openapi import OpenAPISchema
+from ..messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    paginated_response,
+)
 from ..messaging.responder import BaseResponder
 from ..messaging.valid import (
     INDY_CRED_DEF_ID_EXAMPLE,
@@ -415,7 +420,7 @@ class RevRegUpdateTailsFileUriSchema(OpenAPISchema):
     )
 
 
-class RevRegsCreatedQueryStringSchema(OpenAPISchema):
+class RevRegsCreatedQueryStringSchema(PaginatedQuerySchema):
     """Query string parameters and validators for rev regs created request."""
 
     cred_def_id = fields.Str(
@@ -701,23 +706,41 @@ async def rev_regs_created(request: web.BaseRequest):
     """
     context: AdminRequestContext = request["context"]
 
-    search_tags = list(vars(RevRegsCreatedQueryStringSchema)["_declared_fields"])
+    search_tags = [
+        tag
+        for tag in vars(RevRegsCreatedQueryStringSchema)["_declared_fields"]
+        if tag not in vars(PaginatedQuerySchema)["_declared_fields"]
+    ]
     tag_filter = {
         tag: request.query[tag] for tag in search_tags if tag in request.query
     }
-    async with context.profile.session() as session:
-        found = await IssuerRevRegRecord.query(
-            session,
-            tag_filter,
-            post_filter_negative={"state": IssuerRevRegRecord.STATE_INIT},
-        )
 
-    return web.json_response(
-        {
-            "rev_reg_ids": [
-                record.revoc_reg_id for record in found if record.revoc_reg_id
-            ]
-        }
+    # with alt, a negative post-filter also requires each field to be set, which
+    # leaves out the registries not yet assigned an identifier
+    query_args = {
+        "post_filter_negative": {
+            "state": (IssuerRevRegRecord.STATE_INIT,),
+            "revoc_reg_id": (None,),
+        },
+        "alt": True,
+    }
+
+    async def fetch_page(limit: Optional[int], offset: Optional[int]):
+        async with context.profile.session() as session:
+            found = await IssuerRevRegRecord.query(
+                session, tag_filter, **query_args, limit=limit, offset=offset
+            )
+        return [record.revoc_reg_id for record in found]
+
+    async def iter_results(limit: Optional[int], offset: Optional[int]):
+        async with context.profile.session() as session:
+            async for record in IssuerRevRegRecord.iter_query(
+                session, tag_filter, **query_args, limit=limit, offset=offset
+            ):
+                yield record.revoc_reg_id
+
+    return await paginated_response(
+        request, fetch_page, results_key="rev_reg_ids", iter_results=iter_results
     )
 
 
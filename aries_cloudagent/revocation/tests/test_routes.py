@@ -1,7 +1,9 @@
+import json
 import os
 import shutil
 import unittest
 
+from aiohttp.test_utils import make_mocked_request
 from aiohttp.web import HTTPBadRequest, HTTPNotFound
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
@@ -296,6 +298,49 @@ class TestRevocationRoutes(AsyncTestCase):
             mock_json_response.assert_called_once_with({"rev_reg_ids": ["dummy"]})
             assert result is mock_json_response.return_value
 
+    async def test_rev_regs_created_paginated(self):
+        rev_reg_ids = []
+        async with self.profile.session() as session:
+            for idx in range(130):
+                # every tenth registry has no identifier yet, or is still in init
+                revoc_reg_id = None if idx % 10 == 3 else f"rev-reg-{idx}"
+                state = (
+                    test_module.IssuerRevRegRecord.STATE_INIT
+                    if idx % 10 == 7
+                    else test_module.IssuerRevRegRecord.STATE_ACTIVE
+                )
+                await test_module.IssuerRevRegRecord(
+                    cred_def_id="cred-def-id", revoc_reg_id=revoc_reg_id, state=state
+                ).save(session)
+                if revoc_reg_id and state != test_module.IssuerRevRegRecord.STATE_INIT:
+                    rev_reg_ids.append(revoc_reg_id)
+        assert len(rev_reg_ids) == 104
+
+        self.request.query = {
+            "cred_def_id": "cred-def-id",
+            "limit": "10",
+            "offset": "98",
+        }
+        with async_mock.patch.object(
+            test_module.web, "json_response", async_mock.Mock()
+        ) as mock_json_response:
+            await test_module.rev_regs_created(self.request)
+        mock_json_response.assert_called_once_with({"rev_reg_ids": rev_reg_ids[98:]})
+
+        request = make_mocked_request(
+            "GET",
+            "/revocation/registries/created?cred_def_id=cred-def-id",
+            headers={"Accept": "application/x-ndjson"},
+        )
+        request["context"] = self.context
+        await test_module.rev_regs_created(request)
+        written = b"".join(
+            call.args[0] for call in request._payload_writer.write.call_args_list
+        )
+        assert [
+            json.loads(line) for line in written.decode("utf-8").splitlines()
+        ] == rev_reg_ids
+
     async def test_get_rev_reg(self):
         REV_REG_ID = "{}:4:{}:3:CL:1234:default:CL_ACCUM:default".format(
             self.test_did, self.test_did
@@ -1,6 +1,6 @@
 """Aries-Askar implementation of BaseStorage interface."""
 
-from typing import Mapping, Sequence
+from typing import Awaitable, Callable, Mapping, Sequence
 
 from aries_askar import AskarError, AskarErrorCode, Session
 
@@ -140,6 +140,108 @@ class AskarStorage(BaseStorage):
             else:
                 raise StorageError("Error when removing storage record") from err
 
+    async def _batch(self, operations: Callable[[Session], Awaitable[None]]):
+        """Perform a batch of operations in a single transaction.
+
+        If the current session is a transaction, the operations are committed
+        along with it. Otherwise a new transaction is opened and committed once
+        all operations have succeeded.
+        """
+        if self._session.is_transaction:
+            await operations(self._session.handle)
+            return
+        profile = self._session.profile
+        try:
+            async with profile.store.transaction(profile.profile_id) as txn:
+                await operations(txn)
+                await txn.commit()
+        except AskarError as err:
+            raise StorageError("Error when committing storage records") from err
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """Add several new records to the store in a single transaction.
+
+        Args:
+            records: The `StorageRecord` instances to be stored
+
+        Raises:
+            StorageDuplicateError: If a record is already present
+
+        """
+        for record in records:
+            validate_record(record)
+
+        async def insert(handle: Session):
+            for record in records:
+                try:
+                    await handle.insert(
+                        record.type, record.id, record.value, record.tags
+                    )
+                except AskarError as err:
+                    if err.code == AskarErrorCode.DUPLICATE:
+                        raise StorageDuplicateError(
+                            f"Duplicate record: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError("Error when adding storage record") from err
+
+        await self._batch(insert)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """Update the values and tags of several records in a single transaction.
+
+        Args:
+            records: The `StorageRecord` instances holding the new values and tags
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record)
+
+        async def replace(handle: Session):
+            for record in records:
+                try:
+                    await handle.replace(
+                        record.type, record.id, record.value, record.tags
+                    )
+                except AskarError as err:
+                    if err.code == AskarErrorCode.NOT_FOUND:
+                        raise StorageNotFoundError(
+                            f"Record not found: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError(
+                        "Error when updating storage record value"
+                    ) from err
+
+        await self._batch(replace)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """Delete several records in a single transaction.
+
+        Args:
+            records: The `StorageRecord` instances to delete
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+
+        async def remove(handle: Session):
+            for record in records:
+                try:
+                    await handle.remove(record.type, record.id)
+                except AskarError as err:
+                    if err.code == AskarErrorCode.NOT_FOUND:
+                        raise StorageNotFoundError(
+                            f"Record not found: {record.type}/{record.id}"
+                        ) from None
+                    raise StorageError("Error when removing storage record") from err
+
+        await self._batch(remove)
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping, options: Mapping = None
     ) -> StorageRecord:
@@ -191,6 +293,38 @@ class AskarStorage(BaseStorage):
             )
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        The page is read through a store scan, outside of any open transaction.
+        """
+        results = []
+        try:
+            async for row in self._session.profile.store.scan(
+                type_filter,
+                tag_query,
+                offset=offset,
+                limit=limit,
+                profile=self._session.profile.settings.get("wallet.askar_profile"),
+            ):
+                results.append(
+                    StorageRecord(
+                        type=row.category,
+                        id=row.name,
+                        value=None if row.value is None else row.value.decode("utf-8"),
+                        tags=row.tags,
+                    )
+                )
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+        return results
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -70,6 +70,42 @@ class BaseStorage(ABC):
 
         """
 
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """Add several new records to the store.
+
+        Backends supporting transactions add all of the records atomically.
+
+        Args:
+            records: The `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            await self.add_record(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """Update the values and tags of several existing stored records.
+
+        Backends supporting transactions update all of the records atomically.
+
+        Args:
+            records: The `StorageRecord` instances holding the new values and tags
+
+        """
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """Delete several existing records.
+
+        Backends supporting transactions delete all of the records atomically.
+
+        Args:
+            records: The `StorageRecord` instances to delete
+
+        """
+        for record in records:
+            await self.delete_record(record)
+
     async def find_record(
         self, type_filter: str, tag_query: Mapping = None, options: Mapping = None
     ) -> StorageRecord:
@@ -98,6 +134,28 @@ class BaseStorage(ABC):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
+
+        Returns:
+            A list of `StorageRecord` instances
+
+        """
+        rows = await self.find_all_records(type_filter, tag_query)
+        return rows[offset : offset + limit]
+
     @abstractmethod
     async def delete_all_records(
         self,
@@ -1,6 +1,6 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from ..core.in_memory import InMemoryProfile
 
@@ -46,6 +46,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         if record.id in self.profile.records:
             raise StorageDuplicateError("Duplicate record")
         self.profile.records[record.id] = record
+        self.profile.record_index.add(record)
 
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
@@ -85,7 +86,9 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         oldrec = self.profile.records.get(record.id)
         if not oldrec:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        self.profile.records[record.id] = oldrec._replace(value=value, tags=tags)
+        newrec = oldrec._replace(value=value, tags=tags)
+        self.profile.records[record.id] = newrec
+        self.profile.record_index.update(oldrec, newrec)
 
     async def delete_record(self, record: StorageRecord):
         """Delete a record.
@@ -100,7 +103,72 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         validate_record(record, delete=True)
         if record.id not in self.profile.records:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        del self.profile.records[record.id]
+        self.profile.record_index.remove(self.profile.records.pop(record.id))
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """Add several new records to the store.
+
+        No records are added if any of them is invalid or already present.
+
+        Args:
+            records: The `StorageRecord` instances to be stored
+
+        Raises:
+            StorageDuplicateError: If a record is already present
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record)
+            if record.id in self.profile.records or record.id in ids:
+                raise StorageDuplicateError("Duplicate record")
+            ids.add(record.id)
+        for record in records:
+            self.profile.records[record.id] = record
+            self.profile.record_index.add(record)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """Update the values and tags of several existing stored records.
+
+        No records are updated if any of them is invalid or not found.
+
+        Args:
+            records: The `StorageRecord` instances holding the new values and tags
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record in records:
+            oldrec = self.profile.records[record.id]
+            newrec = oldrec._replace(value=record.value, tags=record.tags)
+            self.profile.records[record.id] = newrec
+            self.profile.record_index.update(oldrec, newrec)
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """Delete several existing records.
+
+        No records are deleted if any of them is invalid or not found.
+
+        Args:
+            records: The `StorageRecord` instances to delete
+
+        Raises:
+            StorageNotFoundError: If a record is not found
+
+        """
+        for record in records:
+            validate_record(record, delete=True)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record in records:
+            oldrec = self.profile.records.pop(record.id, None)
+            if oldrec:
+                self.profile.record_index.remove(oldrec)
 
     async def find_all_records(
         self,
@@ -109,11 +177,24 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         options: Mapping = None,
     ):
         """Retrieve all records matching a particular type filter and tag query."""
-        results = []
-        for record in self.profile.records.values():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                results.append(record)
-        return results
+        return [
+            self.profile.records[record_id]
+            for record_id in find_record_ids(self.profile, type_filter, tag_query)
+        ]
+
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query."""
+        record_ids = find_record_ids(self.profile, type_filter, tag_query)
+        return [
+            self.profile.records[record_id]
+            for record_id in record_ids[offset : offset + limit]
+        ]
 
     async def delete_all_records(
         self,
@@ -121,12 +202,8 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
-        ids = []
-        for record_id, record in self.profile.records.items():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                ids.append(record_id)
-        for record_id in ids:
-            del self.profile.records[record_id]
+        for record_id in find_record_ids(self.profile, type_filter, tag_query):
+            self.profile.record_index.remove(self.profile.records.pop(record_id))
 
     def search_records(
         self,
@@ -213,6 +290,8 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
                 if not isinstance(v, dict):
                     raise StorageSearchError("Expected dict for $not filter value")
                 chk = not tag_query_match(tags, v)
+            elif k == "$exist":
+                chk = all(tags.get(name) is not None for name in exist_names(v))
             elif k[0] == "$":
                 raise StorageSearchError("Unexpected filter operator: {}".format(k))
             elif isinstance(v, str):
@@ -229,6 +308,217 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
     return result
 
 
+def exist_names(value: Any) -> Sequence[str]:
+    """Get the tag names from the value of an `$exist` filter."""
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise StorageSearchError("Expected string or list for $exist filter value")
+    return value
+
+
+RANGE_OPERATORS = {
+    "$gt": float.__gt__,
+    "$gte": float.__ge__,
+    "$lt": float.__lt__,
+    "$lte": float.__le__,
+}
+
+
+class InMemoryTagIndex:
+    """Inverted index of in-memory storage records by type and tag value.
+
+    Tag queries are evaluated with set operations over the matching record
+    identifiers, so the cost of a query depends on the number of records
+    holding the queried tags rather than on the total number of records.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._seq = 0
+        # record id -> insertion sequence number, to return results in order
+        self._order: Dict[str, int] = {}
+        # record type -> record ids, in insertion order
+        self._types: Dict[str, Dict[str, None]] = {}
+        # (record type, tag name) -> tag value -> record ids
+        self._values: Dict[Tuple[str, str], Dict[Any, Set[str]]] = {}
+        # (record type, tag name) -> ids of records having the tag
+        self._present: Dict[Tuple[str, str], Set[str]] = {}
+
+    def _index_tags(self, record: StorageRecord):
+        for name, value in (record.tags or {}).items():
+            if value is None:
+                continue
+            key = (record.type, name)
+            self._present.setdefault(key, set()).add(record.id)
+            try:
+                self._values.setdefault(key, {}).setdefault(value, set()).add(record.id)
+            except TypeError:
+                pass  # unhashable tag values can only be matched by a scan
+
+    def _unindex_tags(self, record: StorageRecord):
+        for name, value in (record.tags or {}).items():
+            if value is None:
+                continue
+            key = (record.type, name)
+            present = self._present.get(key)
+            if present is not None:
+                present.discard(record.id)
+                if not present:
+                    del self._present[key]
+            values = self._values.get(key)
+            try:
+                ids = values and values.get(value)
+            except TypeError:
+                ids = None
+            if ids:
+                ids.discard(record.id)
+                if not ids:
+                    del values[value]
+                    if not values:
+                        del self._values[key]
+
+    def add(self, record: StorageRecord):
+        """Add a new record to the index."""
+        self._seq += 1
+        self._order[record.id] = self._seq
+        self._types.setdefault(record.type, {})[record.id] = None
+        self._index_tags(record)
+
+    def update(self, old: StorageRecord, new: StorageRecord):
+        """Replace the indexed tags of a record, retaining its position."""
+        self._unindex_tags(old)
+        self._index_tags(new)
+
+    def remove(self, record: StorageRecord):
+        """Remove a record from the index."""
+        self._unindex_tags(record)
+        self._order.pop(record.id, None)
+        ids = self._types.get(record.type)
+        if ids is not None:
+            ids.pop(record.id, None)
+            if not ids:
+                del self._types[record.type]
+
+    def search(self, type_filter: str, tag_query: Mapping = None) -> List[str]:
+        """Find the identifiers of records matching a type and tag query.
+
+        Returns:
+            The matching record identifiers, in insertion order
+
+        Raises:
+            StorageSearchError: If the tag query cannot be evaluated
+
+        """
+        type_ids = self._types.get(type_filter)
+        if not type_ids:
+            return []
+        if not tag_query:
+            return list(type_ids)
+        matched = self._evaluate(type_filter, tag_query, type_ids.keys())
+        if len(matched) * 8 < len(type_ids):
+            return sorted(matched, key=self._order.__getitem__)
+        return [record_id for record_id in type_ids if record_id in matched]
+
+    def _evaluate(self, type_filter: str, tag_query: Mapping, universe) -> Set[str]:
+        """Get the set of record identifiers matching a tag query."""
+        result = None
+        for k, v in tag_query.items():
+            if k == "$or":
+                if not isinstance(v, list):
+                    raise StorageSearchError("Expected list for $or filter value")
+                found = set()
+                for opt in v:
+                    found |= self._evaluate(type_filter, opt, universe)
+            elif k == "$and":
+                if not isinstance(v, list):
+                    raise StorageSearchError("Expected list for $and filter value")
+                found = universe
+                for opt in v:
+                    found = found & self._evaluate(type_filter, opt, universe)
+                    if not found:
+                        break
+            elif k == "$not":
+                if not isinstance(v, dict):
+                    raise StorageSearchError("Expected dict for $not filter value")
+                found = universe - self._evaluate(type_filter, v, universe)
+            elif k == "$exist":
+                found = universe
+                for name in exist_names(v):
+                    found = found & self._present.get((type_filter, name), set())
+            elif k[0] == "$":
+                raise StorageSearchError("Unexpected filter operator: {}".format(k))
+            elif isinstance(v, str):
+                found = self._values.get((type_filter, k), {}).get(v, set())
+            elif isinstance(v, dict):
+                found = self._evaluate_value(type_filter, k, v)
+            else:
+                raise StorageSearchError(
+                    "Expected string or dict for filter value, got {}".format(v)
+                )
+            result = found if result is None else result & found
+            if not result:
+                return set()
+        return set(universe) if result is None else set(result)
+
+    def _evaluate_value(self, type_filter: str, name: str, match: dict) -> Set[str]:
+        """Get the set of record identifiers matching a tag subquery."""
+        if len(match) != 1:
+            raise StorageSearchError("Unsupported subquery: {}".format(match))
+        ((op, cmp_val),) = match.items()
+        values = self._values.get((type_filter, name), {})
+        found = set()
+        if op == "$in":
+            if not isinstance(cmp_val, list):
+                raise StorageSearchError("Expected list for $in value")
+            for value in cmp_val:
+                try:
+                    found |= values.get(value, set())
+                except TypeError as err:
+                    raise StorageSearchError(
+                        f"Unhashable value for $in filter: {value}"
+                    ) from err
+        elif not isinstance(cmp_val, str):
+            raise StorageSearchError("Expected string for filter value")
+        elif op == "$neq":
+            present = self._present.get((type_filter, name), set())
+            found = present - values.get(cmp_val, set())
+        elif op in RANGE_OPERATORS:
+            compare = RANGE_OPERATORS[op]
+            try:
+                cmp_float = float(cmp_val)
+                for value, ids in values.items():
+                    if compare(float(value), cmp_float):
+                        found |= ids
+            except (TypeError, ValueError) as err:
+                raise StorageSearchError(
+                    f"Non-numeric value for {op} filter on tag {name}"
+                ) from err
+        else:
+            raise StorageSearchError(f"Unsupported match operator: {op}")
+        return found
+
+
+def find_record_ids(
+    profile: InMemoryProfile, type_filter: str, tag_query: Optional[Mapping]
+) -> Sequence[str]:
+    """Find the identifiers of stored records matching a type and tag query.
+
+    Queries are answered from the profile's tag index. Queries the index
+    reports it cannot evaluate are matched against each record of the
+    type instead, raising any errors in the same way.
+    """
+    try:
+        return profile.record_index.search(type_filter, tag_query)
+    except StorageSearchError:
+        pass
+    return [
+        record_id
+        for record_id, record in profile.records.items()
+        if record.type == type_filter and tag_query_match(record.tags, tag_query)
+    ]
+
+
 class InMemoryStorageSearch(BaseStorageSearchSession):
     """Represent an active stored records search."""
 
@@ -250,8 +540,8 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             options: Dictionary of backend-specific options
 
         """
-        self._cache = profile.records.copy()
-        self._iter = iter(self._cache)
+        self._profile = profile
+        self._cache = None
         self.page_size = page_size or DEFAULT_PAGE_SIZE
         self.tag_query = tag_query
         self.type_filter = type_filter
@@ -274,21 +564,20 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
         if self._cache is None and self._done:
             raise StorageSearchError("Search query is complete")
 
-        ret = []
-        check_type = self.type_filter
-        i = max_count or self.page_size
+        if self._cache is None:
+            # take a snapshot of the matching records on the first fetch
+            records = self._profile.records
+            self._cache = [
+                records[record_id]
+                for record_id in find_record_ids(
+                    self._profile, self.type_filter, self.tag_query
+                )
+            ]
+            self._pos = 0
 
-        while i > 0:
-            try:
-                id = next(self._iter)
-            except StopIteration:
-                break
-            record = self._cache[id]
-            if record.type == check_type and tag_query_match(
-                record.tags, self.tag_query
-            ):
-                ret.append(record)
-                i -= 1
+        count = max_count or self.page_size
+        ret = self._cache[self._pos : self._pos + count]
+        self._pos += len(ret)
 
         if not ret:
             self._cache = None
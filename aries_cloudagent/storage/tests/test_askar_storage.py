@@ -209,6 +209,31 @@ class TestAskarStorage(test_in_memory_storage.TestInMemoryStorage):
                 with pytest.raises(test_module.StorageError):
                     await storage.delete_record(rec)
 
+    @pytest.mark.asyncio
+    async def test_bulk_records_transaction(self):
+        profile = await AskarProfileManager().provision(
+            InjectionContext(),
+            {
+                "name": ":memory:",
+                "key": await AskarProfileManager.generate_store_key(),
+                "key_derivation_method": "RAW",
+            },
+        )
+        records = [test_in_memory_storage.test_record() for _ in range(2)]
+
+        # records added in an open transaction are discarded on rollback
+        async with profile.transaction() as txn:
+            await txn.inject(BaseStorage).add_records(records)
+        async with profile.session() as session:
+            assert not await session.inject(BaseStorage).find_all_records("TYPE")
+
+        async with profile.transaction() as txn:
+            await txn.inject(BaseStorage).add_records(records)
+            await txn.commit()
+        async with profile.session() as session:
+            rows = await session.inject(BaseStorage).find_all_records("TYPE")
+        assert {row.id for row in rows} == {record.id for record in records}
+
     @pytest.mark.skip
     @pytest.mark.asyncio
     async def test_storage_search_x(self):
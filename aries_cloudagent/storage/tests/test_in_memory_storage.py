@@ -144,6 +144,64 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_find_paginated(self, store):
+        for i in range(5):
+            await store.add_record(test_record({"tag": "even" if i % 2 else "odd"}))
+
+        rows = await store.find_paginated_records("TYPE", {}, limit=3)
+        assert len(rows) == 3
+        more = await store.find_paginated_records("TYPE", {}, limit=3, offset=3)
+        assert len(more) == 2
+        assert not {row.id for row in rows} & {row.id for row in more}
+
+        rows = await store.find_paginated_records("TYPE", {"tag": "odd"}, offset=1)
+        assert len(rows) == 2
+        assert all(row.tags["tag"] == "odd" for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_bulk_records(self, store):
+        records = [test_record({"tag": str(i)}) for i in range(3)]
+        await store.add_records(records)
+        assert len(await store.find_all_records("TYPE")) == 3
+
+        await store.update_records(
+            [
+                record._replace(value="UPDATED", tags={"tag": "new"})
+                for record in records
+            ]
+        )
+        for record in records:
+            found = await store.get_record(record.type, record.id)
+            assert found.value == "UPDATED"
+            assert found.tags == {"tag": "new"}
+
+        await store.delete_records(records[:2])
+        rows = await store.find_all_records("TYPE")
+        assert [row.id for row in rows] == [records[2].id]
+
+    @pytest.mark.asyncio
+    async def test_bulk_records_atomic(self, store):
+        existing = test_record()
+        await store.add_record(existing)
+
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records([test_record(), existing])
+        assert len(await store.find_all_records("TYPE")) == 1
+
+        with pytest.raises(StorageNotFoundError):
+            await store.update_records(
+                [existing._replace(value="UPDATED"), test_record()]
+            )
+        assert (await store.get_record(existing.type, existing.id)).value == "TEST"
+
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records([existing, test_record()])
+        assert await store.get_record(existing.type, existing.id)
+
+        with pytest.raises(StorageError):
+            await store.add_records([test_record(), None])
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store):
         record = test_record({"tag": "one"})
@@ -275,3 +333,85 @@ class TestInMemoryTagQuery:
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"a": -1})
         assert "Expected string or dict for filter value" in str(excinfo.value)
+
+
+class TestInMemoryTagIndex:
+    QUERIES = [
+        None,
+        {},
+        {"color": "red"},
+        {"color": "red", "size": "2"},
+        {"color": {"$neq": "red"}},
+        {"color": {"$in": ["red", "blue", "none"]}},
+        {"size": {"$gt": "1"}},
+        {"size": {"$lte": "1"}},
+        {"$or": [{"color": "red"}, {"size": "0"}]},
+        {"$and": [{"color": {"$neq": "blue"}}, {"$not": {"size": "2"}}]},
+        {"$not": {"color": "red"}},
+        {"$exist": ["shape"]},
+        {"$exist": "shape", "$not": {"color": "blue"}},
+        {"$and": []},
+        {"$or": []},
+    ]
+
+    def make_record(self, i):
+        tags = {"color": ("red", "blue", "green")[i % 3], "size": str(i % 4)}
+        if i % 5 == 0:
+            tags["shape"] = "round"
+        return StorageRecord(type="TYPE", value=str(i), tags=tags, id=f"{i:03d}")
+
+    @pytest.mark.asyncio
+    async def test_index_matches_scan(self, store):
+        for i in range(60):
+            await store.add_record(self.make_record(i))
+        await store.add_record(test_missing_record({"color": "red"}))
+        for i in range(0, 60, 7):
+            record = self.make_record(i)
+            await store.update_record(record, record.value, {"color": "blue"})
+        for i in range(0, 60, 11):
+            await store.delete_record(self.make_record(i))
+
+        records = store.profile.records.values()
+        for query in self.QUERIES:
+            expected = [
+                record.id
+                for record in records
+                if record.type == "TYPE" and tag_query_match(record.tags, query)
+            ]
+            found = await store.find_all_records("TYPE", query)
+            assert [record.id for record in found] == expected, query
+
+    @pytest.mark.asyncio
+    async def test_index_cleanup(self, store):
+        record = self.make_record(0)
+        await store.add_record(record)
+        await store.delete_all_records("TYPE", {"shape": "round"})
+        index = store.profile.record_index
+        assert not index._types and not index._values and not index._present
+        assert not index._order
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_scan(self, store):
+        # without matching records no error is raised, as with a full scan
+        assert await store.find_all_records("TYPE", {"$near": {"z": "-1"}}) == []
+        await store.add_record(self.make_record(1))
+        with pytest.raises(StorageSearchError):
+            await store.find_all_records("TYPE", {"$near": {"z": "-1"}})
+        with pytest.raises(ValueError):
+            await store.find_all_records("TYPE", {"color": {"$gt": "1"}})
+        assert await store.find_all_records("TYPE", {"$exist": ["size"]})
+        with pytest.raises(StorageSearchError):
+            await store.find_all_records("TYPE", {"$exist": {"size": "1"}})
+        # unhashable values are left to the scan, which matches them by equality
+        assert await store.find_all_records("TYPE", {"color": {"$in": [["red"]]}}) == []
+
+    @pytest.mark.asyncio
+    async def test_index_error_raised(self, store):
+        await store.add_record(self.make_record(1))
+        with async_mock.patch.object(
+            store.profile.record_index,
+            "search",
+            async_mock.MagicMock(side_effect=AttributeError("broken index")),
+        ):
+            with pytest.raises(AttributeError):
+                await store.find_all_records("TYPE", {"color": "red"})
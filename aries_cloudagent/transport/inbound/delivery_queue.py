@@ -5,9 +5,13 @@ been delivered to their intended destination.
 
 """
 import time
+from uuid import uuid4
 
+from ..journal import MessageJournal
 from ..outbound.message import OutboundMessage
 
+RECORD_TYPE_UNDELIVERED = "undelivered_message"
+
 
 class QueuedMessage:
     """Wrapper Class for queued messages.
@@ -22,6 +26,8 @@ class QueuedMessage:
         """
         self.msg = msg
         self.timestamp = time.time()
+        self.queue_id = str(uuid4())
+        self.journaled = False
 
     def older_than(self, compare_timestamp: float) -> bool:
         """Age Comparison.
@@ -40,14 +46,55 @@ class DeliveryQueue:
     Manages undelivered messages.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, journal: MessageJournal = None) -> None:
         """Initialize an instance of DeliveryQueue.
 
-        This uses an in memory structure to queue messages.
+        This uses an in memory structure to queue messages. If a journal is
+        provided, queued messages which are already encoded are also recorded in
+        it and can be restored after a restart. Messages only held as plaintext
+        are kept in memory, so that plaintext is never written to storage.
+
+        Args:
+            journal: Optional journal recording the queued messages
         """
 
         self.queue_by_key = {}
         self.ttl_seconds = 604800  # one week
+        self.journal = journal
+
+    async def restore(self) -> int:
+        """Queue the messages recorded in the journal before the last shutdown.
+
+        Returns:
+            The number of messages restored
+
+        """
+        if not self.journal:
+            return 0
+        entries = await self.journal.load()
+        for queue_id, value in entries:
+            wrapped_msg = QueuedMessage(OutboundMessage.deserialize(value["message"]))
+            wrapped_msg.queue_id = queue_id
+            wrapped_msg.timestamp = value["timestamp"]
+            wrapped_msg.journaled = True
+            self._add_wrapped(wrapped_msg)
+        return len(entries)
+
+    def _add_wrapped(self, wrapped_msg: QueuedMessage):
+        msg = wrapped_msg.msg
+        keys = set()
+        if msg.target:
+            keys.update(msg.target.recipient_keys)
+        if msg.reply_to_verkey:
+            keys.add(msg.reply_to_verkey)
+        for recipient_key in keys:
+            if recipient_key not in self.queue_by_key:
+                self.queue_by_key[recipient_key] = []
+            self.queue_by_key[recipient_key].append(wrapped_msg)
+
+    def _removed(self, wrapped_msg: QueuedMessage):
+        if self.journal and wrapped_msg.journaled:
+            self.journal.remove(wrapped_msg.queue_id)
 
     def expire_messages(self, ttl=None):
         """Expire messages that are past the time limit.
@@ -59,9 +106,13 @@ class DeliveryQueue:
         ttl_seconds = ttl or self.ttl_seconds
         horizon = time.time() - ttl_seconds
         for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
+            kept = []
+            for wm in self.queue_by_key[key]:
+                if wm.older_than(horizon):
+                    self._removed(wm)
+                else:
+                    kept.append(wm)
+            self.queue_by_key[key] = kept
 
     def add_message(self, msg: OutboundMessage):
         """Add an OutboundMessage to delivery queue.
@@ -71,16 +122,16 @@ class DeliveryQueue:
         Args:
             msg: The OutboundMessage to add
         """
-        keys = set()
-        if msg.target:
-            keys.update(msg.target.recipient_keys)
-        if msg.reply_to_verkey:
-            keys.add(msg.reply_to_verkey)
         wrapped_msg = QueuedMessage(msg)
-        for recipient_key in keys:
-            if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
+        if self.journal and msg.enc_payload:
+            message = msg.serialize()
+            message["payload"] = None
+            self.journal.add(
+                wrapped_msg.queue_id,
+                {"message": message, "timestamp": wrapped_msg.timestamp},
+            )
+            wrapped_msg.journaled = True
+        self._add_wrapped(wrapped_msg)
 
     def has_message_for_key(self, key: str):
         """Check for queued messages by key.
@@ -110,7 +161,9 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+            wrapped_msg = self.queue_by_key[key].pop(0)
+            self._removed(wrapped_msg)
+            return wrapped_msg.msg
 
     def inspect_all_messages_for_key(self, key: str):
         """Return all messages for key.
@@ -133,6 +186,7 @@ class DeliveryQueue:
             for wrapped_msg in self.queue_by_key[key]:
                 if wrapped_msg.msg == msg:
                     self.queue_by_key[key].remove(wrapped_msg)
+                    self._removed(wrapped_msg)
                     if not self.queue_by_key[key]:
                         del self.queue_by_key[key]
                     break  # exit processing loop
@@ -75,9 +75,14 @@ class HttpTransport(BaseInboundTransport):
 
         """
         ctype = request.headers.get("content-type", "")
-        if ctype.split(";", 1)[0].lower() == "application/json":
+        charset = (request.charset or "utf-8").lower()
+        if ctype.split(";", 1)[0].lower() == "application/json" and charset not in (
+            "utf-8",
+            "utf8",
+        ):
             body = await request.text()
         else:
+            # JSON is decoded from the raw bytes, without an intermediate string
             body = await request.read()
 
         client_info = {"host": request.host, "remote": request.remote}
@@ -9,6 +9,7 @@ from ...core.profile import Profile
 from ...utils.classloader import ClassLoader, ModuleLoadError, ClassNotFoundError
 from ...utils.task_queue import CompletedTask, TaskQueue
 
+from ..journal import MessageJournal
 from ..outbound.message import OutboundMessage
 from ..wire_format import BaseWireFormat
 
@@ -17,7 +18,7 @@ from .base import (
     InboundTransportConfiguration,
     InboundTransportRegistrationError,
 )
-from .delivery_queue import DeliveryQueue
+from .delivery_queue import RECORD_TYPE_UNDELIVERED, DeliveryQueue
 from .message import InboundMessage
 from .session import InboundSession
 
@@ -64,7 +65,10 @@ class InboundTransportManager:
 
         # Setup queue for undelivered messages
         if self.profile.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+            journal = None
+            if self.profile.context.settings.get("transport.persistent_queue"):
+                journal = MessageJournal(self.profile, RECORD_TYPE_UNDELIVERED)
+            self.undelivered_queue = DeliveryQueue(journal)
 
     def register(self, config: InboundTransportConfiguration) -> str:
         """Register transport module.
@@ -128,6 +132,10 @@ class InboundTransportManager:
 
     async def start(self):
         """Start all registered transports."""
+        if self.undelivered_queue and self.undelivered_queue.journal:
+            restored = await self.undelivered_queue.restore()
+            if restored:
+                LOGGER.info("Restored %d undelivered messages", restored)
         for transport_id in self.registered_transports:
             self.task_queue.run(self.start_transport(transport_id))
 
@@ -136,6 +144,8 @@ class InboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue and self.undelivered_queue.journal:
+            await self.undelivered_queue.journal.close()
 
     async def create_session(
         self,
@@ -166,6 +176,7 @@ class InboundTransportManager:
             inbound_handler=self.receive_inbound,
             session_id=str(uuid.uuid4()),
             transport_type=transport_type,
+            undelivered_handler=self.process_undelivered,
             wire_format=wire_format,
         )
         self.sessions[session.session_id] = session
@@ -50,6 +50,7 @@ class InboundSession:
         reply_thread_ids: Sequence[str] = None,
         reply_verkeys: Sequence[str] = None,
         transport_type: str = None,
+        undelivered_handler: Callable = None,
     ):
         """Initialize the inbound session."""
         self.profile = profile
@@ -63,6 +64,7 @@ class InboundSession:
         self.response_buffer: OutboundMessage = None
         self.response_event = asyncio.Event()
         self.transport_type = transport_type
+        self.undelivered_handler = undelivered_handler
 
         self._can_respond = can_respond
         self._closed = False
@@ -157,6 +159,22 @@ class InboundSession:
         """Check if a response is currently buffered."""
         return bool(self.response_buffer)
 
+    def process_undelivered(self) -> bool:
+        """Buffer the next queued undelivered message for this session, if any.
+
+        Returns:
+            True if a response is buffered after the call
+
+        """
+        if (
+            self.accept_undelivered
+            and self.undelivered_handler
+            and not self.response_buffer
+            and not self._closed
+        ):
+            self.undelivered_handler(self)
+        return self.response_buffered
+
     async def handle_relay_context(self, payload_enc: Union[str, bytes]):
         """Update the session profile based on the recipients of an incoming message."""
         multitenant_mgr = self.profile.context.inject(BaseMultitenantManager)
@@ -214,6 +232,9 @@ class InboundSession:
     async def receive(self, payload_enc: Union[str, bytes]) -> InboundMessage:
         """Receive a new message payload and dispatch the message."""
         if self._check_relay_context:
+            if self.wire_format:
+                # decode once for both recipient detection and parsing
+                payload_enc = self.wire_format.decode_body(payload_enc)
             await self.handle_relay_context(payload_enc)
             self._check_relay_context = False
 
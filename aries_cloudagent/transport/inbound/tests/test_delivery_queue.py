@@ -1,7 +1,11 @@
+import json
+
 from asynctest import TestCase as AsyncTestCase
 
 from ....connections.models.connection_target import ConnectionTarget
+from ....core.in_memory import InMemoryProfile
 from ....transport.outbound.message import OutboundMessage
+from ...journal import MessageJournal
 
 from ..delivery_queue import DeliveryQueue
 
@@ -60,3 +64,54 @@ class TestDeliveryQueue(AsyncTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_journal(self):
+        profile = InMemoryProfile.test_profile()
+        queue = DeliveryQueue(MessageJournal(profile, "undelivered", flush_interval=0))
+
+        t = ConnectionTarget(recipient_keys=["aaa"])
+        msgs = [
+            OutboundMessage(payload="x", enc_payload=b"x", target=t),
+            OutboundMessage(payload="y", enc_payload=b"y", reply_to_verkey="bbb"),
+            OutboundMessage(payload="z", enc_payload=b"z", reply_to_verkey="bbb"),
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert queue.get_one_message_for_key("bbb") == msgs[1]
+        await queue.journal.flush()
+
+        restored = DeliveryQueue(MessageJournal(profile, "undelivered"))
+        assert await restored.restore() == 2
+        assert restored.message_count_for_key("aaa") == 1
+        assert restored.get_one_message_for_key("aaa").enc_payload == b"x"
+        msg = next(restored.inspect_all_messages_for_key("bbb"))
+        assert msg.enc_payload == b"z"
+        restored.expire_messages(ttl=-1)
+        assert not restored.has_message_for_key("bbb")
+        await restored.journal.flush()
+        assert not await restored.journal.load()
+        assert await DeliveryQueue().restore() == 0
+
+    async def test_journal_no_plaintext(self):
+        profile = InMemoryProfile.test_profile()
+        queue = DeliveryQueue(MessageJournal(profile, "undelivered", flush_interval=0))
+
+        plain = OutboundMessage(payload="secret-plaintext", reply_to_verkey="aaa")
+        queue.add_message(plain)
+        queue.add_message(
+            OutboundMessage(
+                payload="other-plaintext", enc_payload=b"packed", reply_to_verkey="aaa"
+            )
+        )
+        await queue.journal.flush()
+
+        stored = json.dumps(await queue.journal.load())
+        assert "plaintext" not in stored
+        assert queue.message_count_for_key("aaa") == 2
+        assert queue.get_one_message_for_key("aaa") is plain
+        assert not queue.journal._pending
+
+        restored = DeliveryQueue(MessageJournal(profile, "undelivered"))
+        assert await restored.restore() == 1
+        msg = restored.get_one_message_for_key("aaa")
+        assert msg.payload is None and msg.enc_payload == b"packed"
@@ -145,6 +145,38 @@ class TestInboundSession(TestCase):
             receive.assert_called_once_with(encode.return_value)
             assert result is encode.return_value
 
+    async def test_receive_decode_body(self):
+        self.multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
+        self.multitenant_mgr.get_wallets_by_message = async_mock.CoroutineMock(
+            return_value=[async_mock.MagicMock(is_managed=False)]
+        )
+        self.profile.context.injector.bind_instance(
+            BaseMultitenantManager, self.multitenant_mgr
+        )
+        self.profile.context.update_settings({"multitenant.enabled": True})
+        test_wire_format = async_mock.MagicMock()
+
+        sess = InboundSession(
+            profile=self.profile,
+            inbound_handler=None,
+            session_id=None,
+            wire_format=test_wire_format,
+        )
+        test_msg = async_mock.MagicMock()
+
+        with async_mock.patch.object(
+            sess, "parse_inbound", async_mock.CoroutineMock()
+        ) as encode, async_mock.patch.object(
+            sess, "receive_inbound", async_mock.MagicMock()
+        ):
+            await sess.receive(test_msg)
+            decoded = test_wire_format.decode_body.return_value
+            test_wire_format.decode_body.assert_called_once_with(test_msg)
+            self.multitenant_mgr.get_wallets_by_message.assert_awaited_once_with(
+                decoded, test_wire_format
+            )
+            encode.assert_awaited_once_with(decoded)
+
     async def test_receive_no_wallet_found(self):
         self.multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
         self.multitenant_mgr.get_wallets_by_message = async_mock.CoroutineMock(
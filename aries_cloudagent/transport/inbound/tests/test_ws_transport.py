@@ -103,3 +103,73 @@ class TestWsTransport(AioHTTPTestCase):
             assert result == {"response": "ok"}
 
         await self.transport.stop()
+
+    async def test_max_pending(self):
+        await self.transport.start()
+        self.transport.max_pending = 1
+        messages = []
+        self.session = InboundSession(
+            profile=InMemoryProfile.test_profile(),
+            can_respond=True,
+            inbound_handler=lambda profile, message, can_respond: messages.append(
+                message
+            ),
+            session_id=None,
+            wire_format=JsonWireFormat(),
+        )
+
+        async with self.client.ws_connect("/") as ws:
+            await ws.send_json({"test": 1})
+            await ws.send_json({"test": 2})
+            await asyncio.sleep(0.1)
+            assert [message.payload for message in messages] == [{"test": 1}]
+
+            messages[0].dispatch_processing_complete()
+            await asyncio.sleep(0.1)
+            assert [message.payload for message in messages] == [
+                {"test": 1},
+                {"test": 2},
+            ]
+            messages[1].dispatch_processing_complete()
+
+        await self.transport.stop()
+
+    async def test_undelivered_batch(self):
+        await self.transport.start()
+        self.transport.undelivered_batch = 2
+        queued = [
+            OutboundMessage(payload=None, enc_payload=json.dumps({"queued": idx}))
+            for idx in range(4)
+        ]
+
+        def undelivered_handler(session: InboundSession):
+            if queued:
+                session.accept_response(queued.pop(0))
+
+        self.session = InboundSession(
+            profile=InMemoryProfile.test_profile(),
+            accept_undelivered=True,
+            can_respond=True,
+            inbound_handler=self.receive_message,
+            session_id=None,
+            wire_format=JsonWireFormat(),
+            undelivered_handler=undelivered_handler,
+        )
+
+        async with self.client.ws_connect("/") as ws:
+            self.result_event = asyncio.Event()
+            await ws.send_json({"~transport": {"return_route": "all"}})
+            await asyncio.wait_for(self.result_event.wait(), 1.0)
+            for message in queued:
+                message.reply_to_verkey = "verkey"
+            self.session.add_reply_verkeys("verkey")
+
+            # as on completion of the dispatch
+            assert self.session.process_undelivered()
+            results = [await asyncio.wait_for(ws.receive_json(), 1.0) for _ in range(3)]
+            assert results == [{"queued": 0}, {"queued": 1}, {"queued": 2}]
+            await asyncio.sleep(0.1)
+            assert len(queued) == 1
+            assert not self.session.response_buffered
+
+        await self.transport.stop()
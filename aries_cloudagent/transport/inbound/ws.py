@@ -9,6 +9,8 @@ from aiohttp import WSMessage, WSMsgType, web
 from ...messaging.error import MessageParseError
 from ..error import WireFormatParseError
 from .base import BaseInboundTransport, InboundTransportSetupError
+from .message import InboundMessage
+from .receipt import MessageReceipt
 
 
 LOGGER = logging.getLogger(__name__)
@@ -36,6 +38,14 @@ class WsTransport(BaseInboundTransport):
         self.timout_interval: Optional[int] = self.root_profile.settings.get_int(
             "transport.ws.timout_interval"
         )
+        # maximum number of messages from one connection being processed
+        self.max_pending: int = self.root_profile.settings.get(
+            "transport.ws.max_pending"
+        )
+        # number of queued messages returned to a connection after each message
+        self.undelivered_batch: int = self.root_profile.settings.get(
+            "transport.ws.undelivered_batch"
+        )
 
         # TODO: set scheme dynamically based on SSL settings (ws/wss)
 
@@ -100,8 +110,25 @@ class WsTransport(BaseInboundTransport):
             accept_undelivered=True, can_respond=True, client_info=client_info
         )
 
+        # Stop reading from the socket while the connection has too many
+        # messages in processing, leaving the client blocked on TCP flow
+        # control instead of buffering its messages in memory
+        pending = asyncio.Semaphore(self.max_pending) if self.max_pending else None
+        processing = set()
+
+        async def receive() -> WSMessage:
+            if pending:
+                await pending.acquire()
+            return await ws.receive()
+
+        def processed(task: asyncio.Task):
+            processing.discard(task)
+            pending.release()
+
+        batch_remaining = 0
+
         async with session:
-            inbound = loop.create_task(ws.receive())
+            inbound = loop.create_task(receive())
             outbound = loop.create_task(session.wait_response())
 
             while not ws.closed:
@@ -111,12 +138,14 @@ class WsTransport(BaseInboundTransport):
 
                 if inbound.done():
                     msg: WSMessage = inbound.result()
+                    message: InboundMessage = None
                     LOGGER.info("Websocket received message: %s", msg.data)
                     if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
                         try:
-                            await session.receive(msg.data)
+                            message = await session.receive(msg.data)
                         except (MessageParseError, WireFormatParseError):
                             await ws.close(1003)  # unsupported data error
+                        batch_remaining = self.undelivered_batch or 0
                     elif msg.type == WSMsgType.ERROR:
                         LOGGER.error(
                             "Websocket connection closed with exception: %s",
@@ -129,8 +158,15 @@ class WsTransport(BaseInboundTransport):
                             msg.data,
                             msg.extra,
                         )
+                    if pending:
+                        if message:
+                            task = loop.create_task(message.wait_processing_complete())
+                            task.add_done_callback(processed)
+                            processing.add(task)
+                        else:
+                            pending.release()
                     if not ws.closed:
-                        inbound = loop.create_task(ws.receive())
+                        inbound = loop.create_task(receive())
 
                 if outbound.done() and not ws.closed:
                     # response would be None if session was closed
@@ -140,12 +176,22 @@ class WsTransport(BaseInboundTransport):
                     else:
                         await ws.send_str(response)
                     session.clear_response()
+                    # return further queued messages to a client polling with
+                    # return_route all, without waiting for its next message
+                    if (
+                        batch_remaining > 0
+                        and session.reply_mode == MessageReceipt.REPLY_MODE_ALL
+                    ):
+                        batch_remaining -= 1
+                        session.process_undelivered()
                     outbound = loop.create_task(session.wait_response())
 
         if inbound and not inbound.done():
             inbound.cancel()
         if outbound and not outbound.done():
             outbound.cancel()
+        for task in list(processing):
+            task.cancel()
 
         if not ws.closed:
             await ws.close()
@@ -0,0 +1,184 @@
+"""Durable journal of queued messages.
+
+Messages held in the outbound and undelivered queues are recorded in the
+storage of the root profile so that they can be restored after a restart.
+Changes are collected and written in batches, each in a single transaction,
+so that the cost of committing to storage is shared by many messages.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Sequence, Tuple, Union
+
+from ..core.profile import Profile
+from ..storage.base import BaseStorage
+from ..storage.error import StorageError
+from ..storage.record import StorageRecord
+from ..wallet.util import b64_to_bytes, bytes_to_b64
+
+LOGGER = logging.getLogger(__name__)
+
+OP_ADD = "add"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+
+def pack_payload(payload: Union[str, bytes, None]) -> Union[str, dict, None]:
+    """Convert a message payload to a JSON-compatible value."""
+    if isinstance(payload, bytes):
+        return {"b64": bytes_to_b64(payload)}
+    return payload
+
+
+def unpack_payload(value: Union[str, dict, None]) -> Union[str, bytes, None]:
+    """Restore a message payload converted by `pack_payload`."""
+    if isinstance(value, dict):
+        return b64_to_bytes(value["b64"])
+    return value
+
+
+class MessageJournal:
+    """Record queued messages in storage, committing changes in batches."""
+
+    def __init__(
+        self,
+        profile: Profile,
+        record_type: str,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.005,
+    ):
+        """Initialize the journal.
+
+        Args:
+            profile: The profile whose storage holds the journal
+            record_type: The storage record type of journal entries
+            batch_size: The number of changes to commit without further delay
+            flush_interval: The time in seconds to wait for more changes
+                before committing a smaller batch
+        """
+        self.profile = profile
+        self.record_type = record_type
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._waiters = []
+        self._flush_task: asyncio.Task = None
+
+    def add(self, entry_id: str, value: dict) -> asyncio.Future:
+        """Record a new entry.
+
+        Returns:
+            A future resolved once the entry has been committed
+
+        """
+        prev = self._pending.get(entry_id)
+        op = OP_UPDATE if prev and prev[0] == OP_DELETE else OP_ADD
+        self._pending[entry_id] = (op, value)
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        self._schedule()
+        return waiter
+
+    def update(self, entry_id: str, value: dict):
+        """Replace the value of an entry."""
+        prev = self._pending.get(entry_id)
+        op = OP_ADD if prev and prev[0] == OP_ADD else OP_UPDATE
+        self._pending[entry_id] = (op, value)
+        self._schedule()
+
+    def remove(self, entry_id: str):
+        """Remove an entry.
+
+        An entry added and removed within the same batch is never written.
+        """
+        prev = self._pending.get(entry_id)
+        if prev and prev[0] == OP_ADD:
+            del self._pending[entry_id]
+        else:
+            self._pending[entry_id] = (OP_DELETE, None)
+            self._schedule()
+
+    @property
+    def pending_count(self) -> int:
+        """Accessor for the number of changes waiting to be committed."""
+        return len(self._pending)
+
+    def _schedule(self):
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.get_event_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Commit pending changes until there are none left."""
+        while self._pending or self._waiters:
+            if len(self._pending) < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            batch, self._pending = self._pending, {}
+            waiters, self._waiters = self._waiters, []
+            try:
+                await self.write(batch)
+            except Exception:
+                LOGGER.exception("Error writing %s journal", self.record_type)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def write(self, batch: dict):
+        """Commit a batch of changes in a single transaction."""
+        records = {OP_ADD: [], OP_UPDATE: [], OP_DELETE: []}
+        for entry_id, (op, value) in batch.items():
+            records[op].append(
+                StorageRecord(
+                    self.record_type,
+                    json.dumps(value) if value is not None else "",
+                    id=entry_id,
+                )
+            )
+        try:
+            async with self.profile.transaction() as txn:
+                storage = txn.inject(BaseStorage)
+                await storage.add_records(records[OP_ADD])
+                await storage.update_records(records[OP_UPDATE])
+                await storage.delete_records(records[OP_DELETE])
+                await txn.commit()
+        except StorageError as err:
+            # a stale entry fails the whole batch: apply changes one by one
+            LOGGER.warning("Retrying %s journal batch: %s", self.record_type, err)
+            async with self.profile.session() as session:
+                storage = session.inject(BaseStorage)
+                for record in records[OP_ADD]:
+                    try:
+                        await storage.add_record(record)
+                    except StorageError:
+                        pass
+                for record in records[OP_UPDATE]:
+                    try:
+                        await storage.update_record(record, record.value, {})
+                    except StorageError:
+                        pass
+                for record in records[OP_DELETE]:
+                    try:
+                        await storage.delete_record(record)
+                    except StorageError:
+                        pass
+
+    async def load(self) -> Sequence[Tuple[str, dict]]:
+        """Load all committed entries."""
+        async with self.profile.session() as session:
+            records = await session.inject(BaseStorage).find_all_records(
+                self.record_type
+            )
+        return [(record.id, json.loads(record.value)) for record in records]
+
+    async def flush(self):
+        """Wait for all pending changes to be committed."""
+        while self._flush_task and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+
+    async def close(self):
+        """Commit pending changes before shutdown."""
+        try:
+            await self.flush()
+        except Exception:
+            LOGGER.exception("Error closing %s journal", self.record_type)
@@ -35,6 +35,7 @@ class QueuedOutboundMessage:
         self.error: Exception = None
         self.message = message
         self.payload: Union[str, bytes] = None
+        self.attempts = 0
         self.retries = None
         self.retry_at: float = None
         self.state = self.STATE_NEW
@@ -43,6 +44,8 @@ class QueuedOutboundMessage:
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
+        self.queue_id: str = None
+        self.batch_key: tuple = None
 
 
 class BaseOutboundTransport(ABC):
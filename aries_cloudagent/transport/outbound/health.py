@@ -0,0 +1,180 @@
+"""Health tracking and circuit breaking for outbound endpoints."""
+
+import time
+from enum import Enum
+from typing import Sequence
+from urllib.parse import urlparse
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class EndpointHealth:
+    """Delivery health of a single endpoint."""
+
+    def __init__(self, key: str):
+        """Initialize the endpoint health."""
+        self.key = key
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.total_failures = 0
+        self.short_circuited = 0
+        self.last_error: str = None
+        self.last_failure: float = None
+        self.opened_at: float = None
+        self.retry_at: float = None
+        self.reset_timeout: float = None
+
+    def serialize(self, now: float) -> dict:
+        """Summarize the endpoint health in a dictionary."""
+        return {
+            "endpoint": self.key,
+            "state": self.state.value,
+            "failures": self.failures,
+            "total_failures": self.total_failures,
+            "short_circuited": self.short_circuited,
+            "last_error": self.last_error,
+            "open_for": (
+                round(now - self.opened_at, 3) if self.opened_at is not None else None
+            ),
+            "retry_in": (
+                round(max(self.retry_at - now, 0), 3)
+                if self.state == CircuitState.OPEN
+                else None
+            ),
+        }
+
+
+class EndpointHealthRegistry:
+    """Track delivery failures per endpoint and stop sending to dead endpoints.
+
+    Endpoints are identified by their scheme and network location. Once an
+    endpoint has failed `failure_threshold` consecutive deliveries its circuit
+    is opened, and deliveries are refused until `reset_timeout` has passed.
+    A single delivery is then allowed through as a probe: if it succeeds the
+    circuit is closed, otherwise it is opened again for twice as long, up to
+    `max_reset_timeout`.
+
+    Only endpoints with failures since their last successful delivery are
+    tracked.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0,
+        max_endpoints: int = 1000,
+    ):
+        """Initialize the registry.
+
+        Args:
+            failure_threshold: The number of consecutive failures which opens
+                the circuit of an endpoint, or 0 to never open it
+            reset_timeout: The time in seconds before a probe is sent to an
+                endpoint after its circuit is opened
+            max_reset_timeout: The maximum time between probes
+            max_endpoints: The maximum number of endpoints to track
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.max_endpoints = max_endpoints
+        self.endpoints = {}
+
+    @staticmethod
+    def now() -> float:
+        """Fetch a standard timer value."""
+        return time.perf_counter()
+
+    @staticmethod
+    def endpoint_key(endpoint: str) -> str:
+        """Get the key identifying the health of an endpoint."""
+        parsed = urlparse(endpoint)
+        return f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else endpoint
+
+    def get(self, endpoint: str) -> EndpointHealth:
+        """Get the tracked health of an endpoint, if any."""
+        return self.endpoints.get(self.endpoint_key(endpoint))
+
+    def allow(self, endpoint: str, probe: bool = True) -> bool:
+        """Check whether a delivery to an endpoint should be attempted.
+
+        Args:
+            endpoint: The endpoint of the delivery
+            probe: Whether the delivery may serve as the probe of an open
+                circuit whose reset timeout has passed, making it half-open
+
+        """
+        if not self.endpoints:
+            return True
+        health = self.get(endpoint)
+        if not health or health.state == CircuitState.CLOSED:
+            return True
+        if health.state == CircuitState.OPEN and self.now() >= health.retry_at:
+            if probe:
+                health.state = CircuitState.HALF_OPEN
+            return True
+        health.short_circuited += 1
+        return False
+
+    def retry_at(self, endpoint: str) -> float:
+        """Get the time when the next delivery to an endpoint will be allowed."""
+        health = self.get(endpoint)
+        if health and health.state == CircuitState.OPEN:
+            return health.retry_at
+        if health and health.state == CircuitState.HALF_OPEN:
+            return self.now() + health.reset_timeout
+        return self.now()
+
+    def record_success(self, endpoint: str):
+        """Record a successful delivery, closing the circuit of the endpoint."""
+        if self.endpoints:
+            self.endpoints.pop(self.endpoint_key(endpoint), None)
+
+    def record_failure(self, endpoint: str, error: BaseException = None):
+        """Record a failed delivery, opening the circuit if necessary."""
+        key = self.endpoint_key(endpoint)
+        health = self.endpoints.get(key)
+        now = self.now()
+        if not health:
+            if len(self.endpoints) >= self.max_endpoints:
+                self._prune(now)
+            health = self.endpoints[key] = EndpointHealth(key)
+        health.failures += 1
+        health.total_failures += 1
+        health.last_failure = now
+        health.last_error = str(error) if error else None
+        if health.state == CircuitState.HALF_OPEN:
+            self._open(health, min(health.reset_timeout * 2, self.max_reset_timeout))
+        elif (
+            health.state == CircuitState.CLOSED
+            and self.failure_threshold
+            and health.failures >= self.failure_threshold
+        ):
+            health.opened_at = now
+            self._open(health, self.reset_timeout)
+
+    def _prune(self, now: float):
+        """Stop tracking endpoints which have not failed recently."""
+        for key, health in list(self.endpoints.items()):
+            if now - health.last_failure > self.max_reset_timeout:
+                del self.endpoints[key]
+        while len(self.endpoints) >= self.max_endpoints:
+            del self.endpoints[next(iter(self.endpoints))]
+
+    def _open(self, health: EndpointHealth, reset_timeout: float):
+        health.state = CircuitState.OPEN
+        health.reset_timeout = reset_timeout
+        health.retry_at = self.now() + reset_timeout
+
+    def serialize(self) -> Sequence[dict]:
+        """Summarize the health of all tracked endpoints."""
+        now = self.now()
+        return [health.serialize(now) for health in self.endpoints.values()]
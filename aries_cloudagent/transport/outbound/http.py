@@ -19,6 +19,11 @@ class HttpTransport(BaseOutboundTransport):
     schemes = ("http", "https")
     is_external = False
 
+    POOL_LIMIT = 200
+    POOL_LIMIT_PER_HOST = 50
+    KEEPALIVE_TIMEOUT = 15.0
+    DNS_CACHE_TTL = 10
+
     def __init__(self, **kwargs) -> None:
         """Initialize an `HttpTransport` instance."""
         super().__init__(**kwargs)
@@ -26,9 +31,23 @@ class HttpTransport(BaseOutboundTransport):
         self.connector: TCPConnector = None
         self.logger = logging.getLogger(__name__)
 
+    def connector_args(self) -> dict:
+        """Get the connection pool parameters from the profile settings."""
+        settings = self.root_profile.settings if self.root_profile else {}
+        dns_cache_ttl = settings.get("transport.http.dns_cache_ttl", self.DNS_CACHE_TTL)
+        return {
+            "limit": settings.get("transport.http.pool_limit") or self.POOL_LIMIT,
+            "limit_per_host": settings.get("transport.http.pool_limit_per_host")
+            or self.POOL_LIMIT_PER_HOST,
+            "keepalive_timeout": settings.get("transport.http.keepalive_timeout")
+            or self.KEEPALIVE_TIMEOUT,
+            "use_dns_cache": bool(dns_cache_ttl),
+            "ttl_dns_cache": dns_cache_ttl or None,
+        }
+
     async def start(self):
         """Start the transport."""
-        self.connector = TCPConnector(limit=200, limit_per_host=50)
+        self.connector = TCPConnector(**self.connector_args())
         session_args = {
             "cookie_jar": DummyCookieJar(),
             "connector": self.connector,
@@ -36,7 +55,7 @@ class HttpTransport(BaseOutboundTransport):
         }
         if self.collector:
             session_args["trace_configs"] = [
-                StatsTracer(self.collector, "outbound-http:")
+                StatsTracer(self.collector, "outbound-http:", per_host=True)
             ]
         self.client_session = ClientSession(**session_args)
         return self
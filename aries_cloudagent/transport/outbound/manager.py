@@ -1,12 +1,17 @@
 """Outbound transport manager."""
 
 import asyncio
+import heapq
 import json
 import logging
+import random
+import sys
 import time
 
+from collections import deque
 from typing import Callable, Type
 from urllib.parse import urlparse
+from uuid import uuid4
 
 from ...connections.models.connection_target import ConnectionTarget
 from ...core.profile import Profile
@@ -16,6 +21,7 @@ from ...utils.task_queue import CompletedTask, TaskQueue, task_exc_info
 
 from ...utils.tracing import trace_event, get_timer
 
+from ..journal import MessageJournal, pack_payload, unpack_payload
 from ..wire_format import BaseWireFormat
 
 from .base import (
@@ -24,16 +30,25 @@ from .base import (
     OutboundTransportRegistrationError,
     QueuedOutboundMessage,
 )
+from .health import EndpointHealthRegistry
 from .message import OutboundMessage
+from .webhooks import BATCH_TOPIC, WebhookBatch, WebhookBatcher
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
+RECORD_TYPE_OUTBOUND_QUEUED = "outbound_queued"
 
 
 class OutboundTransportManager:
     """Outbound transport manager class."""
 
     MAX_RETRY_COUNT = 4
+    RETRY_BACKOFF = 10.0
+    RETRY_BACKOFF_MAX = 600.0
+    RETRY_JITTER = 0.2
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30.0
+    STOP_DRAIN_TIMEOUT = 0.5
 
     def __init__(self, profile: Profile, handle_not_delivered: Callable = None):
         """Initialize a `OutboundTransportManager` instance.
@@ -46,18 +61,64 @@ class OutboundTransportManager:
         self.root_profile = profile
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
+        self.outbound_buffer = set()
         self.outbound_event = asyncio.Event()
-        self.outbound_new = []
+        self.outbound_new = deque()
+        self.outbound_ready = deque()
+        self.outbound_retry = []
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
         self.task_queue = TaskQueue(max_active=200)
         self._process_task: asyncio.Task = None
+        self._retry_count = 0
+        self._start_tasks = []
+        self.journal: MessageJournal = None
+        self.journal_ids = set()
+        if self.root_profile.settings.get("transport.persistent_queue"):
+            self.journal = MessageJournal(
+                self.root_profile, RECORD_TYPE_OUTBOUND_QUEUED
+            )
         if self.root_profile.settings.get("transport.max_outbound_retry"):
             self.MAX_RETRY_COUNT = self.root_profile.settings[
                 "transport.max_outbound_retry"
             ]
+        if self.root_profile.settings.get("transport.outbound_retry_backoff"):
+            self.RETRY_BACKOFF = self.root_profile.settings[
+                "transport.outbound_retry_backoff"
+            ]
+        if self.root_profile.settings.get("transport.outbound_retry_backoff_max"):
+            self.RETRY_BACKOFF_MAX = self.root_profile.settings[
+                "transport.outbound_retry_backoff_max"
+            ]
+        self.endpoint_health = EndpointHealthRegistry(
+            failure_threshold=self.root_profile.settings.get(
+                "transport.circuit_failure_threshold", self.CIRCUIT_FAILURE_THRESHOLD
+            ),
+            reset_timeout=self.root_profile.settings.get(
+                "transport.circuit_reset_timeout"
+            )
+            or self.CIRCUIT_RESET_TIMEOUT,
+            max_reset_timeout=self.RETRY_BACKOFF_MAX,
+        )
+        self.webhook_batcher: WebhookBatcher = None
+        if self.root_profile.settings.get("admin.webhook_batch_size"):
+            self.webhook_batcher = WebhookBatcher(
+                self.send_webhook_batch,
+                max_size=self.root_profile.settings["admin.webhook_batch_size"],
+                interval=(
+                    self.root_profile.settings.get("admin.webhook_batch_interval")
+                    or 100
+                )
+                / 1000,
+                coalesce=bool(
+                    self.root_profile.settings.get("admin.webhook_batch_coalesce")
+                ),
+                max_active=self.root_profile.settings.get(
+                    "admin.webhook_batch_concurrency"
+                )
+                or 1,
+            )
 
     async def setup(self):
         """Perform setup operations."""
@@ -151,14 +212,27 @@ class OutboundTransportManager:
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
-        for transport_id in self.registered_transports:
+        self._start_tasks = [
             self.task_queue.run(self.start_transport(transport_id))
+            for transport_id in self.registered_transports
+        ]
 
     async def stop(self, wait: bool = True):
-        """Stop all running transports."""
+        """Stop all running transports.
+
+        Pending webhook batches are sent, and when `wait` is set, queued
+        messages are given up to `STOP_DRAIN_TIMEOUT` seconds to be delivered
+        before the queue processing is cancelled.
+        """
+        if self.webhook_batcher:
+            self.webhook_batcher.flush_all()
+        if wait and (self.outbound_new or self.outbound_buffer):
+            await asyncio.wait([self.process_queued()], timeout=self.STOP_DRAIN_TIMEOUT)
         if self._process_task and not self._process_task.done():
             self._process_task.cancel()
         await self.task_queue.complete(None if wait else 0)
+        if self.journal:
+            await self.journal.close()
         for transport in self.running_transports.values():
             await transport.stop()
         self.running_transports = {}
@@ -249,9 +323,108 @@ class OutboundTransportManager:
         else:
             queued = QueuedOutboundMessage(profile, outbound, target, transport_id)
             queued.retries = self.MAX_RETRY_COUNT
+            if self.journal and not await self.journal_message(queued, transport):
+                return
             self.outbound_new.append(queued)
             self.process_queued()
 
+    async def journal_message(
+        self, queued: QueuedOutboundMessage, transport: BaseOutboundTransport
+    ) -> bool:
+        """Encode a queued message and record it in the journal.
+
+        The message is encoded before being recorded so that it can be delivered
+        after a restart without access to the sender's wallet, and so that the
+        plaintext is never written to storage.
+
+        Returns:
+            False if the message is already queued or could not be encoded
+
+        """
+        queued.queue_id = self.queued_message_id(queued)
+        if queued.queue_id in self.journal_ids:
+            LOGGER.debug("Skipping duplicate outbound message: %s", queued.queue_id)
+            return False
+        if queued.message.enc_payload:
+            queued.payload = queued.message.enc_payload
+        else:
+            try:
+                await self.perform_encode(queued, transport.wire_format)
+            except Exception:
+                queued.error = sys.exc_info()
+                queued.state = QueuedOutboundMessage.STATE_DONE
+                self.finished_queued(queued)
+                return False
+        queued.state = QueuedOutboundMessage.STATE_PENDING
+        self.journal_ids.add(queued.queue_id)
+        await self.journal.add(queued.queue_id, self.journal_value(queued))
+        return True
+
+    def queued_message_id(self, queued: QueuedOutboundMessage) -> str:
+        """Derive the identifier used to deduplicate a queued message.
+
+        Messages are identified by their `@id` and endpoint, so that the same
+        message queued twice for an endpoint is only delivered once.
+        """
+        msg_id = None
+        if queued.message:
+            try:
+                msg_id = json.loads(queued.message.payload).get("@id")
+            except (AttributeError, TypeError, ValueError):
+                pass
+        return f"{msg_id}:{queued.endpoint}" if msg_id else str(uuid4())
+
+    def journal_value(self, queued: QueuedOutboundMessage) -> dict:
+        """Get the journal entry for a queued message."""
+        return {
+            "endpoint": queued.endpoint,
+            "payload": pack_payload(queued.payload),
+            "metadata": queued.metadata,
+            "api_key": queued.api_key,
+            "retries": queued.retries,
+            "attempts": queued.attempts,
+        }
+
+    async def replay(self) -> int:
+        """Queue the messages recorded in the journal before the last shutdown.
+
+        Returns:
+            The number of messages restored
+
+        """
+        if not self.journal:
+            return 0
+        if self._start_tasks:
+            await asyncio.wait(self._start_tasks)
+        restored = 0
+        for queue_id, value in await self.journal.load():
+            if queue_id in self.journal_ids:
+                continue
+            try:
+                transport_id = self.get_running_transport_for_endpoint(
+                    value["endpoint"]
+                )
+            except OutboundDeliveryError as err:
+                LOGGER.warning("Discarding queued outbound message: %s", err)
+                self.journal.remove(queue_id)
+                continue
+            queued = QueuedOutboundMessage(self.root_profile, None, None, transport_id)
+            queued.queue_id = queue_id
+            queued.endpoint = value["endpoint"]
+            queued.payload = unpack_payload(value["payload"])
+            queued.metadata = value.get("metadata")
+            queued.api_key = value.get("api_key")
+            queued.retries = value.get("retries") or 0
+            queued.attempts = value.get("attempts") or 0
+            queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.journal_ids.add(queue_id)
+            self.outbound_new.append(queued)
+            restored += 1
+        if restored:
+            LOGGER.info("Restored %d queued outbound messages", restored)
+            self.process_queued()
+        return restored
+
     async def encode_outbound_message(
         self, profile: Profile, outbound: OutboundMessage, target: ConnectionTarget
     ):
@@ -294,17 +467,47 @@ class OutboundTransportManager:
 
         """
         transport_id = self.get_running_transport_for_endpoint(endpoint)
-        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        api_key = None
         if len(endpoint.split("#")) > 1:
             endpoint_hash_split = endpoint.split("#")
             endpoint = endpoint_hash_split[0]
             api_key = endpoint_hash_split[1]
-            queued.api_key = api_key
+        if self.webhook_batcher:
+            self.webhook_batcher.add(
+                topic, payload, endpoint, api_key, metadata, max_attempts
+            )
+            return
+        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        queued.api_key = api_key
         queued.endpoint = f"{endpoint}/topic/{topic}/"
         queued.metadata = metadata
         queued.payload = json.dumps(payload)
+        self.queue_webhook(queued, max_attempts)
+
+    def send_webhook_batch(self, batch: WebhookBatch):
+        """Queue a batch of webhooks for delivery as a JSON array.
+
+        Raises:
+            OutboundDeliveryError: if the associated transport is not running
+
+        """
+        transport_id = self.get_running_transport_for_endpoint(batch.endpoint)
+        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        queued.api_key = batch.api_key
+        queued.endpoint = f"{batch.endpoint}/topic/{BATCH_TOPIC}/"
+        queued.metadata = batch.metadata
+        queued.payload = json.dumps(batch.payload)
+        queued.batch_key = batch.key
+        self.queue_webhook(queued, batch.max_attempts)
+
+    def queue_webhook(self, queued: QueuedOutboundMessage, max_attempts: int = None):
+        """Add an encoded webhook to the queue."""
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
+        if self.journal:
+            queued.queue_id = str(uuid4())
+            self.journal_ids.add(queued.queue_id)
+            self.journal.add(queued.queue_id, self.journal_value(queued))
         self.outbound_new.append(queued)
         self.process_queued()
 
@@ -332,68 +535,67 @@ class OutboundTransportManager:
             self._process_task = None
 
     async def _process_loop(self):
-        """Continually kick off encoding and delivery on outbound messages."""
+        """Kick off encoding and delivery of outbound messages as they become ready.
+
+        New messages and messages ready for delivery are kept in FIFO queues,
+        while messages waiting to be retried are kept in a heap ordered by
+        retry time. The loop only wakes when a message is added or finishes a
+        step, or when the earliest retry falls due.
+
+        Messages for an endpoint whose circuit is open are not encoded or
+        delivered, but go straight to the retry or undeliverable path without
+        occupying the task queue.
+        """
         # Note: this method should not call async methods apart from
         # waiting for the updated event, to avoid yielding to other queue methods
 
         while True:
             self.outbound_event.clear()
             loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered and queued.message:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
-
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.root_profile.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
-                    )
 
-                upd_buffer.append(queued)
-
-            new_pending = 0
-            new_messages = self.outbound_new
-            self.outbound_new = []
+            while self.outbound_retry and self.outbound_retry[0][0] <= loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                if queued.state == QueuedOutboundMessage.STATE_RETRY:
+                    queued.retry_at = None
+                    if queued.payload is None:
+                        # deferred by an open circuit before encoding
+                        queued.state = QueuedOutboundMessage.STATE_NEW
+                        self.outbound_new.append(queued)
+                    else:
+                        queued.state = QueuedOutboundMessage.STATE_PENDING
+                        self.outbound_ready.append(queued)
+
+            while self.outbound_ready and self.task_queue.ready:
+                queued = self.outbound_ready.popleft()
+                if queued.state != QueuedOutboundMessage.STATE_PENDING:
+                    continue
+                if not self.endpoint_health.allow(queued.endpoint):
+                    self.short_circuit(queued)
+                    continue
+                queued.state = QueuedOutboundMessage.STATE_DELIVER
+                p_time = trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START." + queued.endpoint,
+                )
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.root_profile.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            for queued in new_messages:
+            while self.outbound_new and self.task_queue.ready:
+                queued = self.outbound_new.popleft()
+                self.outbound_buffer.add(queued)
                 if queued.state == QueuedOutboundMessage.STATE_NEW:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self.outbound_ready.append(queued)
+                    elif not self.endpoint_health.allow(queued.endpoint, probe=False):
+                        self.short_circuit(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
                         p_time = trace_event(
@@ -408,20 +610,85 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
-                else:
-                    new_pending += 1
+                elif queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    self.outbound_ready.append(queued)
 
-                upd_buffer.append(queued)
-
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            if self.outbound_ready and self.task_queue.ready:
+                continue
+            if not self.outbound_buffer and not self.outbound_new:
                 break
+            timeout = None
+            if self.outbound_retry:
+                timeout = max(self.outbound_retry[0][0] - get_timer(), 0)
+            try:
+                await asyncio.wait_for(self.outbound_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def retry_delay(self, attempts: int) -> float:
+        """Get the delay before retrying delivery after a number of failed attempts.
+
+        The delay grows exponentially from `RETRY_BACKOFF` up to
+        `RETRY_BACKOFF_MAX`, and is randomized by up to `RETRY_JITTER` in
+        either direction so that messages failing together are not all
+        retried together.
+        """
+        delay = min(
+            self.RETRY_BACKOFF * (2 ** max(attempts - 1, 0)), self.RETRY_BACKOFF_MAX
+        )
+        return delay * random.uniform(1 - self.RETRY_JITTER, 1 + self.RETRY_JITTER)
+
+    def schedule_retry(self, queued: QueuedOutboundMessage, not_before: float = None):
+        """Schedule a queued message for another delivery attempt."""
+        queued.state = QueuedOutboundMessage.STATE_RETRY
+        queued.retry_at = time.perf_counter() + self.retry_delay(queued.attempts)
+        if not_before and not_before > queued.retry_at:
+            queued.retry_at = not_before
+        self._retry_count += 1
+        heapq.heappush(
+            self.outbound_retry, (queued.retry_at, self._retry_count, queued)
+        )
+        if self.journal and queued.queue_id:
+            self.journal.update(queued.queue_id, self.journal_value(queued))
+
+    def short_circuit(self, queued: QueuedOutboundMessage):
+        """Fail a delivery attempt to an endpoint whose circuit is open.
+
+        The attempt counts against the retries of the message as if delivery
+        had failed, and the next attempt is not made before the endpoint is
+        probed again.
+        """
+        queued.attempts += 1
+        error = OutboundDeliveryError(f"Endpoint unavailable: {queued.endpoint}")
+        queued.error = (OutboundDeliveryError, error, None)
+        if queued.retries:
+            LOGGER.debug(
+                "Deferring message to unavailable endpoint %s", queued.endpoint
+            )
+            queued.retries -= 1
+            self.schedule_retry(
+                queued, not_before=self.endpoint_health.retry_at(queued.endpoint)
+            )
+        else:
+            queued.state = QueuedOutboundMessage.STATE_DONE
+            self.finished_queued(queued)
+
+    def finished_queued(self, queued: QueuedOutboundMessage):
+        """Remove a queued message which has been delivered or has failed."""
+        self.outbound_buffer.discard(queued)
+        if self.webhook_batcher and queued.batch_key:
+            self.webhook_batcher.finished(queued.batch_key)
+        if self.journal and queued.queue_id:
+            self.journal_ids.discard(queued.queue_id)
+            self.journal.remove(queued.queue_id)
+        if queued.error:
+            LOGGER.exception(
+                "Outbound message could not be delivered to %s",
+                queued.endpoint,
+                exc_info=queued.error,
+            )
+            if self.handle_not_delivered and queued.message:
+                self.handle_not_delivered(queued.profile, queued.message)
 
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
@@ -454,14 +721,17 @@ class OutboundTransportManager:
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.finished_queued(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self.outbound_ready.append(queued)
         queued.task = None
         self.process_queued()
 
     def deliver_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off delivery of a queued message."""
         transport = self.get_transport_instance(queued.transport_id)
+        queued.attempts += 1
         queued.task = self.task_queue.run(
             transport.handle_message(
                 queued.profile,
@@ -478,6 +748,7 @@ class OutboundTransportManager:
         """Handle completion of queued message delivery."""
         if completed.exc_info:
             queued.error = completed.exc_info
+            self.endpoint_health.record_failure(queued.endpoint, completed.exc_info[1])
 
             if queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
@@ -501,17 +772,19 @@ class OutboundTransportManager:
                         queued.error,
                     )
                 queued.retries -= 1
-                queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                self.schedule_retry(queued)
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
                 queued.state = QueuedOutboundMessage.STATE_DONE
+                self.finished_queued(queued)
         else:
+            self.endpoint_health.record_success(queued.endpoint)
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.finished_queued(queued)
         queued.task = None
         self.process_queued()
 
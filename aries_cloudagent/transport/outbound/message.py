@@ -3,6 +3,22 @@
 from typing import Sequence, Union
 
 from ...connections.models.connection_target import ConnectionTarget
+from ..journal import pack_payload, unpack_payload
+
+
+TARGET_FIELDS = (
+    "did",
+    "endpoint",
+    "label",
+    "recipient_keys",
+    "routing_keys",
+    "sender_key",
+)
+
+
+def target_value(target: ConnectionTarget) -> dict:
+    """Convert a connection target to a dictionary of its attributes."""
+    return {field: getattr(target, field) for field in TARGET_FIELDS}
 
 
 class OutboundMessage:
@@ -36,6 +52,38 @@ class OutboundMessage:
         self.target_list = list(target_list) if target_list else []
         self.to_session_only = to_session_only
 
+    def serialize(self) -> dict:
+        """Convert the message to a JSON-compatible dictionary.
+
+        Byte strings are base64 encoded, see `deserialize`.
+        """
+        return {
+            "connection_id": self.connection_id,
+            "enc_payload": pack_payload(self.enc_payload),
+            "endpoint": self._endpoint,
+            "payload": pack_payload(self.payload),
+            "reply_session_id": self.reply_session_id,
+            "reply_thread_id": self.reply_thread_id,
+            "reply_to_verkey": self.reply_to_verkey,
+            "reply_from_verkey": self.reply_from_verkey,
+            "target": self.target and target_value(self.target),
+            "target_list": [target_value(target) for target in self.target_list],
+            "to_session_only": self.to_session_only,
+        }
+
+    @classmethod
+    def deserialize(cls, value: dict) -> "OutboundMessage":
+        """Restore a message converted by `serialize`."""
+        value = dict(value)
+        value["enc_payload"] = unpack_payload(value.get("enc_payload"))
+        value["payload"] = unpack_payload(value.get("payload"))
+        if value.get("target"):
+            value["target"] = ConnectionTarget(**value["target"])
+        value["target_list"] = [
+            ConnectionTarget(**target) for target in value.get("target_list") or []
+        ]
+        return cls(**value)
+
     def __repr__(self) -> str:
         """Return a human readable representation of this class.
 
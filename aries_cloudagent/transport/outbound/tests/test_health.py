@@ -0,0 +1,99 @@
+from unittest import TestCase, mock
+
+from ..health import CircuitState, EndpointHealthRegistry
+
+
+class TestEndpointHealthRegistry(TestCase):
+    def setUp(self):
+        self.time = 100.0
+        self.registry = EndpointHealthRegistry(
+            failure_threshold=3, reset_timeout=10.0, max_reset_timeout=25.0
+        )
+        patcher = mock.patch.object(self.registry, "now", lambda: self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_endpoint_key(self):
+        key = EndpointHealthRegistry.endpoint_key
+        assert key("http://host:8020/a/b?c") == "http://host:8020"
+        assert key("ws://host/") == "ws://host"
+        assert key("local") == "local"
+
+    def test_open(self):
+        for _ in range(2):
+            self.registry.record_failure("http://host/a", KeyError("refused"))
+            assert self.registry.allow("http://host/b")
+        self.registry.record_failure("http://host/a", KeyError("refused"))
+        health = self.registry.get("http://host")
+        assert health.state == CircuitState.OPEN
+        assert not self.registry.allow("http://host/b")
+        assert not self.registry.allow("http://host/b", probe=False)
+        assert health.short_circuited == 2
+        assert self.registry.retry_at("http://host") == 110.0
+        assert self.registry.allow("http://other")
+
+        assert self.registry.serialize() == [
+            {
+                "endpoint": "http://host",
+                "state": "open",
+                "failures": 3,
+                "total_failures": 3,
+                "short_circuited": 2,
+                "last_error": "'refused'",
+                "open_for": 0.0,
+                "retry_in": 10.0,
+            }
+        ]
+
+    def test_probe(self):
+        for _ in range(3):
+            self.registry.record_failure("http://host")
+        self.time += 10.0
+        assert self.registry.allow("http://host", probe=False)
+        assert self.registry.get("http://host").state == CircuitState.OPEN
+        assert self.registry.allow("http://host")
+        assert self.registry.get("http://host").state == CircuitState.HALF_OPEN
+        assert not self.registry.allow("http://host")
+        assert self.registry.retry_at("http://host") == 120.0
+
+        # failed probes back off up to the maximum reset timeout
+        self.registry.record_failure("http://host")
+        health = self.registry.get("http://host")
+        assert (health.state, health.retry_at) == (CircuitState.OPEN, 130.0)
+        self.time = 130.0
+        assert self.registry.allow("http://host")
+        self.registry.record_failure("http://host")
+        assert health.retry_at == 155.0
+
+        self.time = 155.0
+        assert self.registry.allow("http://host")
+        self.registry.record_success("http://host/path")
+        assert not self.registry.endpoints
+        assert self.registry.allow("http://host")
+        assert self.registry.retry_at("http://host") == 155.0
+
+    def test_disabled(self):
+        self.registry.failure_threshold = 0
+        for _ in range(10):
+            self.registry.record_failure("http://host")
+        assert self.registry.allow("http://host")
+        assert self.registry.get("http://host").failures == 10
+
+    def test_prune(self):
+        self.registry.max_endpoints = 3
+        for idx in range(3):
+            self.registry.record_failure(f"http://host{idx}")
+            self.time += 10.0
+        self.registry.record_failure("http://host3")
+        assert list(self.registry.endpoints) == [
+            "http://host1",
+            "http://host2",
+            "http://host3",
+        ]
+        self.time += 1.0
+        self.registry.record_failure("http://host4")
+        assert list(self.registry.endpoints) == [
+            "http://host2",
+            "http://host3",
+            "http://host4",
+        ]
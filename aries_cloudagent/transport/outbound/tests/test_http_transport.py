@@ -112,12 +112,66 @@ class TestHttpTransport(AioHTTPTestCase):
         )
 
         results = transport.collector.extract()
+        host = f"outbound-http:localhost:{self.server.port}"
         assert results["count"] == {
             "outbound-http:dns_resolve": 1,
             "outbound-http:connect": 1,
             "outbound-http:POST": 1,
+            f"{host}:dns_resolve": 1,
+            f"{host}:connect": 1,
+            f"{host}:POST": 1,
         }
 
+    async def test_stats_reuse(self):
+        server_addr = f"http://localhost:{self.server.port}"
+
+        transport = HttpTransport()
+        transport.collector = Collector()
+        async with transport:
+            for _ in range(3):
+                await asyncio.wait_for(
+                    transport.handle_message(self.profile, b"{}", server_addr), 5.0
+                )
+
+        results = transport.collector.extract()
+        host = f"outbound-http:localhost:{self.server.port}"
+        assert results["count"][f"{host}:connect"] == 1
+        assert results["count"][f"{host}:reuse"] == 2
+        assert results["count"][f"{host}:POST"] == 3
+
+    async def test_connector_settings(self):
+        transport = HttpTransport()
+        assert transport.connector_args() == {
+            "limit": HttpTransport.POOL_LIMIT,
+            "limit_per_host": HttpTransport.POOL_LIMIT_PER_HOST,
+            "keepalive_timeout": HttpTransport.KEEPALIVE_TIMEOUT,
+            "use_dns_cache": True,
+            "ttl_dns_cache": HttpTransport.DNS_CACHE_TTL,
+        }
+
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.http.pool_limit": 400,
+                "transport.http.pool_limit_per_host": 100,
+                "transport.http.keepalive_timeout": 60,
+                "transport.http.dns_cache_ttl": 0,
+            }
+        )
+        transport = HttpTransport(root_profile=profile)
+        await transport.start()
+        assert transport.connector.limit == 400
+        assert transport.connector.limit_per_host == 100
+        assert transport.connector._keepalive_timeout == 60
+        assert not transport.connector.use_dns_cache
+        await transport.stop()
+
+    async def test_trust_env(self):
+        transport = HttpTransport()
+        with async_mock.patch.dict("os.environ", {}, clear=True):
+            await transport.start()
+        assert transport.client_session.trust_env
+        await transport.stop()
+
     async def test_transport_coverage(self):
         transport = HttpTransport()
         assert transport.wire_format is None
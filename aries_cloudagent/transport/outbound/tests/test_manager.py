@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
@@ -13,11 +14,12 @@ from ..manager import (
     OutboundTransportRegistrationError,
     QueuedOutboundMessage,
 )
+from ..health import CircuitState
 from ..message import OutboundMessage
 
 
 class TestOutboundTransportManager(AsyncTestCase):
-    def test_register_path(self):
+    async def test_register_path(self):
         mgr = OutboundTransportManager(InMemoryProfile.test_profile())
         mgr.register("http")
         assert mgr.get_registered_transport_for_scheme("http")
@@ -31,7 +33,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         with self.assertRaises(OutboundTransportRegistrationError):
             mgr.register("no.such.module.path")
 
-    def test_maximum_retry_count(self):
+    async def test_maximum_retry_count(self):
         profile = InMemoryProfile.test_profile({"transport.max_outbound_retry": 5})
         mgr = OutboundTransportManager(profile)
         mgr.register("http")
@@ -180,7 +182,9 @@ class TestOutboundTransportManager(AsyncTestCase):
             mgr._process_done(mock_task)
 
     async def test_process_finished_x(self):
-        mock_queued = async_mock.MagicMock(retries=1)
+        mock_queued = async_mock.MagicMock(
+            endpoint="http://localhost", retries=1, attempts=1
+        )
         mock_task = async_mock.MagicMock(
             exc_info=(KeyError, KeyError("nope"), None),
         )
@@ -192,7 +196,10 @@ class TestOutboundTransportManager(AsyncTestCase):
         ) as mock_mgr_process:
             mgr.finished_encode(mock_queued, mock_task)
             mgr.finished_deliver(mock_queued, mock_task)
+            assert mock_queued.state == QueuedOutboundMessage.STATE_RETRY
+            assert mgr.outbound_retry[0][2] is mock_queued
             mgr.finished_deliver(mock_queued, mock_task)
+            assert mock_queued.state == QueuedOutboundMessage.STATE_DONE
 
     async def test_process_loop_retry_now(self):
         mock_queued = async_mock.MagicMock(
@@ -203,7 +210,8 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with async_mock.patch.object(
             test_module, "trace_event", async_mock.MagicMock()
@@ -212,6 +220,8 @@ class TestOutboundTransportManager(AsyncTestCase):
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is None
+            assert mock_queued.state == QueuedOutboundMessage.STATE_DELIVER
+            assert not mgr.outbound_retry
 
     async def test_process_loop_retry_later(self):
         mock_queued = async_mock.MagicMock(
@@ -222,27 +232,30 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+        mgr.outbound_retry.append((mock_queued.retry_at, 0, mock_queued))
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", async_mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
+            mock_wait_for.call_args[0][0].close()
+            assert 3500 < mock_wait_for.call_args[0][1] <= 3600
             assert mock_queued.retry_at is not None
+            assert mock_queued.state == QueuedOutboundMessage.STATE_RETRY
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
 
-        mgr.outbound_new = [
-            async_mock.MagicMock(
-                state=test_module.QueuedOutboundMessage.STATE_NEW,
-                message=async_mock.MagicMock(enc_payload=b"encr"),
-            )
-        ]
+        mock_queued = async_mock.MagicMock(
+            state=test_module.QueuedOutboundMessage.STATE_NEW,
+            message=async_mock.MagicMock(enc_payload=b"encr"),
+        )
+        mgr.outbound_new.append(mock_queued)
         with async_mock.patch.object(
             mgr, "deliver_queued_message", async_mock.MagicMock()
         ) as mock_deliver, async_mock.patch.object(
@@ -254,18 +267,22 @@ class TestOutboundTransportManager(AsyncTestCase):
 
             with self.assertRaises(KeyError):
                 await mgr._process_loop()
+            mock_deliver.assert_called_once_with(mock_queued)
+            assert mock_queued.payload == b"encr"
+            assert mock_queued.state == QueuedOutboundMessage.STATE_DELIVER
+            assert mock_queued in mgr.outbound_buffer
 
     async def test_process_loop_new_deliver(self):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
 
-        mgr.outbound_new = [
+        mgr.outbound_new.append(
             async_mock.MagicMock(
                 state=test_module.QueuedOutboundMessage.STATE_DELIVER,
                 message=async_mock.MagicMock(enc_payload=b"encr"),
             )
-        ]
+        )
         with async_mock.patch.object(
             mgr, "deliver_queued_message", async_mock.MagicMock()
         ) as mock_deliver, async_mock.patch.object(
@@ -277,6 +294,27 @@ class TestOutboundTransportManager(AsyncTestCase):
 
             with self.assertRaises(KeyError):
                 await mgr._process_loop()
+            mock_deliver.assert_not_called()
+
+    async def test_process_loop_busy(self):
+        profile = InMemoryProfile.test_profile()
+        mgr = OutboundTransportManager(profile)
+        mgr.task_queue = async_mock.MagicMock(ready=False)
+
+        mock_queued = async_mock.MagicMock(
+            state=test_module.QueuedOutboundMessage.STATE_NEW,
+            message=async_mock.MagicMock(enc_payload=b"encr"),
+        )
+        mgr.outbound_new.append(mock_queued)
+        with async_mock.patch.object(
+            mgr.outbound_event, "wait", async_mock.CoroutineMock()
+        ) as mock_wait:
+            mock_wait.side_effect = KeyError()  # wait for room in the task queue
+
+            with self.assertRaises(KeyError):
+                await mgr._process_loop()
+            assert list(mgr.outbound_new) == [mock_queued]
+            assert mock_queued.state == QueuedOutboundMessage.STATE_NEW
 
     async def test_process_loop_x(self):
         mock_queued = async_mock.MagicMock(
@@ -289,20 +327,268 @@ class TestOutboundTransportManager(AsyncTestCase):
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
+
+        mgr.finished_queued(mock_queued)
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
+        assert not mgr.outbound_buffer
 
         await mgr._process_loop()
 
+    async def test_retry_delay(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_retry_backoff": 2,
+                "transport.outbound_retry_backoff_max": 20,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        for attempts, delay in ((1, 2), (2, 4), (3, 8), (4, 16), (5, 20), (9, 20)):
+            assert (
+                delay * (1 - mgr.RETRY_JITTER)
+                <= mgr.retry_delay(attempts)
+                <= delay * (1 + mgr.RETRY_JITTER)
+            )
+
+    async def test_send_retry(self):
+        profile = InMemoryProfile.test_profile(
+            {"transport.outbound_retry_backoff": 0.01}
+        )
+        mgr = OutboundTransportManager(profile)
+
+        transport = async_mock.MagicMock()
+        transport.handle_message = async_mock.CoroutineMock(
+            side_effect=[OutboundDeliveryError("down"), None]
+        )
+        transport.schemes = ["http"]
+        transport.is_external = False
+        mgr.running_transports["transport_cls"] = transport
+
+        message = OutboundMessage(payload="{}", enc_payload=b"encr")
+        message.target = ConnectionTarget(endpoint="http://localhost")
+        await mgr.enqueue_message(InMemoryProfile.test_profile(), message)
+        await mgr.flush()
+
+        assert transport.handle_message.await_count == 2
+        assert not mgr.outbound_buffer
+        assert not mgr.outbound_retry
+
+    async def test_circuit_breaker(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_retry_backoff": 0.01,
+                "transport.circuit_failure_threshold": 1,
+                "transport.circuit_reset_timeout": 0.05,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport(
+            side_effect=[OutboundDeliveryError("down"), None, None]
+        )
+        mgr.running_transports["transport_cls"] = transport
+
+        message = OutboundMessage(payload="{}", enc_payload=b"encr")
+        message.target = ConnectionTarget(endpoint="http://localhost/a")
+        await mgr.enqueue_message(profile, message)
+        while not mgr.outbound_retry:
+            await asyncio.sleep(0.001)
+        health = mgr.endpoint_health.get("http://localhost")
+        assert health.state == CircuitState.OPEN
+
+        # held back without being encoded or taking a task queue slot
+        message = OutboundMessage(payload="{}")
+        message.target = ConnectionTarget(endpoint="http://localhost/b")
+        await mgr.enqueue_message(profile, message)
+        while len(mgr.outbound_retry) < 2:
+            await asyncio.sleep(0.001)
+        assert health.short_circuited == 1
+        transport.wire_format.encode_message.assert_not_called()
+        assert mgr.task_queue.current_active == 0
+
+        await mgr.flush()
+        assert transport.handle_message.await_count == 3
+        transport.wire_format.encode_message.assert_awaited_once()
+        assert not mgr.endpoint_health.endpoints
+        assert not mgr.outbound_buffer
+
+    async def test_short_circuit_not_delivered(self):
+        profile = InMemoryProfile.test_profile()
+        mock_handle_not_delivered = async_mock.MagicMock()
+        mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
+        mock_queued = async_mock.MagicMock(
+            endpoint="http://localhost", retries=0, attempts=4
+        )
+        mgr.outbound_buffer.add(mock_queued)
+        with async_mock.patch.object(
+            test_module.LOGGER, "exception", async_mock.MagicMock()
+        ):
+            mgr.short_circuit(mock_queued)
+        assert mock_queued.attempts == 5
+        assert isinstance(mock_queued.error[1], OutboundDeliveryError)
+        assert mock_queued.state == QueuedOutboundMessage.STATE_DONE
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
+        assert not mgr.outbound_buffer
+
+    async def test_enqueue_webhook_batch(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "admin.webhook_batch_size": 3,
+                "admin.webhook_batch_interval": 10,
+                "admin.webhook_batch_coalesce": True,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport()
+        mgr.running_transports["transport_cls"] = transport
+
+        metadata = {"x-wallet-id": "wallet"}
+        for n in range(4):
+            mgr.enqueue_webhook("ping", {"n": n}, "http://hook#key", None, metadata)
+        mgr.enqueue_webhook("connections", {"connection_id": "c1"}, "http://hook")
+        await mgr.flush()
+        transport.handle_message.assert_awaited_once_with(
+            None,
+            json.dumps([{"topic": "ping", "payload": {"n": n}} for n in range(3)]),
+            "http://hook/topic/batch/",
+            metadata,
+            "key",
+        )
+
+        await asyncio.sleep(0.02)
+        await mgr.flush()
+        assert transport.handle_message.await_count == 3
+        assert not mgr.webhook_batcher.active
+        assert mgr.webhook_batcher.pending_count == 0
+
+    async def test_stop_delivers_webhook_batch(self):
+        profile = InMemoryProfile.test_profile(
+            {"admin.webhook_batch_size": 3, "admin.webhook_batch_interval": 10000}
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport()
+        mgr.running_transports["transport_cls"] = transport
+
+        mgr.enqueue_webhook("ping", {"n": 0}, "http://hook")
+        assert mgr.webhook_batcher.pending_count == 1
+        await mgr.stop()
+        transport.handle_message.assert_awaited_once_with(
+            None,
+            json.dumps([{"topic": "ping", "payload": {"n": 0}}]),
+            "http://hook/topic/batch/",
+            None,
+            None,
+        )
+        assert not mgr.outbound_buffer
+        transport.stop.assert_awaited_once_with()
+
+    def make_transport(self, **kwargs):
+        transport = async_mock.MagicMock(
+            schemes=["http"],
+            is_external=False,
+            handle_message=async_mock.CoroutineMock(**kwargs),
+            start=async_mock.CoroutineMock(),
+            stop=async_mock.CoroutineMock(),
+        )
+        transport.wire_format.encode_message = async_mock.CoroutineMock(
+            return_value=b"encoded"
+        )
+        return transport
+
+    async def test_persistent_queue(self):
+        profile = InMemoryProfile.test_profile({"transport.persistent_queue": True})
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport(side_effect=OutboundDeliveryError("down"))
+        transport_cls = async_mock.MagicMock(schemes=["http"], return_value=transport)
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+
+        message = OutboundMessage(payload=json.dumps({"@id": "msg-1"}))
+        message.target = ConnectionTarget(endpoint="http://localhost")
+        await mgr.enqueue_message(profile, message)
+        await mgr.enqueue_message(profile, message)  # duplicate
+        mgr.enqueue_webhook("topic", {"test": "payload"}, "http://admin#key")
+        await mgr.journal.flush()
+
+        entries = dict(await mgr.journal.load())
+        assert len(entries) == 2
+        entry = entries["msg-1:http://localhost"]
+        assert entry["payload"] == {"b64": "ZW5jb2RlZA=="}
+        transport.wire_format.encode_message.assert_awaited_once()
+
+        await mgr.task_queue.flush()
+        await mgr.journal.flush()
+        entries = dict(await mgr.journal.load())
+        assert entries["msg-1:http://localhost"]["attempts"] == 1
+        assert entries["msg-1:http://localhost"]["retries"] == mgr.MAX_RETRY_COUNT - 1
+        await mgr.stop(wait=False)
+
+        # restart and deliver the recorded messages
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport()
+        transport_cls.return_value = transport
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        assert await mgr.replay() == 2
+        await mgr.flush()
+        await mgr.journal.flush()
+
+        assert transport.handle_message.await_count == 2
+        delivered = {
+            call[0][2]: (call[0][1], call[0][4])
+            for call in transport.handle_message.await_args_list
+        }
+        assert delivered == {
+            "http://localhost": (b"encoded", None),
+            "http://admin/topic/topic/": ('{"test": "payload"}', "key"),
+        }
+        assert not await mgr.journal.load()
+        assert await mgr.replay() == 0
+        await mgr.stop()
+
+    async def test_persistent_queue_x(self):
+        profile = InMemoryProfile.test_profile({"transport.persistent_queue": True})
+        mgr = OutboundTransportManager(profile)
+        transport = self.make_transport()
+        transport.wire_format.encode_message.side_effect = KeyError("encode")
+        mgr.running_transports["transport_cls"] = transport
+
+        message = OutboundMessage(payload="{}")
+        message.target = ConnectionTarget(endpoint="http://localhost")
+        with async_mock.patch.object(
+            test_module.LOGGER, "exception", async_mock.MagicMock()
+        ) as mock_log:
+            await mgr.enqueue_message(profile, message)
+            mock_log.assert_called_once()
+        assert not mgr.outbound_new
+        await mgr.journal.flush()
+        assert not await mgr.journal.load()
+
+        await mgr.journal.add(
+            "unsupported", {"endpoint": "xmpp://localhost", "payload": "{}"}
+        )
+        assert await mgr.replay() == 0
+        await mgr.journal.flush()
+        assert not await mgr.journal.load()
+
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = async_mock.MagicMock(
-            state=QueuedOutboundMessage.STATE_DONE, retries=1
+            state=QueuedOutboundMessage.STATE_DONE,
+            endpoint="http://localhost",
+            retries=1,
+            attempts=1,
         )
-        mock_completed_x = async_mock.MagicMock(exc_info=KeyError("an error occurred"))
+        error = KeyError("an error occurred")
+        mock_completed_x = async_mock.MagicMock(exc_info=(KeyError, error, None))
 
         profile = InMemoryProfile.test_profile()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(profile, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_buffer.add(mock_queued)
         with async_mock.patch.object(
             test_module.LOGGER, "exception", async_mock.MagicMock()
         ) as mock_logger_exception, async_mock.patch.object(
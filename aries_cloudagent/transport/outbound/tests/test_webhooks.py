@@ -0,0 +1,106 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ....connections.models.conn_record import ConnRecord
+
+from ..webhooks import WebhookBatcher, record_id_name
+
+
+class TestWebhookBatcher(AsyncTestCase):
+    def setUp(self):
+        self.sent = []
+
+    def send(self, batch):
+        self.sent.append(batch)
+
+    async def test_record_id_name(self):
+        assert record_id_name(ConnRecord.RECORD_TOPIC) == "connection_id"
+        assert record_id_name("no-such-topic") is None
+
+    async def test_batch_size(self):
+        batcher = WebhookBatcher(self.send, max_size=2, interval=60)
+        batcher.add("ping", {"n": 1}, "http://hook", "key")
+        batcher.add("ping", {"n": 2}, "http://other")
+        assert not self.sent
+        assert batcher.pending_count == 2
+
+        batcher.add("basicmessages", {"n": 3}, "http://hook", "key")
+        assert len(self.sent) == 1
+        batch = self.sent[0]
+        assert (batch.endpoint, batch.api_key) == ("http://hook", "key")
+        assert batch.payload == [
+            {"topic": "ping", "payload": {"n": 1}},
+            {"topic": "basicmessages", "payload": {"n": 3}},
+        ]
+        assert batcher.pending_count == 1
+
+    async def test_interval(self):
+        batcher = WebhookBatcher(self.send, interval=0.01)
+        metadata = {"x-wallet-id": "wallet"}
+        batcher.add("ping", {"n": 1}, "http://hook", None, metadata, 2)
+        batcher.add("ping", {"n": 2}, "http://hook")
+        await asyncio.sleep(0.05)
+        assert [batch.metadata for batch in self.sent] == [metadata, None]
+        assert [batch.max_attempts for batch in self.sent] == [2, None]
+        assert batcher.pending_count == 0
+
+    async def test_coalesce(self):
+        batcher = WebhookBatcher(self.send, interval=60, coalesce=True)
+        for state in ("request", "response", "active"):
+            batcher.add("connections", {"connection_id": "c1", "state": state}, "h")
+            batcher.add("connections", {"connection_id": "c2", "state": state}, "h")
+        batcher.add("ping", {"connection_id": "c1"}, "h")
+        batcher.add("ping", {"connection_id": "c1"}, "h")
+        batcher.flush_all()
+        assert [
+            (
+                entry["topic"],
+                entry["payload"]["connection_id"],
+                entry["payload"].get("state"),
+            )
+            for entry in self.sent[0].payload
+        ] == [
+            ("connections", "c1", "active"),
+            ("connections", "c2", "active"),
+            ("ping", "c1", None),
+            ("ping", "c1", None),
+        ]
+
+    async def test_max_active(self):
+        batcher = WebhookBatcher(self.send, max_size=1, interval=60, max_active=2)
+        for n in range(4):
+            batcher.add("ping", {"n": n}, "http://hook")
+        batcher.add("ping", {"n": 0}, "http://other")
+        assert [batch.payload[0]["payload"]["n"] for batch in self.sent] == [0, 1, 0]
+        assert batcher.pending_count == 2
+
+        key = self.sent[0].key
+        batcher.finished(key)
+        assert len(self.sent) == 4
+        batcher.finished(key)
+        batcher.finished(key)
+        batcher.finished(key)
+        assert len(self.sent) == 5
+        assert not batcher.active.get(key)
+        assert batcher.pending_count == 0
+
+    async def test_flush_all(self):
+        batcher = WebhookBatcher(self.send, max_size=1, interval=60)
+        batcher.add("ping", {"n": 1}, "http://hook")
+        batcher.add("ping", {"n": 2}, "http://hook")
+        batcher.add("ping", {"n": 3}, "http://hook", "key")
+        assert len(self.sent) == 2
+        batcher.max_size = 10
+        batcher.add("ping", {"n": 4}, "http://hook")
+        batcher.flush_all()
+        assert len(self.sent) == 4
+        assert batcher.pending_count == 0
+
+    async def test_send_x(self):
+        batcher = WebhookBatcher(
+            async_mock.MagicMock(side_effect=[KeyError(), None]), max_size=1
+        )
+        batcher.add("ping", {"n": 1}, "http://hook")
+        batcher.add("ping", {"n": 2}, "http://hook")
+        assert batcher.send.call_count == 2
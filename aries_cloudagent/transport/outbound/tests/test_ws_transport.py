@@ -13,9 +13,11 @@ class TestWsTransport(AioHTTPTestCase):
     async def setUpAsync(self):
         self.profile = InMemoryProfile.test_profile()
         self.message_results = []
+        self.connections = 0
         await super().setUpAsync()
 
     async def receive_message(self, request):
+        self.connections += 1
         ws = web.WebSocketResponse()
         await ws.prepare(request)
 
@@ -33,7 +35,12 @@ class TestWsTransport(AioHTTPTestCase):
         Override the get_app method to return your application.
         """
         app = web.Application()
-        app.add_routes([web.get("/", self.receive_message)])
+        app.add_routes(
+            [
+                web.get("/", self.receive_message),
+                web.get("/other", self.receive_message),
+            ]
+        )
         return app
 
     async def test_handle_message(self):
@@ -52,3 +59,37 @@ class TestWsTransport(AioHTTPTestCase):
             send_message(transport, b"{}", endpoint=server_addr), 5.0
         )
         assert self.message_results == [{}]
+
+    async def test_handle_message_persistent(self):
+        server_addr = f"ws://localhost:{self.server.port}"
+        profile = InMemoryProfile.test_profile(
+            settings={"transport.ws.outbound_sockets": 1}
+        )
+        transport = WsTransport(root_profile=profile)
+
+        async with transport:
+            for payload in ("{}", b"{}", "{}"):
+                await asyncio.wait_for(
+                    transport.handle_message(profile, payload, server_addr), 5.0
+                )
+            await asyncio.sleep(0.1)
+            assert self.message_results == [{}, {}, {}]
+            assert self.connections == 1
+
+            # the least recently used socket is closed beyond the limit
+            await asyncio.wait_for(
+                transport.handle_message(profile, "{}", server_addr + "/other"), 5.0
+            )
+            assert [key[0] for key in transport.sockets] == [server_addr + "/other"]
+            assert self.connections == 2
+
+            # a socket closed by the endpoint is replaced
+            await transport.sockets[(server_addr + "/other", ())].ws.close()
+            await asyncio.wait_for(
+                transport.handle_message(profile, "{}", server_addr + "/other"), 5.0
+            )
+            await asyncio.sleep(0.1)
+            assert self.connections == 3
+            assert len(self.message_results) == 5
+
+        assert not transport.sockets
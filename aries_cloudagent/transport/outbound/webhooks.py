@@ -0,0 +1,181 @@
+"""Batched delivery of webhooks."""
+
+import asyncio
+import logging
+from collections import deque
+from itertools import count
+from typing import Callable, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+BATCH_TOPIC = "batch"
+
+_RECORD_ID_NAMES = {}
+
+
+def record_id_name(topic: str) -> Optional[str]:
+    """Get the name of the record identifier in webhooks for a record topic."""
+    if topic not in _RECORD_ID_NAMES:
+        from ...messaging.models.base_record import BaseRecord
+
+        found = None
+        classes = [BaseRecord]
+        while classes:
+            cls = classes.pop()
+            if cls.RECORD_TOPIC == topic:
+                found = cls.RECORD_ID_NAME
+                break
+            classes.extend(cls.__subclasses__())
+        if not found:
+            # the record class may not have been loaded yet
+            return None
+        _RECORD_ID_NAMES[topic] = found
+    return _RECORD_ID_NAMES[topic]
+
+
+class WebhookBatch:
+    """Webhooks waiting to be delivered together to a target."""
+
+    def __init__(self, key: Tuple, endpoint: str, api_key: str, metadata: dict):
+        """Initialize the batch."""
+        self.key = key
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.metadata = metadata
+        self.entries = {}
+        self.max_attempts: int = None
+        self.timer: asyncio.TimerHandle = None
+
+    @property
+    def payload(self) -> list:
+        """Accessor for the webhooks of the batch, in order."""
+        return list(self.entries.values())
+
+
+class WebhookBatcher:
+    """Accumulate webhooks per target and hand them over in batches.
+
+    Webhooks are grouped by endpoint, API key and metadata (which identifies
+    the tenant), and handed to `send` once `max_size` webhooks have been
+    added or `interval` seconds have passed since the first one. While a
+    target already has `max_active` batches in flight, further batches are
+    held back until one of them is finished.
+
+    When `coalesce` is set, a record event supersedes any earlier event for
+    the same record which is still waiting in the batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[WebhookBatch], None],
+        *,
+        max_size: int = 100,
+        interval: float = 0.1,
+        coalesce: bool = False,
+        max_active: int = 1,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            send: Callback to deliver a batch, which must call `finished` once
+                the delivery succeeds or fails
+            max_size: The maximum number of webhooks in a batch
+            interval: The time in seconds to wait for more webhooks
+            coalesce: Whether to replace superseded record events
+            max_active: The maximum number of batches in flight per target
+
+        """
+        self.send = send
+        self.max_size = max_size
+        self.interval = interval
+        self.coalesce = coalesce
+        self.max_active = max_active
+        self.active = {}
+        self.pending = {}
+        self.ready = {}
+        self._seq = count()
+
+    @staticmethod
+    def batch_key(endpoint: str, api_key: str, metadata: dict) -> Tuple:
+        """Get the key grouping webhooks for the same target."""
+        return (endpoint, api_key, tuple(sorted(metadata.items())) if metadata else ())
+
+    def entry_key(self, topic: str, payload) -> Tuple:
+        """Get the key of a webhook within a batch."""
+        if self.coalesce and isinstance(payload, dict):
+            id_name = record_id_name(topic)
+            record_id = payload.get(id_name) if id_name else None
+            if record_id:
+                return (topic, record_id)
+        return (next(self._seq),)
+
+    @property
+    def pending_count(self) -> int:
+        """Accessor for the number of webhooks waiting to be sent."""
+        return sum(len(batch.entries) for batch in self.pending.values()) + sum(
+            len(batch.entries) for ready in self.ready.values() for batch in ready
+        )
+
+    def add(
+        self,
+        topic: str,
+        payload,
+        endpoint: str,
+        api_key: str = None,
+        metadata: dict = None,
+        max_attempts: int = None,
+    ):
+        """Add a webhook to the batch for its target."""
+        key = self.batch_key(endpoint, api_key, metadata)
+        batch = self.pending.get(key)
+        if not batch:
+            batch = self.pending[key] = WebhookBatch(key, endpoint, api_key, metadata)
+            batch.timer = asyncio.get_event_loop().call_later(
+                self.interval, self.close, key
+            )
+        entry_key = self.entry_key(topic, payload)
+        batch.entries.pop(entry_key, None)
+        batch.entries[entry_key] = {"topic": topic, "payload": payload}
+        if max_attempts is not None:
+            batch.max_attempts = max(batch.max_attempts or 0, max_attempts)
+        if len(batch.entries) >= self.max_size:
+            self.close(key)
+
+    def close(self, key: Tuple):
+        """Stop adding to the pending batch for a target and send it when possible."""
+        batch = self.pending.pop(key, None)
+        if batch:
+            batch.timer.cancel()
+            self.ready.setdefault(key, deque()).append(batch)
+            self._send_ready(key)
+
+    def _send_ready(self, key: Tuple, force: bool = False):
+        """Send the closed batches for a target while it is under its limit."""
+        ready = self.ready.get(key)
+        while ready and (force or self.active.get(key, 0) < self.max_active):
+            batch = ready.popleft()
+            self.active[key] = self.active.get(key, 0) + 1
+            try:
+                self.send(batch)
+            except Exception:
+                LOGGER.exception("Error sending webhook batch to %s", batch.endpoint)
+                self.active[key] -= 1
+        if not ready:
+            self.ready.pop(key, None)
+        if not self.active.get(key):
+            self.active.pop(key, None)
+
+    def finished(self, key: Tuple):
+        """Handle the completion of a batch delivery."""
+        if self.active.get(key):
+            self.active[key] -= 1
+        self._send_ready(key)
+
+    def flush_all(self):
+        """Send all pending batches, regardless of the limits."""
+        for key in list(self.pending):
+            batch = self.pending.pop(key)
+            batch.timer.cancel()
+            self.ready.setdefault(key, deque()).append(batch)
+        for key in list(self.ready):
+            self._send_ready(key, force=True)
@@ -1,33 +1,85 @@
 """Websockets outbound transport."""
 
+import asyncio
 import logging
-from typing import Union
+import time
+from collections import OrderedDict
+from typing import Tuple, Union
 
-from aiohttp import ClientSession, DummyCookieJar
+from aiohttp import ClientSession, ClientWebSocketResponse, DummyCookieJar
 
 from ...core.profile import Profile
 
 from .base import BaseOutboundTransport
 
 
+class OutboundSocket:
+    """A WebSocket connection kept open for delivering messages to an endpoint."""
+
+    def __init__(self, ws: ClientWebSocketResponse):
+        """Initialize the socket."""
+        self.ws = ws
+        self.last_used = time.perf_counter()
+        self.lock = asyncio.Lock()
+        self.reader: asyncio.Task = None
+
+    @property
+    def closed(self) -> bool:
+        """Accessor for the socket closed state."""
+        return self.ws.closed
+
+    async def send(self, payload: Union[str, bytes]):
+        """Send a message, waiting for the earlier messages to be written out.
+
+        Only one message is written at a time, and aiohttp waits for the
+        socket buffer to drain, so a slow endpoint holds up its senders
+        rather than accumulating frames in memory.
+        """
+        async with self.lock:
+            self.last_used = time.perf_counter()
+            if isinstance(payload, bytes):
+                await self.ws.send_bytes(payload)
+            else:
+                await self.ws.send_str(payload)
+
+    async def close(self):
+        """Close the socket once a message being sent is written out."""
+        async with self.lock:
+            await self.ws.close()
+
+
 class WsTransport(BaseOutboundTransport):
     """Websockets outbound transport class."""
 
     schemes = ("ws", "wss")
     is_external = False
 
+    IDLE_TIMEOUT = 60.0
+
     def __init__(self, **kwargs) -> None:
         """Initialize an `WsTransport` instance."""
         super().__init__(**kwargs)
         self.logger = logging.getLogger(__name__)
+        self.client_session: ClientSession = None
+        self.heartbeat_interval: int = None
+        self.max_sockets = 0
+        self.sockets: "OrderedDict[Tuple, OutboundSocket]" = OrderedDict()
+        self._connect_locks = {}
 
     async def start(self):
         """Start the outbound transport."""
+        settings = self.root_profile.settings if self.root_profile else {}
+        self.max_sockets = settings.get("transport.ws.outbound_sockets") or 0
+        self.heartbeat_interval = settings.get("transport.ws.heartbeat_interval")
         self.client_session = ClientSession(cookie_jar=DummyCookieJar(), trust_env=True)
         return self
 
     async def stop(self):
         """Stop the outbound transport."""
+        sockets = list(self.sockets.values())
+        self.sockets.clear()
+        for socket in sockets:
+            await socket.close()
         await self.client_session.close()
         self.client_session = None
 
@@ -47,9 +99,75 @@ class WsTransport(BaseOutboundTransport):
             endpoint: URI endpoint for delivery
             metadata: Additional metadata associated with the payload
         """
-        # aiohttp should automatically handle websocket sessions
-        async with self.client_session.ws_connect(endpoint, headers=metadata) as ws:
-            if isinstance(payload, bytes):
-                await ws.send_bytes(payload)
-            else:
-                await ws.send_str(payload)
+        if not self.max_sockets:
+            # aiohttp should automatically handle websocket sessions
+            async with self.client_session.ws_connect(endpoint, headers=metadata) as ws:
+                if isinstance(payload, bytes):
+                    await ws.send_bytes(payload)
+                else:
+                    await ws.send_str(payload)
+            return
+
+        key = (endpoint, tuple(sorted(metadata.items())) if metadata else ())
+        socket, reused = await self.get_socket(key)
+        try:
+            await socket.send(payload)
+        except ConnectionError:
+            self.discard_socket(key, socket)
+            if not reused:
+                raise
+            # the endpoint may have dropped an idle connection, so try once more
+            socket, _ = await self.get_socket(key)
+            await socket.send(payload)
+
+    async def get_socket(self, key: Tuple) -> Tuple[OutboundSocket, bool]:
+        """Get an open socket to an endpoint, connecting if necessary.
+
+        Returns:
+            A tuple of the socket and whether it was already open
+
+        """
+        self.close_idle_sockets()
+        lock = self._connect_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            socket = self.sockets.get(key)
+            if socket and not socket.closed:
+                self.sockets.move_to_end(key)
+                return socket, True
+
+            endpoint, headers = key
+            ws = await self.client_session.ws_connect(
+                endpoint, headers=dict(headers), heartbeat=self.heartbeat_interval
+            )
+            socket = OutboundSocket(ws)
+            socket.reader = asyncio.get_event_loop().create_task(
+                self.read_socket(key, socket)
+            )
+            self.sockets[key] = socket
+            self.close_idle_sockets()
+            return socket, False
+
+    async def read_socket(self, key: Tuple, socket: OutboundSocket):
+        """Consume the frames sent by an endpoint until the socket is closed."""
+        async for msg in socket.ws:
+            self.logger.debug(
+                "Discarding websocket message from %s: %s", key[0], msg.type
+            )
+        self.discard_socket(key, socket)
+
+    def discard_socket(self, key: Tuple, socket: OutboundSocket):
+        """Stop reusing a socket."""
+        if self.sockets.get(key) is socket:
+            del self.sockets[key]
+            self._connect_locks.pop(key, None)
+        if not socket.closed:
+            asyncio.get_event_loop().create_task(socket.close())
+
+    def close_idle_sockets(self):
+        """Close the least recently used sockets beyond the limit or left idle."""
+        idle_since = time.perf_counter() - self.IDLE_TIMEOUT
+        while self.sockets:
+            key, socket = next(iter(self.sockets.items()))
+            if len(self.sockets) <= self.max_sockets and socket.last_used > idle_since:
+                break
+            self.discard_socket(key, socket)
@@ -1,18 +1,21 @@
 """Standard packed message format classes."""
 
-import json
 import logging
 from typing import List, Sequence, Tuple, Union
 
+from marshmallow import ValidationError
+
 from ..core.profile import ProfileSession
 
 from ..protocols.routing.v1_0.messages.forward import Forward
 
 from ..messaging.util import time_now
+from ..utils import json_codec
+from ..utils.jwe import JweEnvelope
 from ..utils.task_queue import TaskQueue
 from ..wallet.base import BaseWallet
 from ..wallet.error import WalletError
-from ..wallet.util import b64_to_str
+from ..wallet.util import b64_to_bytes
 
 from .error import WireFormatParseError, WireFormatEncodeError, RecipientKeysError
 from .inbound.receipt import MessageReceipt
@@ -21,6 +24,56 @@ from .wire_format import BaseWireFormat
 LOGGER = logging.getLogger(__name__)
 
 
+class DecodedMessage:
+    """An incoming message body, decoded once for routing and unpacking."""
+
+    __slots__ = ("body", "message_dict", "_protected", "_envelope")
+
+    def __init__(self, body: Union[str, bytes, memoryview], message_dict: dict):
+        """Initialize the decoded message."""
+        self.body = body
+        self.message_dict = message_dict
+        self._protected = None
+        self._envelope = None
+
+    @property
+    def packed(self) -> bool:
+        """Check whether the message is packed, which is signalled by no @type."""
+        return "@type" not in self.message_dict
+
+    @property
+    def protected(self) -> dict:
+        """Accessor for the decoded protected headers of the JWE envelope."""
+        if self._protected is None:
+            self._protected = json_codec.loads(
+                b64_to_bytes(self.message_dict["protected"], urlsafe=True)
+            )
+        return self._protected
+
+    @property
+    def recipient_keys(self) -> List[str]:
+        """Accessor for the recipient key identifiers of the JWE envelope."""
+        return [
+            recipient["header"]["kid"] for recipient in self.protected["recipients"]
+        ]
+
+    @property
+    def envelope(self) -> JweEnvelope:
+        """Accessor for the JWE envelope.
+
+        Raises:
+            ValidationError: If the message is not a valid JWE envelope
+
+        """
+        if self._envelope is None:
+            try:
+                protected = self.protected
+            except (KeyError, TypeError, ValueError):
+                raise ValidationError("Invalid JWE: invalid protected headers")
+            self._envelope = JweEnvelope.deserialize(self.message_dict, protected)
+        return self._envelope
+
+
 class PackWireFormat(BaseWireFormat):
     """Standard DIDComm message parser and serializer."""
 
@@ -29,16 +82,38 @@ class PackWireFormat(BaseWireFormat):
         super().__init__()
         self.task_queue: TaskQueue = None
 
+    def decode_body(
+        self, message_body: Union[str, bytes, memoryview]
+    ) -> Union[str, bytes, memoryview, DecodedMessage]:
+        """Decode an incoming message body once, ahead of routing and parsing.
+
+        Args:
+            message_body: The body of the message
+
+        Returns:
+            The decoded message, or the message body if it is not a JSON object
+
+        """
+        if isinstance(message_body, DecodedMessage):
+            return message_body
+        try:
+            message_dict = json_codec.loads(message_body)
+        except (TypeError, ValueError):
+            return message_body
+        if not isinstance(message_dict, dict):
+            return message_body
+        return DecodedMessage(message_body, message_dict)
+
     async def parse_message(
         self,
         session: ProfileSession,
-        message_body: Union[str, bytes],
+        message_body: Union[str, bytes, memoryview, DecodedMessage],
     ) -> Tuple[dict, MessageReceipt]:
         """Deserialize an incoming message and further populate the request context.
 
         Args:
             session: The profile session for providing wallet access
-            message_body: The body of the message
+            message_body: The body of the message, or the result of `decode_body`
 
         Returns:
             A tuple of the parsed message and a message receipt instance
@@ -49,27 +124,30 @@ class PackWireFormat(BaseWireFormat):
 
         """
 
+        decoded = message_body
+        if isinstance(decoded, DecodedMessage):
+            message_body = decoded.body
+
         receipt = MessageReceipt()
         receipt.in_time = time_now()
         receipt.raw_message = message_body
 
-        message_dict = None
-        message_json = message_body
-
-        if not message_json:
+        if not message_body:
             raise WireFormatParseError("Message body is empty")
 
-        try:
-            message_dict = json.loads(message_json)
-        except ValueError:
-            raise WireFormatParseError("Message JSON parsing failed")
-        if not isinstance(message_dict, dict):
-            raise WireFormatParseError("Message JSON result is not an object")
-
-        # packed messages are detected by the absence of @type
-        if "@type" not in message_dict:
+        if not isinstance(decoded, DecodedMessage):
             try:
-                unpack = self.unpack(session, message_body, receipt)
+                message_dict = json_codec.loads(message_body)
+            except ValueError:
+                raise WireFormatParseError("Message JSON parsing failed")
+            if not isinstance(message_dict, dict):
+                raise WireFormatParseError("Message JSON result is not an object")
+            decoded = DecodedMessage(message_body, message_dict)
+        message_dict = decoded.message_dict
+
+        if decoded.packed:
+            try:
+                unpack = self.unpack(session, decoded, receipt)
                 message_json = await (
                     self.task_queue and self.task_queue.run(unpack) or unpack
                 )
@@ -78,7 +156,7 @@ class PackWireFormat(BaseWireFormat):
             else:
                 receipt.raw_message = message_json
                 try:
-                    message_dict = json.loads(message_json)
+                    message_dict = json_codec.loads(message_json)
                 except ValueError:
                     raise WireFormatParseError("Message JSON parsing failed")
                 if not isinstance(message_dict, dict):
@@ -103,7 +181,7 @@ class PackWireFormat(BaseWireFormat):
     async def unpack(
         self,
         session: ProfileSession,
-        message_body: Union[str, bytes],
+        message_body: Union[str, bytes, memoryview, DecodedMessage],
         receipt: MessageReceipt,
     ):
         """Look up the wallet instance and perform the message unpack."""
@@ -112,14 +190,19 @@ class PackWireFormat(BaseWireFormat):
             raise WireFormatParseError("Wallet not defined in profile session")
 
         try:
-            unpacked = await wallet.unpack_message(message_body)
+            if isinstance(message_body, DecodedMessage):
+                unpacked = await wallet.unpack_envelope(
+                    message_body.envelope, message_body.body
+                )
+            else:
+                unpacked = await wallet.unpack_message(message_body)
             (
                 message_json,
                 receipt.sender_verkey,
                 receipt.recipient_verkey,
             ) = unpacked
             return message_json
-        except WalletError as e:
+        except (ValidationError, WalletError) as e:
             raise WireFormatParseError("Message unpack failed") from e
 
     async def encode_message(
@@ -182,21 +265,23 @@ class PackWireFormat(BaseWireFormat):
         if routing_keys:
             recip_keys = recipient_keys
             for router_key in routing_keys:
-                message = json.loads(message.decode("utf-8"))
-                fwd_msg = Forward(to=recip_keys[0], msg=message)
+                # embed the packed message without decoding it again
+                fwd_json = Forward.wrap_json(recip_keys[0], message)
                 # Forwards are anon packed
                 recip_keys = [router_key]
                 try:
-                    message = await wallet.pack_message(fwd_msg.to_json(), recip_keys)
+                    message = await wallet.pack_message(fwd_json, recip_keys)
                 except WalletError as e:
                     raise WireFormatEncodeError("Forward message pack failed") from e
         return message
 
-    def get_recipient_keys(self, message_body: Union[str, bytes]) -> List[str]:
+    def get_recipient_keys(
+        self, message_body: Union[str, bytes, memoryview, DecodedMessage]
+    ) -> List[str]:
         """Get all recipient keys from a wire message.
 
         Args:
-            message_body: The body of the message
+            message_body: The body of the message, or the result of `decode_body`
 
         Returns:
             List of recipient keys from the message body
@@ -207,11 +292,8 @@ class PackWireFormat(BaseWireFormat):
         """
 
         try:
-            message_dict = json.loads(message_body)
-            protected = json.loads(b64_to_str(message_dict["protected"], urlsafe=True))
-            recipients = protected["recipients"]
-
-            recipient_keys = [recipient["header"]["kid"] for recipient in recipients]
+            decoded = self.decode_body(message_body)
+            recipient_keys = decoded.recipient_keys
         except Exception as e:
             raise RecipientKeysError(
                 "Error trying to extract recipient keys from JWE", e
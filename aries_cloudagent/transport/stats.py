@@ -8,11 +8,19 @@ from ..utils.stats import Collector
 class StatsTracer(aiohttp.TraceConfig):
     """Attach hooks to client session events and report statistics."""
 
-    def __init__(self, collector: Collector, prefix: str):
-        """Initialize the `StatsTracer` instance."""
+    def __init__(self, collector: Collector, prefix: str, *, per_host: bool = False):
+        """Initialize the `StatsTracer` instance.
+
+        Args:
+            collector: The collector to report statistics to
+            prefix: The prefix for the names of the statistics
+            per_host: Also report the statistics of each remote host separately,
+                including the number of connections created and reused
+        """
         super().__init__()
         self.collector = collector
         self.prefix = prefix
+        self.per_host = per_host
         self.on_request_start.append(self.request_start)
         self.on_connection_queued_start.append(self.connection_queued_start)
         self.on_connection_queued_end.append(self.connection_queued_end)
@@ -21,17 +29,26 @@ class StatsTracer(aiohttp.TraceConfig):
         self.on_connection_create_start.append(self.socket_connect_start)
         self.on_dns_cache_hit.append(self.socket_connect_start)  # restart timer
         self.on_dns_cache_miss.append(self.socket_connect_start)  # restart timer
-        self.on_connection_reuseconn.append(self.connection_ready)
+        self.on_connection_reuseconn.append(self.connection_reused)
         self.on_connection_create_end.append(self.connection_ready)
         self.on_request_end.append(self.request_end)
 
+    def timer(self, context, name: str):
+        """Create a timer for a statistic of the current request."""
+        groups = [self.prefix + name]
+        if self.per_host and context.host:
+            groups.append(f"{self.prefix}{context.host}:{name}")
+        return self.collector.timer(*groups)
+
     async def request_start(self, session, context, params):
         """Handle the start of a request."""
         context.method, context.url = params.method, params.url
+        context.host = params.url.host and f"{params.url.host}:{params.url.port}"
+        context.acquire_timer = self.timer(context, "reuse").start()
 
     async def connection_queued_start(self, session, context, params):
         """Handle the start of a queued connection."""
-        context.queue_timer = self.collector.timer(self.prefix + "queued").start()
+        context.queue_timer = self.timer(context, "queued").start()
 
     async def connection_queued_end(self, session, context, params):
         """Handle the end of a queued connection."""
@@ -39,7 +56,7 @@ class StatsTracer(aiohttp.TraceConfig):
 
     async def dns_resolvehost_start(self, session, context, params):
         """Handle the start of a DNS resolution."""
-        context.dns_timer = self.collector.timer(self.prefix + "dns_resolve").start()
+        context.dns_timer = self.timer(context, "dns_resolve").start()
 
     async def dns_resolvehost_end(self, session, context, params):
         """Handle the end of a DNS resolution."""
@@ -47,7 +64,7 @@ class StatsTracer(aiohttp.TraceConfig):
 
     async def socket_connect_start(self, session, context, params):
         """Handle the start of a socket connection."""
-        context.socket_timer = self.collector.timer(self.prefix + "connect").start()
+        context.socket_timer = self.timer(context, "connect").start()
 
     async def connection_ready(self, session, context, params):
         """Handle the end of connection acquisition."""
@@ -55,7 +72,12 @@ class StatsTracer(aiohttp.TraceConfig):
             context.socket_timer.stop()
         except AttributeError:
             pass
-        context.fetch_timer = self.collector.timer(self.prefix + context.method).start()
+        context.fetch_timer = self.timer(context, context.method).start()
+
+    async def connection_reused(self, session, context, params):
+        """Handle the acquisition of an idle connection from the pool."""
+        context.acquire_timer.stop()
+        await self.connection_ready(session, context, params)
 
     async def request_end(self, session, context, params):
         """Handle the end of request."""
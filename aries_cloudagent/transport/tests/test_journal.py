@@ -0,0 +1,86 @@
+from asynctest import TestCase as AsyncTestCase, mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...storage.base import BaseStorage
+from ...storage.error import StorageError
+from ...storage.record import StorageRecord
+
+from .. import journal as test_module
+from ..journal import MessageJournal, pack_payload, unpack_payload
+
+
+class TestMessageJournal(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.journal = MessageJournal(self.profile, "queued", flush_interval=0)
+
+    async def stored(self) -> dict:
+        return dict(await self.journal.load())
+
+    async def test_payload(self):
+        for payload in ("text", b"\x00bytes", None):
+            assert unpack_payload(pack_payload(payload)) == payload
+
+    async def test_add_update_remove(self):
+        await self.journal.add("a", {"value": 1})
+        assert await self.stored() == {"a": {"value": 1}}
+
+        self.journal.update("a", {"value": 2})
+        self.journal.add("b", {"value": 3})
+        await self.journal.flush()
+        assert await self.stored() == {"a": {"value": 2}, "b": {"value": 3}}
+
+        self.journal.remove("a")
+        await self.journal.close()
+        assert await self.stored() == {"b": {"value": 3}}
+        assert not self.journal.pending_count
+
+    async def test_coalesce(self):
+        with async_mock.patch.object(
+            self.journal, "write", async_mock.CoroutineMock()
+        ) as mock_write:
+            waiter = self.journal.add("a", {"value": 1})
+            self.journal.update("a", {"value": 2})
+            self.journal.add("b", {"value": 3})
+            self.journal.remove("b")
+            assert self.journal.pending_count == 1
+            await waiter
+            mock_write.assert_awaited_once_with(
+                {"a": (test_module.OP_ADD, {"value": 2})}
+            )
+
+            await self.journal.add("c", {"value": 4})
+            self.journal.remove("c")
+            self.journal.add("c", {"value": 5})
+            assert self.journal._pending == {"c": (test_module.OP_UPDATE, {"value": 5})}
+            await self.journal.flush()
+
+    async def test_batch_size(self):
+        self.journal.batch_size = 2
+        self.journal.flush_interval = 3600
+        waiters = [self.journal.add(str(idx), {"value": idx}) for idx in range(2)]
+        for waiter in waiters:
+            await waiter
+        assert len(await self.stored()) == 2
+
+    async def test_write_stale(self):
+        await self.journal.add("a", {"value": 1})
+        async with self.profile.session() as session:
+            await session.inject(BaseStorage).delete_record(
+                StorageRecord("queued", "", id="a")
+            )
+
+        # the update of a missing entry fails the batch, other changes apply
+        self.journal.update("a", {"value": 2})
+        self.journal.add("b", {"value": 3})
+        await self.journal.flush()
+        assert await self.stored() == {"b": {"value": 3}}
+
+    async def test_write_x(self):
+        with async_mock.patch.object(
+            self.journal, "write", async_mock.CoroutineMock(side_effect=StorageError)
+        ), async_mock.patch.object(
+            test_module.LOGGER, "exception", async_mock.MagicMock()
+        ) as mock_log:
+            await self.journal.add("a", {"value": 1})
+            mock_log.assert_called_once()
@@ -1,19 +1,23 @@
 import json
 from base64 import b64encode
 
+import pytest
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
+from ...askar.profile import AskarProfileManager
+from ...config.injection_context import InjectionContext
 from ...core.in_memory import InMemoryProfile
 from ...protocols.didcomm_prefix import DIDCommPrefix
 from ...protocols.routing.v1_0.message_types import FORWARD
+from ...utils.crypto_pool import CryptoPool
 from ...wallet.base import BaseWallet
 from ...wallet.did_method import SOV, DIDMethods
 from ...wallet.error import WalletError
-from ...wallet.key_type import ED25519
+from ...wallet.key_type import ED25519, KeyTypes
 from .. import pack_format as test_module
 from ..error import RecipientKeysError, WireFormatEncodeError, WireFormatParseError
-from ..pack_format import PackWireFormat
+from ..pack_format import DecodedMessage, PackWireFormat
 
 
 class TestPackWireFormat(AsyncTestCase):
@@ -199,6 +203,151 @@ class TestPackWireFormat(AsyncTestCase):
         assert delivery.recipient_verkey == router_did.verkey
         assert delivery.sender_verkey is None
 
+    async def test_decode_body(self):
+        local_did = await self.wallet.create_local_did(
+            method=SOV, key_type=ED25519, seed=self.test_seed
+        )
+        serializer = PackWireFormat()
+        packed = await serializer.encode_message(
+            self.session,
+            json.dumps(self.test_message),
+            [local_did.verkey],
+            (),
+            local_did.verkey,
+        )
+
+        decoded = serializer.decode_body(memoryview(packed))
+        assert isinstance(decoded, DecodedMessage) and decoded.packed
+        assert serializer.decode_body(decoded) is decoded
+        assert serializer.get_recipient_keys(decoded) == [local_did.verkey]
+
+        message_dict, delivery = await serializer.parse_message(self.session, decoded)
+        assert message_dict == self.test_message
+        assert delivery.recipient_verkey == local_did.verkey
+        assert delivery.sender_verkey == local_did.verkey
+
+        for body in ("{...", "[]"):
+            assert serializer.decode_body(body) == body
+
+    async def test_unpack_envelope_x(self):
+        serializer = PackWireFormat()
+        decoded = serializer.decode_body(json.dumps({"protected": "..."}))
+        with self.assertRaises(WireFormatParseError):
+            await serializer.unpack(self.session, decoded, None)
+
+    async def askar_profile(self, context: InjectionContext = None):
+        context = context or InjectionContext()
+        context.injector.bind_instance(DIDMethods, DIDMethods())
+        context.injector.bind_instance(KeyTypes, KeyTypes())
+        return await AskarProfileManager().provision(
+            context,
+            {
+                "name": ":memory:",
+                "key": await AskarProfileManager.generate_store_key(),
+                "key_derivation_method": "RAW",
+            },
+        )
+
+    @pytest.mark.askar
+    async def test_unpack_envelope_askar(self):
+        profile = await self.askar_profile()
+        serializer = PackWireFormat()
+        async with profile.session() as session:
+            wallet = session.inject(BaseWallet)
+            local_did = await wallet.create_local_did(
+                method=SOV, key_type=ED25519, seed=self.test_seed
+            )
+            packed = await serializer.encode_message(
+                session,
+                json.dumps(self.test_message),
+                [local_did.verkey],
+                (),
+                local_did.verkey,
+            )
+            decoded = serializer.decode_body(packed)
+            assert serializer.get_recipient_keys(decoded) == [local_did.verkey]
+            with async_mock.patch.object(
+                test_module.json_codec, "loads", async_mock.MagicMock()
+            ) as mock_loads:
+                mock_loads.side_effect = json.loads
+                message_dict, delivery = await serializer.parse_message(
+                    session, decoded
+                )
+                # only the unpacked message remains to be decoded
+                assert mock_loads.call_count == 1
+        assert message_dict == self.test_message
+        assert delivery.sender_verkey == local_did.verkey
+        await profile.close()
+
+    @pytest.mark.askar
+    async def test_crypto_pool_askar(self):
+        context = InjectionContext()
+        crypto_pool = CryptoPool(2)
+        context.injector.bind_instance(CryptoPool, crypto_pool)
+        profile = await self.askar_profile(context)
+        serializer = PackWireFormat()
+        async with profile.session() as session:
+            wallet = session.inject(BaseWallet)
+            local_did = await wallet.create_local_did(
+                method=SOV, key_type=ED25519, seed=self.test_seed
+            )
+            router_did = await wallet.create_local_did(
+                method=SOV, key_type=ED25519, seed=self.test_routing_seed
+            )
+            packed = await serializer.encode_message(
+                session,
+                json.dumps(self.test_message),
+                [local_did.verkey],
+                [router_did.verkey],
+                local_did.verkey,
+            )
+            assert crypto_pool.total_runs == 2
+
+            message_dict, delivery = await serializer.parse_message(session, packed)
+            assert crypto_pool.total_runs == 3
+            assert message_dict["@type"] == DIDCommPrefix.qualify_current(FORWARD)
+            assert delivery.recipient_verkey == router_did.verkey
+
+            message_dict, delivery = await serializer.parse_message(
+                session, json.dumps(message_dict["msg"])
+            )
+            assert crypto_pool.total_runs == 4
+            assert message_dict == self.test_message
+            assert delivery.sender_verkey == local_did.verkey
+        await profile.close()
+        crypto_pool.shutdown()
+
+    @pytest.mark.askar
+    async def test_key_cache_askar(self):
+        from ...askar.didcomm.key_cache import LOCAL_KEYS
+
+        profile = await self.askar_profile()
+        serializer = PackWireFormat()
+        async with profile.session() as session:
+            wallet = session.inject(BaseWallet)
+            local_did = await wallet.create_local_did(
+                method=SOV, key_type=ED25519, seed=self.test_seed
+            )
+            packed = await serializer.encode_message(
+                session,
+                json.dumps(self.test_message),
+                [local_did.verkey],
+                (),
+                local_did.verkey,
+            )
+            await serializer.parse_message(session, packed)
+            ident = (wallet.key_scope, local_did.verkey)
+            assert LOCAL_KEYS.get(ident)
+
+            await wallet.rotate_did_keypair_start(local_did.did)
+            await wallet.rotate_did_keypair_apply(local_did.did)
+            assert LOCAL_KEYS.get(ident) is None
+
+            await serializer.parse_message(session, packed)
+            assert LOCAL_KEYS.get(ident)
+        await profile.close()
+        assert LOCAL_KEYS.get(ident) is None
+
     async def test_get_recipient_keys(self):
         recip_keys = ["kid1", "kid2", "kid3"]
         enc_message = {
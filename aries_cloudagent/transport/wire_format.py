@@ -24,6 +24,22 @@ class BaseWireFormat:
     def __init__(self):
         """Initialize the base wire format instance."""
 
+    def decode_body(self, message_body: Union[str, bytes]):
+        """Decode an incoming message body once, ahead of routing and parsing.
+
+        The result is accepted in place of the message body by
+        `get_recipient_keys` and `parse_message`, so that a message is only
+        decoded once along the inbound path.
+
+        Args:
+            message_body: The body of the message
+
+        Returns:
+            The decoded message, or the message body when it is left as is
+
+        """
+        return message_body
+
     @abstractmethod
     async def parse_message(
         self,
@@ -0,0 +1,41 @@
+"""Worker pool for envelope encryption and decryption."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+
+class CryptoPool:
+    """Run CPU-bound envelope cryptography on a set of worker threads.
+
+    The Askar cryptographic primitives release the GIL while they run, so
+    threads allow packing and unpacking to use several cores without the
+    overhead of handing key material to other processes: the key handles
+    loaded by the event loop are used by the workers directly.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """Initialize the pool.
+
+        Args:
+            max_workers: The number of worker threads, by default one per CPU
+
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.total_runs = 0
+        self._executor = ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="acapy-crypto"
+        )
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Call a function on a worker thread and wait for its result."""
+        self.total_runs += 1
+        return await asyncio.get_event_loop().run_in_executor(
+            self._executor, partial(fn, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads once the submitted work is done."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,78 @@
+"""Pluggable JSON decoding for message bodies.
+
+`orjson` is used when it is installed, otherwise the standard library codec.
+Message bodies may be given as `str`, `bytes`, `bytearray` or `memoryview`.
+"""
+
+import json
+import re
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+# numbers which may not fit in 64 bits, which orjson either rejects or, from
+# version 3.10, silently decodes as floats
+LONG_NUMBER = re.compile(r"\d{19}")
+LONG_NUMBER_BYTES = re.compile(rb"\d{19}")
+
+
+def _json_loads(value: JsonInput) -> Any:
+    if isinstance(value, memoryview):
+        # the standard library does not accept buffers
+        value = value.tobytes()
+    return json.loads(value)
+
+
+def _orjson_loads(value: JsonInput) -> Any:
+    long_number = LONG_NUMBER if isinstance(value, str) else LONG_NUMBER_BYTES
+    if long_number.search(value):
+        # keep the precision of large integers, such as AnonCreds values
+        return _json_loads(value)
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than the standard library, so let the latter decide
+        return _json_loads(value)
+
+
+CODECS = {"json": _json_loads}
+if orjson:
+    CODECS["orjson"] = _orjson_loads
+
+_loads: Callable[[JsonInput], Any] = CODECS.get("orjson", _json_loads)
+_codec_name = "orjson" if orjson else "json"
+
+
+def register_codec(name: str, loads: Callable[[JsonInput], Any]):
+    """Register a JSON decoding function under a name."""
+    CODECS[name] = loads
+
+
+def use_codec(name: str):
+    """Select the registered JSON codec to decode message bodies with."""
+    global _loads, _codec_name
+
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    _loads = CODECS[name]
+    _codec_name = name
+
+
+def codec_name() -> str:
+    """Get the name of the JSON codec in use."""
+    return _codec_name
+
+
+def loads(value: JsonInput) -> Any:
+    """Decode a JSON document with the selected codec.
+
+    Raises:
+        ValueError: If the value is not valid JSON
+
+    """
+    return _loads(value)
@@ -8,6 +8,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 from marshmallow import Schema, ValidationError, fields
 
 from ..wallet.util import b64_to_bytes, bytes_to_b64
+from . import json_codec
 
 IDENT_ENC_KEY = "encrypted_key"
 IDENT_HEADER = "header"
@@ -118,27 +119,43 @@ class JweEnvelope:
         self._recipients: List[JweRecipient] = []
 
     @classmethod
-    def from_json(cls, message: Union[bytes, str]) -> "JweEnvelope":
+    def from_json(
+        cls, message: Union[bytes, bytearray, memoryview, str]
+    ) -> "JweEnvelope":
         """Decode a JWE envelope from a JSON string or bytes value."""
         try:
-            return cls._deserialize(JweSchema().loads(message))
-        except json.JSONDecodeError:
+            message = json_codec.loads(message)
+        except ValueError:
             raise ValidationError("Invalid JWE: not JSON")
+        return cls._deserialize(JweSchema().load(message))
 
     @classmethod
-    def deserialize(cls, message: Mapping[str, Any]) -> "JweEnvelope":
-        """Deserialize a JWE envelope from a mapping."""
-        return cls._deserialize(JweSchema().load(message))
+    def deserialize(
+        cls, message: Mapping[str, Any], protected: Mapping[str, Any] = None
+    ) -> "JweEnvelope":
+        """Deserialize a JWE envelope from a mapping.
+
+        Args:
+            message: The JSON-decoded envelope
+            protected: The protected headers, when they have already been decoded
+
+        """
+        return cls._deserialize(JweSchema().load(message), protected)
 
     @classmethod
-    def _deserialize(cls, parsed: Mapping[str, Any]) -> "JweEnvelope":
+    def _deserialize(
+        cls, parsed: Mapping[str, Any], protected: Mapping[str, Any] = None
+    ) -> "JweEnvelope":
         protected_b64 = parsed[IDENT_PROTECTED]
-        try:
-            protected: dict = json.loads(from_b64url(protected_b64))
-        except json.JSONDecodeError:
-            raise ValidationError(
-                "Invalid JWE: invalid JSON for protected headers"
-            ) from None
+        if protected is not None:
+            protected = dict(protected)
+        else:
+            try:
+                protected = json_codec.loads(from_b64url(protected_b64))
+            except ValueError:
+                raise ValidationError(
+                    "Invalid JWE: invalid JSON for protected headers"
+                ) from None
         unprotected = parsed.get("unprotected") or {}
         if protected.keys() & unprotected.keys():
             raise ValidationError("Invalid JWE: duplicate header")
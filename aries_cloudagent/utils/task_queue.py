@@ -1,13 +1,23 @@
 """Classes for managing a set of asyncio tasks."""
 
 import asyncio
+import heapq
 import logging
 import time
-from typing import Callable, Coroutine, Tuple
+from enum import IntEnum
+from typing import Callable, Coroutine, Iterator, Mapping, Optional, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
 
+class TaskPriority(IntEnum):
+    """Priority classes for queued tasks, highest first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
 def coro_ident(coro: Coroutine):
     """Extract an identifier for a coroutine."""
     return coro and (hasattr(coro, "__qualname__") and coro.__qualname__ or repr(coro))
@@ -43,12 +53,14 @@ class CompletedTask:
         exc_info: Tuple,
         ident: str = None,
         timing: dict = None,
+        priority: TaskPriority = None,
     ):
         """Initialize the completed task."""
         self.exc_info = exc_info
         self.ident = ident
         self.task = task
         self.timing = timing
+        self.priority = priority
 
     def __repr__(self) -> str:
         """Generate string representation for logging."""
@@ -65,6 +77,9 @@ class PendingTask:
         ident: str = None,
         task_future: asyncio.Future = None,
         queued_time: float = None,
+        *,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        group: str = None,
     ):
         """Initialize the pending task.
 
@@ -74,6 +89,9 @@ class PendingTask:
             ident: A string identifier for the task
             task_future: A future to be resolved to the asyncio Task
             queued_time: When the pending task was added to the queue
+            priority: The priority class of the task
+            group: The group sharing the queue fairly with other groups, such
+                as a tenant wallet identifier
         """
         if not asyncio.iscoroutine(coro):
             raise ValueError(f"Expected coroutine, got {coro}")
@@ -83,6 +101,8 @@ class PendingTask:
         self.queued_time: float = queued_time
         self.unqueued_time: float = None
         self.ident = ident or coro_ident(coro)
+        self.priority = TaskPriority(priority)
+        self.group = group
         self.task_future = task_future or asyncio.get_event_loop().create_future()
 
     def cancel(self):
@@ -120,11 +140,177 @@ class PendingTask:
         return f"<{self.__class__.__name__} ident={self.ident}>"
 
 
+class PendingQueue:
+    """Pending tasks ordered by priority class, then by weighted fair share.
+
+    Within a priority class, each group of tasks is assigned a virtual finish
+    time advancing by `1 / weight` per queued task (start-time fair queuing),
+    so a group with many queued tasks cannot delay the tasks of other groups
+    by more than one task per group. Tasks of the same group run in the order
+    they were added.
+    """
+
+    def __init__(self, weights: Mapping[str, float] = None):
+        """Initialize the pending queue.
+
+        Args:
+            weights: Relative weights of task groups, defaulting to 1
+        """
+        self.weights = dict(weights or {})
+        self._heap = []
+        self._count = 0
+        self._finish = {}
+        self._virtual = {}
+
+    def append(self, pending: PendingTask):
+        """Add a pending task to the queue."""
+        key = (pending.priority, pending.group)
+        tag = max(
+            self._virtual.get(pending.priority, 0.0), self._finish.get(key, 0.0)
+        ) + 1.0 / self.weights.get(pending.group, 1.0)
+        self._finish[key] = tag
+        self._count += 1
+        heapq.heappush(self._heap, (pending.priority, tag, self._count, pending))
+
+    def pop(self) -> PendingTask:
+        """Remove and return the next pending task to be run."""
+        priority, tag, _, pending = heapq.heappop(self._heap)
+        self._virtual[priority] = tag
+        key = (priority, pending.group)
+        if self._finish.get(key) == tag:
+            del self._finish[key]
+        return pending
+
+    def clear(self):
+        """Remove all pending tasks."""
+        self._heap.clear()
+        self._finish.clear()
+        self._virtual.clear()
+
+    def counts(self) -> dict:
+        """Get the number of pending tasks in each priority class."""
+        counts = {}
+        for entry in self._heap:
+            counts[entry[0]] = counts.get(entry[0], 0) + 1
+        return counts
+
+    def __getitem__(self, index: int) -> PendingTask:
+        """Fetch a pending task by its position in the run order."""
+        return sorted(self._heap)[index][3]
+
+    def __iter__(self) -> Iterator[PendingTask]:
+        """Iterate the pending tasks in run order."""
+        return (entry[3] for entry in sorted(self._heap))
+
+    def __len__(self) -> int:
+        """Support for the len() builtin."""
+        return len(self._heap)
+
+
+class AdaptiveLimit:
+    """Concurrency limit adjusted by additive increase, multiplicative decrease.
+
+    Task latency is tracked with a short-term and a long-term moving average.
+    While the short-term average stays within `tolerance` times the long-term
+    average and tasks are waiting to run, the limit grows by about one task for
+    each round of completed tasks. When the short-term average rises above that
+    level, running more tasks concurrently is only making each one slower and
+    the limit is multiplied by `backoff`, at most once per round.
+    """
+
+    def __init__(
+        self,
+        initial: int = 50,
+        *,
+        minimum: int = 1,
+        maximum: int = 500,
+        backoff: float = 0.9,
+        tolerance: float = 2.0,
+        smoothing: float = 0.1,
+        long_smoothing: float = 0.01,
+        latency_floor: float = 0.001,
+    ):
+        """Initialize the limit.
+
+        Args:
+            initial: The initial limit
+            minimum: The lowest allowed limit
+            maximum: The highest allowed limit
+            backoff: The factor applied to the limit when latency rises
+            tolerance: The allowed ratio of short-term to long-term latency
+            smoothing: The weight of each sample in the short-term average
+            long_smoothing: The weight of each sample in the long-term average
+            latency_floor: Latency in seconds below which no backoff occurs
+        """
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.long_smoothing = long_smoothing
+        self.latency_floor = latency_floor
+        self.latency: float = None
+        self.long_latency: float = None
+        self.queue_wait: float = None
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._round = 0
+
+    @property
+    def limit(self) -> int:
+        """Accessor for the current limit."""
+        return int(self._limit)
+
+    @staticmethod
+    def _average(current: Optional[float], sample: float, weight: float) -> float:
+        return sample if current is None else current + weight * (sample - current)
+
+    def update(self, latency: float, queue_wait: float = None, pending: int = 0) -> int:
+        """Record the timing of a completed task.
+
+        Args:
+            latency: The time in seconds the task was running
+            queue_wait: The time in seconds the task waited to be started
+            pending: The number of tasks now waiting to be started
+
+        Returns:
+            The updated limit
+
+        """
+        self.latency = self._average(self.latency, latency, self.smoothing)
+        self.long_latency = self._average(
+            self.long_latency, latency, self.long_smoothing
+        )
+        if queue_wait is not None:
+            self.queue_wait = self._average(self.queue_wait, queue_wait, self.smoothing)
+        self._round += 1
+        if self.latency > self.tolerance * max(self.long_latency, self.latency_floor):
+            if self._round >= self.limit:
+                self._limit = max(self.minimum, self._limit * self.backoff)
+                self._round = 0
+        elif pending:
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
+        return self.limit
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the current limit and timing averages."""
+        return {
+            "limit": self.limit,
+            "latency": self.latency,
+            "queue_wait": self.queue_wait,
+        }
+
+
 class TaskQueue:
     """A class for managing a set of asyncio tasks."""
 
     def __init__(
-        self, max_active: int = 0, timed: bool = False, trace_fn: Callable = None
+        self,
+        max_active: int = 0,
+        timed: bool = False,
+        trace_fn: Callable = None,
+        limiter: AdaptiveLimit = None,
+        group_weights: Mapping[str, float] = None,
     ):
         """Initialize the task queue.
 
@@ -132,10 +318,12 @@ class TaskQueue:
             max_active: The maximum number of tasks to automatically run
             timed: A flag indicating that timing should be collected for tasks
             trace_fn: A callback for all completed tasks
+            limiter: An optional adaptive limit replacing `max_active`
+            group_weights: Relative shares of pending task groups, defaulting to 1
         """
         self.loop = asyncio.get_event_loop()
         self.active_tasks = []
-        self.pending_tasks = []
+        self.pending_tasks = PendingQueue(group_weights)
         self.timed = timed
         self.total_done = 0
         self.total_failed = 0
@@ -144,7 +332,8 @@ class TaskQueue:
         self._cancelled = False
         self._drain_evt = asyncio.Event()
         self._drain_task: asyncio.Task = None
-        self._max_active = max_active
+        self._limiter = limiter
+        self._max_active = limiter.limit if limiter else max_active
 
     @property
     def cancelled(self) -> bool:
@@ -156,6 +345,11 @@ class TaskQueue:
         """Accessor for the maximum number of active tasks in the queue."""
         return self._max_active
 
+    @property
+    def limiter(self) -> Optional[AdaptiveLimit]:
+        """Accessor for the adaptive limit on active tasks, if any."""
+        return self._limiter
+
     @property
     def ready(self) -> bool:
         """Accessor for the ready property of the queue."""
@@ -218,7 +412,7 @@ class TaskQueue:
             while self.pending_tasks and (
                 not self._max_active or len(self.active_tasks) < self._max_active
             ):
-                pending: PendingTask = self.pending_tasks.pop(0)
+                pending: PendingTask = self.pending_tasks.pop()
                 if pending.queued_time:
                     pending.unqueued_time = time.perf_counter()
                     timing = {
@@ -228,7 +422,11 @@ class TaskQueue:
                 else:
                     timing = None
                 task = self.run(
-                    pending.coro, pending.complete_hook, pending.ident, timing
+                    pending.coro,
+                    pending.complete_hook,
+                    pending.ident,
+                    timing,
+                    priority=pending.priority,
                 )
                 try:
                     pending.task = task
@@ -245,7 +443,7 @@ class TaskQueue:
         Args:
             pending: The `PendingTask` to add to the task queue
         """
-        if self.timed and not pending.queued_time:
+        if (self.timed or self._limiter) and not pending.queued_time:
             pending.queued_time = time.perf_counter()
         self.pending_tasks.append(pending)
         self.drain()
@@ -256,6 +454,8 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        *,
+        priority: TaskPriority = None,
     ) -> asyncio.Task:
         """Register an active async task with an optional completion callback.
 
@@ -264,10 +464,13 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifer for the task
             timing: An optional dictionary of timing information
+            priority: The priority class the task was queued with
         """
         self.active_tasks.append(task)
         task.add_done_callback(
-            lambda fut: self.completed_task(task, task_complete, ident, timing)
+            lambda fut: self.completed_task(
+                task, task_complete, ident, timing, priority=priority
+            )
         )
         self.total_started += 1
         return task
@@ -278,6 +481,8 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        *,
+        priority: TaskPriority = None,
     ) -> asyncio.Task:
         """Start executing a coroutine as an async task, bypassing the pending queue.
 
@@ -286,6 +491,7 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifier for the task
             timing: An optional dictionary of timing information
+            priority: The priority class the task was queued with
 
         Returns: the new asyncio task instance
 
@@ -296,31 +502,47 @@ class TaskQueue:
             raise ValueError(f"Expected coroutine, got {coro}")
         if not ident:
             ident = coro_ident(coro)
-        if self.timed:
+        if self.timed or self._limiter:
             if not timing:
                 timing = {}
             coro = coro_timed(coro, timing)
         task = self.loop.create_task(coro)
-        return self.add_active(task, task_complete, ident, timing)
+        return self.add_active(task, task_complete, ident, timing, priority=priority)
 
     def put(
-        self, coro: Coroutine, task_complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        *,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        group: str = None,
     ) -> PendingTask:
         """Add a new task to the queue, delaying execution if busy.
 
+        Pending tasks are started in order of priority class. Within a class,
+        groups of tasks (such as those of each tenant) take turns in proportion
+        to their weights.
+
         Args:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            priority: The priority class of the task
+            group: The group sharing the queue fairly with other groups
 
         Returns: a future resolving to the asyncio task instance once queued
 
         """
-        pending = PendingTask(coro, task_complete, ident)
+        pending = PendingTask(
+            coro, task_complete, ident, priority=priority, group=group
+        )
         if self._cancelled:
             pending.cancel()
         elif self.ready:
-            pending.task = self.run(coro, task_complete, pending.ident)
+            pending.task = self.run(
+                coro, task_complete, pending.ident, priority=priority
+            )
         else:
             self.add_pending(pending)
         return pending
@@ -331,6 +553,8 @@ class TaskQueue:
         task_complete: Callable,
         ident: str,
         timing: dict = None,
+        *,
+        priority: TaskPriority = None,
     ):
         """Clean up after a task has completed and run callbacks."""
         exc_info = task_exc_info(task)
@@ -342,8 +566,14 @@ class TaskQueue:
                 )
         else:
             self.total_done += 1
+        if self._limiter and timing and "ended" in timing:
+            self._max_active = self._limiter.update(
+                timing["ended"] - timing["started"],
+                timing["unqueued"] - timing["queued"] if "queued" in timing else None,
+                len(self.pending_tasks),
+            )
         if task_complete or self._trace_fn:
-            completed = CompletedTask(task, exc_info, ident, timing)
+            completed = CompletedTask(task, exc_info, ident, timing, priority)
             try:
                 if task_complete:
                     task_complete(completed)
@@ -364,7 +594,7 @@ class TaskQueue:
             self._drain_task = None
         for pending in self.pending_tasks:
             pending.cancel()
-        self.pending_tasks = []
+        self.pending_tasks.clear()
 
     def cancel(self):
         """Cancel any pending or active tasks in the queue."""
@@ -0,0 +1,25 @@
+import threading
+
+from asynctest import TestCase as AsyncTestCase
+
+from ..crypto_pool import CryptoPool
+
+
+class TestCryptoPool(AsyncTestCase):
+    async def test_run(self):
+        pool = CryptoPool(2)
+        assert pool.max_workers == 2
+        result = await pool.run(
+            lambda value, suffix: (value + suffix, threading.current_thread().name),
+            "value",
+            suffix="!",
+        )
+        assert result[0] == "value!"
+        assert result[1].startswith("acapy-crypto")
+        assert pool.total_runs == 1
+        pool.shutdown()
+
+    async def test_default_workers(self):
+        pool = CryptoPool()
+        assert pool.max_workers >= 1
+        pool.shutdown()
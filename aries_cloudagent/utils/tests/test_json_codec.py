@@ -0,0 +1,35 @@
+import json
+from unittest import TestCase
+
+from .. import json_codec
+
+
+class TestJsonCodec(TestCase):
+    def setUp(self):
+        self.addCleanup(json_codec.use_codec, json_codec.codec_name())
+
+    def test_loads(self):
+        for name in json_codec.CODECS:
+            json_codec.use_codec(name)
+            assert json_codec.codec_name() == name
+            for value in ('{"a": [1]}', b'{"a": [1]}', memoryview(b'{"a": [1]}')):
+                assert json_codec.loads(value) == {"a": [1]}
+            for value, expected in (
+                ("123456789012345678901234567890", 123456789012345678901234567890),
+                (b'{"a": [-9999999999999999999]}', {"a": [-9999999999999999999]}),
+                (memoryview(b"[99999999999999999999]"), [99999999999999999999]),
+            ):
+                decoded = json_codec.loads(value)
+                assert decoded == expected
+                assert "." not in json.dumps(decoded)
+            with self.assertRaises(ValueError):
+                json_codec.loads(b"{...")
+
+    def test_register_codec(self):
+        json_codec.register_codec("test", lambda value: "decoded")
+        self.addCleanup(json_codec.CODECS.pop, "test")
+        json_codec.use_codec("test")
+        assert json_codec.loads("{}") == "decoded"
+
+        with self.assertRaises(ValueError):
+            json_codec.use_codec("unknown")
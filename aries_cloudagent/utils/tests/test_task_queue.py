@@ -2,7 +2,15 @@ import asyncio
 
 from asynctest import mock as async_mock, TestCase as AsyncTestCase
 
-from ..task_queue import CompletedTask, PendingTask, TaskQueue, task_exc_info
+from ..task_queue import (
+    AdaptiveLimit,
+    CompletedTask,
+    PendingQueue,
+    PendingTask,
+    TaskPriority,
+    TaskQueue,
+    task_exc_info,
+)
 
 
 async def retval(val, *, delay=0):
@@ -68,6 +76,35 @@ class TestTaskQueue(AsyncTestCase):
         assert pend1.task.result() == 1
         assert pend2.task.result() == 2
 
+    async def test_put_priority(self):
+        queue = TaskQueue(1, timed=True)
+        completed = []
+
+        def done(complete: CompletedTask):
+            assert not complete.exc_info
+            completed.append((complete.task.result(), complete.priority))
+
+        queue.put(retval(0), done)
+        for idx in range(1, 4):
+            queue.put(retval(idx), done, priority=TaskPriority.LOW)
+        queue.put(retval(4), done)
+        queue.put(retval(5), done, priority=TaskPriority.HIGH, group="other")
+        assert queue.pending_tasks.counts() == {
+            TaskPriority.HIGH: 1,
+            TaskPriority.NORMAL: 1,
+            TaskPriority.LOW: 3,
+        }
+        assert queue.pending_tasks[0].ident == "retval"
+        await queue.flush()
+        assert completed == [
+            (0, TaskPriority.NORMAL),
+            (5, TaskPriority.HIGH),
+            (4, TaskPriority.NORMAL),
+            (1, TaskPriority.LOW),
+            (2, TaskPriority.LOW),
+            (3, TaskPriority.LOW),
+        ]
+
     async def test_pending(self):
         coro = retval(1, delay=1)
         pend = PendingTask(coro, None)
@@ -226,3 +263,112 @@ class TestTaskQueue(AsyncTestCase):
         assert len(completed) == 2
         assert "queued" not in completed[0][1]
         assert "queued" in completed[1][1]
+
+    async def test_limiter(self):
+        limiter = AdaptiveLimit(2, maximum=3)
+        queue = TaskQueue(max_active=10, limiter=limiter)
+        assert queue.limiter is limiter
+        assert queue.max_active == 2
+
+        for idx in range(20):
+            await queue.put(retval(idx, delay=0.001))
+        await queue.complete(1)
+        assert queue.total_done == 20
+        assert queue.max_active == limiter.limit == 3
+        assert limiter.latency and limiter.queue_wait is not None
+        assert limiter.stats["limit"] == 3
+
+
+class TestPendingQueue(AsyncTestCase):
+    def make_pending(self, group, priority=TaskPriority.NORMAL):
+        return PendingTask(retval(group), ident=group, priority=priority, group=group)
+
+    def drain(self, queue: PendingQueue) -> list:
+        order = []
+        while queue:
+            pending = queue.pop()
+            pending.cancel()
+            order.append(pending.ident)
+        return order
+
+    async def test_fair_groups(self):
+        queue = PendingQueue()
+        for _ in range(4):
+            queue.append(self.make_pending("bulk"))
+        queue.append(self.make_pending("a"))
+        queue.append(self.make_pending("b"))
+        assert len(queue) == 6
+        assert [p.ident for p in queue] == ["bulk", "a", "b", "bulk", "bulk", "bulk"]
+        assert self.drain(queue) == ["bulk", "a", "b", "bulk", "bulk", "bulk"]
+
+        # a group arriving later is not penalized for the backlog of others
+        for _ in range(4):
+            queue.append(self.make_pending("bulk"))
+        assert queue.pop().ident == "bulk"
+        queue.append(self.make_pending("a"))
+        assert self.drain(queue) == ["bulk", "a", "bulk", "bulk"]
+
+    async def test_weights(self):
+        queue = PendingQueue({"heavy": 2.0})
+        for _ in range(4):
+            queue.append(self.make_pending("heavy"))
+            queue.append(self.make_pending("light"))
+        assert self.drain(queue) == [
+            "heavy",
+            "light",
+            "heavy",
+            "heavy",
+            "light",
+            "heavy",
+            "light",
+            "light",
+        ]
+
+    async def test_priority(self):
+        queue = PendingQueue()
+        queue.append(self.make_pending("low", TaskPriority.LOW))
+        queue.append(self.make_pending("normal"))
+        queue.append(self.make_pending("high", TaskPriority.HIGH))
+        assert queue[0].ident == "high"
+        assert self.drain(queue) == ["high", "normal", "low"]
+        queue.append(self.make_pending("normal"))
+        queue.clear()
+        assert not queue
+
+
+class TestAdaptiveLimit(AsyncTestCase):
+    def test_increase(self):
+        limiter = AdaptiveLimit(10, maximum=12)
+        for _ in range(10):
+            assert limiter.update(0.01) == 10
+        for _ in range(11):
+            limiter.update(0.01, 0.0, pending=5)
+        assert limiter.limit == 11
+        for _ in range(100):
+            limiter.update(0.01, 0.0, pending=5)
+        assert limiter.limit == 12
+        assert limiter.latency == 0.01
+        assert limiter.queue_wait == 0.0
+
+    def test_backoff(self):
+        limiter = AdaptiveLimit(10, minimum=5, backoff=0.5)
+        for _ in range(100):
+            limiter.update(0.01, pending=5)
+        limit = limiter.limit
+        assert limiter.update(1.0, pending=5) == limit // 2
+        for _ in range(limit // 2 - 1):
+            assert limiter.update(1.0, pending=5) == limit // 2
+        assert limiter.update(1.0, pending=5) == 5
+
+    def test_latency_floor(self):
+        limiter = AdaptiveLimit(10, latency_floor=0.01)
+        for _ in range(100):
+            limiter.update(0.0001)
+        for _ in range(10):
+            limiter.update(0.001)
+        assert limiter.limit == 10
+
+    def test_bounds(self):
+        assert AdaptiveLimit(0).limit == 1
+        assert AdaptiveLimit(1000, maximum=100).limit == 100
+        assert AdaptiveLimit(5, minimum=10, maximum=1).limit == 10
@@ -16,13 +16,20 @@ from aries_askar import (
 )
 
 from .did_parameters_validation import DIDParametersValidation
-from ..askar.didcomm.v1 import pack_message, unpack_message
+from ..askar.didcomm.v1 import (
+    invalidate_keys,
+    local_keys,
+    pack_message,
+    unpack_message,
+)
 from ..askar.profile import AskarProfileSession
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
 from ..ledger.error import LedgerConfigError
 from ..storage.askar import AskarStorage
 from ..storage.base import StorageRecord, StorageDuplicateError, StorageNotFoundError
+from ..utils.crypto_pool import CryptoPool
+from ..utils.jwe import JweEnvelope
 
 from .base import BaseWallet, KeyInfo, DIDInfo
 from .crypto import (
@@ -53,6 +60,12 @@ class AskarWallet(BaseWallet):
         """
         self._session = session
 
+    @property
+    def key_scope(self) -> tuple:
+        """Accessor for the identifier of the wallet in the DIDComm key cache."""
+        profile = self._session.profile
+        return (profile.opened.key_scope, profile.profile_id)
+
     @property
     def session(self) -> AskarProfileSession:
         """Accessor for Askar profile session instance."""
@@ -539,6 +552,7 @@ class AskarWallet(BaseWallet):
             if not next_verkey:
                 raise WalletError("Cannot rotate DID key: no next key established")
             del metadata["next_verkey"]
+            invalidate_keys(entry_val["verkey"], self.key_scope)
             entry_val["verkey"] = next_verkey
             item.tags["verkey"] = next_verkey
             await self._session.handle.replace(
@@ -658,14 +672,21 @@ class AskarWallet(BaseWallet):
             raise WalletError("Message not provided")
         try:
             if from_verkey:
-                from_key_entry = await self._session.handle.fetch_key(from_verkey)
-                if not from_key_entry:
+                from_keys = await local_keys(
+                    self._session.handle, from_verkey, self.key_scope
+                )
+                if not from_keys:
                     raise WalletNotFoundError("Missing key for pack operation")
-                from_key = from_key_entry.key
+                from_key, from_xkey = from_keys
             else:
-                from_key = None
+                from_key, from_xkey = None, None
+            crypto_pool = self._session.inject_or(CryptoPool)
+            if crypto_pool:
+                return await crypto_pool.run(
+                    pack_message, to_verkeys, from_key, message, from_xkey
+                )
             return await asyncio.get_event_loop().run_in_executor(
-                None, pack_message, to_verkeys, from_key, message
+                None, pack_message, to_verkeys, from_key, message, from_xkey
             )
         except AskarError as err:
             raise WalletError("Exception when packing message") from err
@@ -691,7 +712,43 @@ class AskarWallet(BaseWallet):
                 unpacked_json,
                 recipient,
                 sender,
-            ) = await unpack_message(self._session.handle, enc_message)
+            ) = await unpack_message(
+                self._session.handle,
+                enc_message,
+                self._session.inject_or(CryptoPool),
+                self.key_scope,
+            )
+        except AskarError as err:
+            raise WalletError("Exception when unpacking message") from err
+        return unpacked_json.decode("utf-8"), sender, recipient
+
+    async def unpack_envelope(
+        self, envelope: JweEnvelope, enc_message: Union[bytes, memoryview]
+    ) -> Tuple[str, str, str]:
+        """Unpack a message whose JWE envelope has already been decoded.
+
+        Args:
+            envelope: The decoded JWE envelope
+            enc_message: The encrypted message
+
+        Returns:
+            A tuple: (message, from_verkey, to_verkey)
+
+        Raises:
+            WalletError: If another backend error occurs
+
+        """
+        try:
+            (
+                unpacked_json,
+                recipient,
+                sender,
+            ) = await unpack_message(
+                self._session.handle,
+                envelope,
+                self._session.inject_or(CryptoPool),
+                self.key_scope,
+            )
         except AskarError as err:
             raise WalletError("Exception when unpacking message") from err
         return unpacked_json.decode("utf-8"), sender, recipient
@@ -5,6 +5,7 @@ from typing import List, Sequence, Tuple, Union
 
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
+from ..utils.jwe import JweEnvelope
 from .error import WalletError
 
 from .did_info import DIDInfo, KeyInfo
@@ -301,6 +302,26 @@ class BaseWallet(ABC):
 
         """
 
+    async def unpack_envelope(
+        self, envelope: JweEnvelope, enc_message: Union[bytes, memoryview]
+    ) -> Tuple[str, str, str]:
+        """Unpack a message whose JWE envelope has already been decoded.
+
+        Wallets which cannot make use of the decoded envelope unpack the
+        encrypted message itself.
+
+        Args:
+            envelope: The decoded JWE envelope
+            enc_message: The encrypted message
+
+        Returns:
+            A tuple: (message, from_verkey, to_verkey)
+
+        """
+        if isinstance(enc_message, memoryview):
+            enc_message = enc_message.tobytes()
+        return await self.unpack_message(enc_message)
+
     def __repr__(self) -> str:
         """Get a human readable string."""
         return "<{}>".format(self.__class__.__name__)
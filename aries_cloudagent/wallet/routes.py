@@ -19,6 +19,7 @@ from ..ledger.error import LedgerConfigError, LedgerError
 from ..messaging.jsonld.error import BadJWSHeaderError, InvalidVerificationMethod
 from ..messaging.models.base import BaseModelError
 from ..messaging.models.openapi import OpenAPISchema
+from ..messaging.models.paginated_query import PaginatedQuerySchema, get_limit_offset
 from ..messaging.responder import BaseResponder
 from ..messaging.valid import (
     DID_POSTURE_EXAMPLE,
@@ -252,7 +253,7 @@ class DIDEndpointSchema(OpenAPISchema):
     )
 
 
-class DIDListQueryStringSchema(OpenAPISchema):
+class DIDListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for DID list request query string."""
 
     did = fields.Str(
@@ -511,6 +512,11 @@ async def wallet_did_list(request: web.BaseRequest):
     results.sort(
         key=lambda info: (DIDPosture.get(info["posture"]).ordinal, info["did"])
     )
+    # the wallet interface returns all DIDs at once, so page the sorted list
+    limit, offset = get_limit_offset(request)
+    if limit is not None or offset:
+        offset = offset or 0
+        results = results[offset : offset + limit if limit is not None else None]
 
     return web.json_response({"results": results})
 
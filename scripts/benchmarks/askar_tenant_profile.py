@@ -0,0 +1,97 @@
+"""Measure the cost of getting tenant profiles in askar-profile multitenancy.
+
+Profiles are requested for a number of tenants in turn, as the inbound
+message relay and the admin server do, once with the profile cache and
+once with profiles rebuilt for every call:
+
+    python scripts/benchmarks/askar_tenant_profile.py --count 5000 --tenants 50
+
+Each mode reports the time per call and the memory allocated by each call.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.multitenant.askar_profile_manager import (  # noqa: E402
+    AskarProfileMultitenantManager,
+)
+from aries_cloudagent.multitenant.cache import ProfileCache  # noqa: E402
+from aries_cloudagent.wallet.did_method import DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import KeyTypes  # noqa: E402
+from aries_cloudagent.wallet.models.wallet_record import WalletRecord  # noqa: E402
+
+
+async def run(
+    name: str, manager: AskarProfileMultitenantManager, records: list, count: int
+):
+    """Get the profiles of the tenants in turn."""
+    context = manager._profile.context
+    # warm up the cache, if enabled
+    for record in records:
+        await manager.get_wallet_profile(context, record)
+
+    started = time.perf_counter()
+    for idx in range(count):
+        await manager.get_wallet_profile(context, records[idx % len(records)])
+    elapsed = (time.perf_counter() - started) / count
+
+    tracemalloc.start()
+    allocated = 0
+    for idx in range(min(count, 500)):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await manager.get_wallet_profile(context, records[idx % len(records)])
+        allocated += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    allocated /= min(count, 500)
+
+    print(f"{name:<10}{elapsed * 1e6:>8.1f} us/call{allocated / 1024:>8.1f} KiB/call")
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--tenants", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    manager = AskarProfileMultitenantManager(profile, profile)
+    records = [
+        WalletRecord(wallet_id=f"tenant-{idx}", settings={})
+        for idx in range(args.tenants)
+    ]
+    for record in records:
+        await manager.get_wallet_profile(context, record, provision=True)
+
+    # a cache which cannot hold on to profiles rebuilds them for every call
+    cache = manager._profiles
+    manager._profiles = ProfileCache(0)
+    await run("uncached", manager, records, args.count)
+    manager._profiles = cache
+    await run("cached", manager, records, args.count)
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
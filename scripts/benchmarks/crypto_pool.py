@@ -0,0 +1,97 @@
+"""Compare envelope packing and unpacking with and without a crypto pool.
+
+Messages are packed for a DID held in an in-memory Askar store, behind a
+number of routing keys, and then unpacked again, all concurrently as the
+dispatcher would do it:
+
+    python scripts/benchmarks/crypto_pool.py --count 2000 --routing 2 --workers 4
+
+Each mode reports the number of messages packed and unpacked per second.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.utils.crypto_pool import CryptoPool  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.did_method import SOV, DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519, KeyTypes  # noqa: E402
+
+
+async def run(name: str, workers: int, count: int, routing: int, size: int):
+    """Pack and unpack all messages concurrently."""
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    crypto_pool = CryptoPool(workers) if workers else None
+    if crypto_pool:
+        context.injector.bind_instance(CryptoPool, crypto_pool)
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    wire_format = PackWireFormat()
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        dids = [
+            await wallet.create_local_did(method=SOV, key_type=ED25519)
+            for _ in range(routing + 1)
+        ]
+    message = json.dumps(
+        {
+            "@type": "https://didcomm.org/basicmessage/1.0/message",
+            "@id": "benchmark",
+            "content": "x" * size,
+        }
+    )
+
+    async def pack_unpack():
+        async with profile.session() as session:
+            packed = await wire_format.encode_message(
+                session,
+                message,
+                [dids[0].verkey],
+                [did.verkey for did in dids[1:]],
+                dids[0].verkey,
+            )
+            await wire_format.parse_message(session, packed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(pack_unpack() for _ in range(count)))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<12}{count:>7} messages{elapsed:>8.2f}s{count / elapsed:>9.0f}/s")
+    await profile.close()
+    if crypto_pool:
+        crypto_pool.shutdown()
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--routing", type=int, default=2)
+    parser.add_argument("--size", type=int, default=65536)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    for name, workers in (("no pool", 0), (f"{args.workers} workers", args.workers)):
+        await run(name, workers, args.count, args.routing, args.size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
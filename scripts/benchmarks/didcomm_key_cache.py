@@ -0,0 +1,93 @@
+"""Compare DIDComm v1 pack and unpack with and without the key caches.
+
+Messages are packed by an AskarWallet for a fixed set of recipient verkeys,
+as a mediator forwarding to its clients does, and messages addressed to
+the wallet's own keys are unpacked:
+
+    python scripts/benchmarks/didcomm_key_cache.py --count 5000 --recipients 1000
+
+Each mode reports the time per pack and per unpack, and the hit ratios of
+the key caches.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.didcomm import key_cache  # noqa: E402
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.did_method import SOV, DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519, KeyTypes  # noqa: E402
+
+MESSAGE = '{"@type": "https://didcomm.org/basicmessage/1.0/message"}'
+
+
+async def run(name: str, wallet: BaseWallet, verkeys: list, count: int):
+    """Pack messages for the verkeys in turn, then unpack messages to them."""
+    key_cache.PUBLIC_KEYS.clear()
+    key_cache.LOCAL_KEYS.clear()
+    sender = verkeys[0]
+
+    started = time.perf_counter()
+    packed = []
+    for idx in range(count):
+        packed.append(
+            await wallet.pack_message(MESSAGE, [verkeys[idx % len(verkeys)]], sender)
+        )
+    pack_time = (time.perf_counter() - started) / count
+
+    started = time.perf_counter()
+    for message in packed:
+        await wallet.unpack_message(message)
+    unpack_time = (time.perf_counter() - started) / count
+
+    stats = key_cache.key_cache_stats()
+    print(
+        f"{name:<10}pack {pack_time * 1e6:>7.1f} us  unpack {unpack_time * 1e6:>7.1f} us"
+        f"  public hits {stats['public']['hit_ratio'] or 0:>6.1%}"
+        f"  local hits {stats['local']['hit_ratio'] or 0:>6.1%}"
+    )
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--recipients", type=int, default=1000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        verkeys = [
+            (await wallet.create_local_did(method=SOV, key_type=ED25519)).verkey
+            for _ in range(args.recipients)
+        ]
+        sizes = (key_cache.PUBLIC_KEYS.max_size, key_cache.LOCAL_KEYS.max_size)
+        for name, enabled in (("uncached", False), ("cached", True)):
+            key_cache.PUBLIC_KEYS.max_size = sizes[0] if enabled else 0
+            key_cache.LOCAL_KEYS.max_size = sizes[1] if enabled else 0
+            await run(name, wallet, verkeys, args.count)
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
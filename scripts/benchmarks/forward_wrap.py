@@ -0,0 +1,108 @@
+"""Measure the overhead of wrapping packed messages in Forward layers.
+
+A message is packed by an AskarWallet for a recipient behind a number of
+routing keys. The CPU time of wrapping each hop is measured with the
+decoded Forward message as it was done before and with `Forward.wrap_json`,
+followed by the time to encode the whole mediated message:
+
+    python scripts/benchmarks/forward_wrap.py --count 2000 --routing 3 --size 4096
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.protocols.routing.v1_0.messages.forward import (  # noqa: E402
+    Forward,
+)
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.did_method import SOV, DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519, KeyTypes  # noqa: E402
+
+
+def decoded_wrap(to: str, message: bytes) -> str:
+    """Wrap a packed message in a Forward message, decoding it first."""
+    return Forward(to=to, msg=json.loads(message.decode("utf-8"))).to_json()
+
+
+def time_per_call(fn, count: int, *args) -> float:
+    """Get the CPU time per call of a function, in microseconds."""
+    started = time.process_time()
+    for _ in range(count):
+        fn(*args)
+    return (time.process_time() - started) / count * 1e6
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--routing", type=int, default=3)
+    parser.add_argument("--size", type=int, default=4096)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    wire_format = PackWireFormat()
+    message = json.dumps(
+        {
+            "@type": "https://didcomm.org/basicmessage/1.0/message",
+            "@id": "benchmark",
+            "content": "x" * args.size,
+        }
+    )
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        dids = [
+            await wallet.create_local_did(method=SOV, key_type=ED25519)
+            for _ in range(args.routing + 1)
+        ]
+        recipient = dids[0].verkey
+        routing_keys = [did.verkey for did in dids[1:]]
+
+        # wrap each hop of the mediated message with both methods
+        packed = await wallet.pack_message(message, [recipient], recipient)
+        to = recipient
+        for hop, router_key in enumerate(routing_keys, 1):
+            decoded = time_per_call(decoded_wrap, args.count, to, packed)
+            direct = time_per_call(Forward.wrap_json, args.count, to, packed)
+            print(
+                f"hop {hop} ({len(packed):>6} bytes)  decoded {decoded:>7.1f} us"
+                f"  direct {direct:>6.1f} us"
+            )
+            packed = await wallet.pack_message(
+                Forward.wrap_json(to, packed), [router_key]
+            )
+            to = router_key
+
+        started = time.process_time()
+        for _ in range(args.count):
+            await wire_format.encode_message(
+                session, message, [recipient], routing_keys, recipient
+            )
+        elapsed = (time.process_time() - started) / args.count * 1e6
+        print(f"encode with {args.routing} routing keys  {elapsed:>7.1f} us/message")
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""Compare indexed and scanning tag queries on InMemoryStorage.
+
+The scanning implementation evaluates `tag_query_match` against every stored
+record, as InMemoryStorage did before records were indexed by tag:
+
+    python scripts/benchmarks/in_memory_tag_query.py --count 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.storage.in_memory import (  # noqa: E402
+    InMemoryStorage,
+    tag_query_match,
+)
+from aries_cloudagent.storage.record import StorageRecord  # noqa: E402
+
+QUERIES = {
+    "unique value": lambda count: {"connection_id": f"conn-{count // 2}"},
+    "selective value": lambda count: {"state": "request", "their_role": "invitee"},
+    "$in": lambda count: {"state": {"$in": ["request", "response"]}},
+    "$or + $not": lambda count: {
+        "$or": [{"state": "request"}, {"state": "abandoned"}],
+        "$not": {"their_role": "inviter"},
+    },
+    "all of type": lambda count: {},
+}
+STATES = ["active"] * 94 + ["request"] * 2 + ["response"] * 2 + ["abandoned"] * 2
+
+
+def scan(profile: InMemoryProfile, type_filter: str, tag_query: dict) -> list:
+    """Find records by evaluating the tag query against every record."""
+    return [
+        record
+        for record in profile.records.values()
+        if record.type == type_filter and tag_query_match(record.tags, tag_query)
+    ]
+
+
+async def populate(storage: InMemoryStorage, count: int):
+    """Add connection-like records, plus as many records of another type."""
+    for idx in range(count):
+        await storage.add_record(
+            StorageRecord(
+                "connection",
+                "{}",
+                {
+                    "connection_id": f"conn-{idx}",
+                    "state": STATES[idx % len(STATES)],
+                    "their_role": ("inviter", "invitee")[idx % 2],
+                },
+                uuid.uuid4().hex,
+            )
+        )
+        await storage.add_record(
+            StorageRecord("oob_record", "{}", {"state": "done"}, uuid.uuid4().hex)
+        )
+
+
+def timed(fn, repeat: int) -> float:
+    """Get the mean duration of a call in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    profile = InMemoryProfile.test_profile()
+    storage = InMemoryStorage(profile)
+    started = time.perf_counter()
+    await populate(storage, args.count)
+    print(
+        f"added {len(profile.records)} records "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+
+    print(f"{'query':<18}{'matches':>9}{'scan ms':>11}{'index ms':>11}{'speedup':>9}")
+    for name, make_query in QUERIES.items():
+        query = make_query(args.count)
+        expected = scan(profile, "connection", query)
+        found = await storage.find_all_records("connection", query)
+        assert [r.id for r in found] == [r.id for r in expected], name
+
+        scan_ms = timed(lambda: scan(profile, "connection", query), args.repeat)
+        index_ms = timed(
+            lambda: profile.record_index.search("connection", query), args.repeat
+        )
+        print(
+            f"{name:<18}{len(found):>9}{scan_ms:>11.3f}{index_ms:>11.3f}"
+            f"{scan_ms / index_ms:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
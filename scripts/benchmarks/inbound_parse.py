@@ -0,0 +1,94 @@
+"""Measure the CPU time spent parsing each inbound packed message.
+
+Messages packed for a DID held in an in-memory Askar store are routed and
+parsed as the inbound session does for a multitenant agent: the recipient
+keys are extracted for wallet lookup, then the message is unpacked and
+decoded. This is done once with the message body passed along as received
+and once with it decoded a single time by `decode_body`, for each available
+JSON codec:
+
+    python scripts/benchmarks/inbound_parse.py --count 2000 --size 4096
+
+Encryption costs are included in both modes; the difference is the time
+spent decoding the envelope again at each step.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.utils import json_codec  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.did_method import SOV, DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519, KeyTypes  # noqa: E402
+
+
+async def run(session, wire_format: PackWireFormat, bodies: list, decode: bool):
+    """Route and parse all message bodies, returning the CPU time per message."""
+    started = time.process_time()
+    for body in bodies:
+        if decode:
+            body = wire_format.decode_body(body)
+        wire_format.get_recipient_keys(body)
+        await wire_format.parse_message(session, body)
+    return (time.process_time() - started) / len(bodies)
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=4096)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    wire_format = PackWireFormat()
+    async with profile.session() as session:
+        did = await session.inject(BaseWallet).create_local_did(
+            method=SOV, key_type=ED25519
+        )
+        message = json.dumps(
+            {
+                "@type": "https://didcomm.org/basicmessage/1.0/message",
+                "@id": "benchmark",
+                "content": "x" * args.size,
+            }
+        )
+        packed = await wire_format.encode_message(
+            session, message, [did.verkey], (), did.verkey
+        )
+        bodies = [packed] * args.count
+
+        for codec in json_codec.CODECS:
+            json_codec.use_codec(codec)
+            for decode in (False, True):
+                per_message = await run(session, wire_format, bodies, decode)
+                print(
+                    f"{codec:<8}{'decoded once' if decode else 'as received':<14}"
+                    f"{per_message * 1e6:>9.1f} us/message"
+                )
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
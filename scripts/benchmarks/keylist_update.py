@@ -0,0 +1,100 @@
+"""Measure the cost of applying mediation keylist updates.
+
+A mediation client rotates a number of keys at once, adding them in one
+keylist update and removing them in another. The updates are applied by
+the mediation manager in a single transaction, and for comparison the same
+routes are created and deleted one at a time through the routing manager:
+
+    python scripts/benchmarks/keylist_update.py --keys 500 --rounds 5
+
+Each mode reports the time to add and to remove the keys.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from os import urandom
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.protocols.coordinate_mediation.v1_0.manager import (  # noqa: E402
+    MediationManager,
+)
+from aries_cloudagent.protocols.coordinate_mediation.v1_0 import (  # noqa: E402
+    messages,
+)
+from aries_cloudagent.protocols.coordinate_mediation.v1_0.models import (  # noqa: E402
+    mediation_record,
+)
+from aries_cloudagent.protocols.routing.v1_0.manager import (  # noqa: E402
+    RoutingManager,
+)
+from aries_cloudagent.wallet.did_method import DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import KeyTypes  # noqa: E402
+from aries_cloudagent.wallet.util import bytes_to_b58  # noqa: E402
+
+KeylistUpdateRule = messages.inner.keylist_update_rule.KeylistUpdateRule
+MediationRecord = mediation_record.MediationRecord
+
+
+async def batched(profile, record: MediationRecord, keys: list) -> float:
+    """Add and remove the keys with one keylist update each."""
+    manager = MediationManager(profile)
+    started = time.perf_counter()
+    for action in (KeylistUpdateRule.RULE_ADD, KeylistUpdateRule.RULE_REMOVE):
+        await manager.update_keylist(
+            record,
+            [KeylistUpdateRule(recipient_key=key, action=action) for key in keys],
+        )
+    return time.perf_counter() - started
+
+
+async def per_key(profile, record: MediationRecord, keys: list) -> float:
+    """Add and remove the keys with a storage operation each."""
+    manager = RoutingManager(profile)
+    started = time.perf_counter()
+    routes = [
+        await manager.create_route_record(record.connection_id, key) for key in keys
+    ]
+    for route in routes:
+        await manager.delete_route_record(route)
+    return time.perf_counter() - started
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    record = MediationRecord(
+        state=MediationRecord.STATE_GRANTED, connection_id="connection"
+    )
+    keys = [bytes_to_b58(urandom(32)) for _ in range(args.keys)]
+
+    for name, fn in (("per-key", per_key), ("batched", batched)):
+        elapsed = min([await fn(profile, record, keys) for _ in range(args.rounds)])
+        print(f"{name:<10}{elapsed * 1e3:>10.1f} ms for {args.keys} keys")
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
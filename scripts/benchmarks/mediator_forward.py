@@ -0,0 +1,178 @@
+"""Measure the throughput of a mediator relaying forward messages.
+
+A mediator holds routes for a number of recipient keys, spread over the
+connections to its clients. Forward messages packed for the mediator are
+unpacked, dispatched and relayed to the client connection, as they are by
+the inbound transports, once with the route records queried in storage and
+once with the in-memory route index:
+
+    python scripts/benchmarks/mediator_forward.py --routes 10000 --count 2000
+
+The messages are handled one at a time, so each mode reports the forwards
+per second handled by a single core.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.cache.base import BaseCache  # noqa: E402
+from aries_cloudagent.cache.in_memory import InMemoryCache  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.connections.models.connection_target import (  # noqa: E402
+    ConnectionTarget,
+)
+from aries_cloudagent.core.dispatcher import Dispatcher  # noqa: E402
+from aries_cloudagent.core.event_bus import EventBus  # noqa: E402
+from aries_cloudagent.core.protocol_registry import ProtocolRegistry  # noqa: E402
+from aries_cloudagent.protocols.coordinate_mediation.v1_0 import (  # noqa: E402
+    route_manager,
+    route_manager_provider,
+)
+from aries_cloudagent.protocols.routing.v1_0.message_types import (  # noqa: E402
+    MESSAGE_TYPES,
+)
+from aries_cloudagent.protocols.routing.v1_0.messages.forward import (  # noqa: E402
+    Forward,
+)
+from aries_cloudagent.protocols.routing.v1_0.models.route_record import (  # noqa: E402
+    RouteRecord,
+)
+from aries_cloudagent.protocols.routing.v1_0.route_index import (  # noqa: E402
+    RouteIndex,
+)
+from aries_cloudagent.transport.inbound.message import InboundMessage  # noqa: E402
+from aries_cloudagent.transport.outbound.status import (  # noqa: E402
+    OutboundSendStatus,
+)
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.did_method import SOV, DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519, KeyTypes  # noqa: E402
+
+
+async def run(name: str, profile, dispatcher: Dispatcher, messages: list, count: int):
+    """Unpack, dispatch and relay the forward messages in turn."""
+    wire_format = PackWireFormat()
+    relayed = []
+
+    async def send_outbound(profile, outbound, inbound=None):
+        relayed.append(outbound)
+        return OutboundSendStatus.QUEUED_FOR_DELIVERY
+
+    started = time.process_time()
+    for idx in range(count):
+        async with profile.session() as session:
+            payload, receipt = await wire_format.parse_message(
+                session, messages[idx % len(messages)]
+            )
+        await dispatcher.handle_message(
+            profile, InboundMessage(payload, receipt), send_outbound
+        )
+    elapsed = time.process_time() - started
+    assert len(relayed) == count
+    print(
+        f"{name:<10}{count / elapsed:>10.0f} forwards/s"
+        f"{elapsed / count * 1e6:>10.1f} us/forward"
+    )
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=10000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=4096)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    context.injector.bind_instance(EventBus, EventBus())
+    registry = ProtocolRegistry()
+    registry.register_message_types(MESSAGE_TYPES)
+    context.injector.bind_instance(ProtocolRegistry, registry)
+    # connection targets are served from the cache, as for completed connections
+    cache = InMemoryCache()
+    context.injector.bind_instance(BaseCache, cache)
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+
+    profile.context.injector.bind_provider(
+        route_manager.RouteManager, route_manager_provider.RouteManagerProvider(profile)
+    )
+
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        mediator = await wallet.create_local_did(method=SOV, key_type=ED25519)
+        client = await wallet.create_local_did(method=SOV, key_type=ED25519)
+
+    connection_ids = [f"connection-{idx}" for idx in range(args.connections)]
+    for connection_id in connection_ids:
+        await cache.set(
+            f"connection_target::{connection_id}",
+            [
+                ConnectionTarget(
+                    endpoint="http://localhost:8020",
+                    recipient_keys=[client.verkey],
+                ).serialize()
+            ],
+        )
+    keys = [f"route-key-{idx}" for idx in range(args.routes)]
+    async with profile.transaction() as txn:
+        await RouteRecord.save_all(
+            txn,
+            [
+                RouteRecord(
+                    connection_id=connection_ids[idx % len(connection_ids)],
+                    recipient_key=key,
+                )
+                for idx, key in enumerate(keys)
+            ],
+        )
+        await txn.commit()
+
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        inner = await wallet.pack_message(
+            json.dumps({"@type": "message", "content": "x" * args.size}),
+            [client.verkey],
+        )
+        rng = random.Random(0)
+        messages = [
+            await wallet.pack_message(
+                Forward.wrap_json(rng.choice(keys), inner), [mediator.verkey]
+            )
+            for _ in range(200)
+        ]
+
+    dispatcher = Dispatcher(profile)
+    await dispatcher.setup()
+    await run("storage", profile, dispatcher, messages, args.count)
+
+    route_index = RouteIndex()
+    route_index.subscribe(profile.inject(EventBus))
+    await route_index.load(profile)
+    profile.context.injector.bind_instance(RouteIndex, route_index)
+    await run("indexed", profile, dispatcher, messages, args.count)
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""Compare outbound delivery with and without the persistent queue.
+
+Messages are queued concurrently through OutboundTransportManager and handed
+to an in-process stub transport, first with the queue held in memory only and
+then with `--persistent-queue` journaling to a temporary Askar (SQLite) store:
+
+    python scripts/benchmarks/outbound_journal.py --count 20000 --concurrency 200
+
+The persistent run then restarts the manager and replays the messages that
+were still waiting for a retry.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.connections.models.connection_target import (  # noqa: E402
+    ConnectionTarget,
+)
+from aries_cloudagent.transport.outbound.base import (  # noqa: E402
+    BaseOutboundTransport,
+    OutboundTransportError,
+)
+from aries_cloudagent.transport.outbound.manager import (  # noqa: E402
+    OutboundTransportManager,
+)
+from aries_cloudagent.transport.outbound.message import OutboundMessage  # noqa: E402
+
+STORE_NAME = "outbound-journal-benchmark"
+
+
+class StubTransport(BaseOutboundTransport):
+    """Accept messages for `stub://` endpoints, failing those for `stub://down`."""
+
+    schemes = ("stub",)
+    is_external = False
+    delivered = 0
+
+    async def start(self):
+        """Start the transport."""
+
+    async def stop(self):
+        """Stop the transport."""
+
+    async def handle_message(self, profile, payload, endpoint, metadata, api_key):
+        """Count a delivered message."""
+        if endpoint == "stub://down":
+            raise OutboundTransportError("Endpoint unavailable")
+        StubTransport.delivered += 1
+
+
+async def open_profile(persistent: bool):
+    """Open the benchmark store."""
+    context = InjectionContext(settings={"transport.persistent_queue": persistent})
+    return await AskarProfileManager().provision(
+        context,
+        {
+            "name": STORE_NAME,
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+            "auto_recreate": True,
+        },
+    )
+
+
+async def start_manager(profile) -> OutboundTransportManager:
+    """Start an outbound transport manager with the stub transport."""
+    mgr = OutboundTransportManager(profile)
+    mgr.register_class(StubTransport, "stub")
+    await mgr.start()
+    await mgr.task_queue
+    return mgr
+
+
+async def enqueue(mgr, profile, endpoint: str, count: int, concurrency: int):
+    """Queue `count` pre-encoded messages, `concurrency` at a time."""
+
+    async def send(idx: int):
+        message = OutboundMessage(
+            payload='{"@id": "%d"}' % idx, enc_payload=b'{"idx": %d}' % idx
+        )
+        message.target = ConnectionTarget(endpoint=endpoint)
+        await mgr.enqueue_message(profile, message)
+
+    for start in range(0, count, concurrency):
+        await asyncio.gather(
+            *(send(idx) for idx in range(start, min(start + concurrency, count)))
+        )
+
+
+async def run(persistent: bool, count: int, concurrency: int, down: int):
+    """Deliver messages and report the throughput."""
+    profile = await open_profile(persistent)
+    mgr = await start_manager(profile)
+    await enqueue(mgr, profile, "stub://down", down, concurrency)
+
+    StubTransport.delivered = 0
+    started = time.perf_counter()
+    await enqueue(mgr, profile, "stub://up", count, concurrency)
+    while StubTransport.delivered < count:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{'persistent' if persistent else 'in-memory':<11}"
+        f"delivered {count} messages in {elapsed:.2f}s ({count / elapsed:.0f}/s)"
+    )
+
+    if persistent:
+        await mgr.stop(wait=False)
+        mgr = await start_manager(profile)
+        started = time.perf_counter()
+        restored = await mgr.replay()
+        print(
+            f"{'':<11}replayed {restored} waiting messages "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    await mgr.stop(wait=False)
+    await profile.close()
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--down", type=int, default=1000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["ACAPY_HOME"] = home
+        for persistent in (False, True):
+            await run(persistent, args.count, args.concurrency, args.down)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""Drive queued outbound messages through OutboundTransportManager.
+
+Messages are delivered over HTTP to a local stub endpoint, while a second set
+of messages addressed to an unreachable endpoint is kept waiting for retry:
+
+    python scripts/benchmarks/outbound_queue.py --count 100000 --unreachable 5000
+
+Delivery throughput is reported along with the CPU time used by the process,
+both while delivering and while only the unreachable messages remain queued.
+"""
+
+import argparse
+import asyncio
+import resource
+import socket
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.connections.models.connection_target import (  # noqa: E402
+    ConnectionTarget,
+)
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.transport.outbound.manager import (  # noqa: E402
+    OutboundTransportManager,
+)
+from aries_cloudagent.transport.outbound.message import OutboundMessage  # noqa: E402
+
+
+def cpu_seconds() -> float:
+    """Get the user and system CPU time used by this process."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def closed_port() -> int:
+    """Find a local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_stub(count: int) -> tuple:
+    """Start a stub endpoint accepting messages, resolving a future at `count`."""
+    received = [0]
+    done = asyncio.get_event_loop().create_future()
+
+    async def handle(request: web.Request):
+        await request.read()
+        received[0] += 1
+        if received[0] == count and not done.done():
+            done.set_result(time.perf_counter())
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", done
+
+
+async def enqueue(
+    mgr: OutboundTransportManager, profile, endpoint: str, count: int
+) -> float:
+    """Queue `count` pre-encoded messages for an endpoint."""
+    started = time.perf_counter()
+    for idx in range(count):
+        message = OutboundMessage(payload="{}", enc_payload=b'{"idx": %d}' % idx)
+        message.target = ConnectionTarget(endpoint=endpoint)
+        await mgr.enqueue_message(profile, message)
+    return time.perf_counter() - started
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--unreachable", type=int, default=5000)
+    parser.add_argument("--idle", type=float, default=5.0)
+    args = parser.parse_args()
+
+    runner, endpoint, done = await start_stub(args.count)
+    profile = InMemoryProfile.test_profile({"transport.outbound_retry_backoff": 60})
+    mgr = OutboundTransportManager(profile)
+    mgr.register("http")
+    await mgr.start()
+    await mgr.task_queue
+
+    unreachable = f"http://127.0.0.1:{closed_port()}/"
+    await enqueue(mgr, profile, unreachable, args.unreachable)
+    while len(mgr.outbound_retry) < args.unreachable:
+        await asyncio.sleep(0.05)
+    print(f"{args.unreachable} messages waiting for retry")
+
+    cpu = cpu_seconds()
+    started = time.perf_counter()
+    enqueue_secs = await enqueue(mgr, profile, endpoint, args.count)
+    finished = await done
+    elapsed = finished - started
+    print(
+        f"delivered {args.count} messages in {elapsed:.2f}s "
+        f"({args.count / elapsed:.0f}/s, enqueue {enqueue_secs:.2f}s, "
+        f"cpu {cpu_seconds() - cpu:.2f}s)"
+    )
+
+    while len(mgr.outbound_buffer) > args.unreachable:
+        await asyncio.sleep(0.05)
+    cpu = cpu_seconds()
+    await asyncio.sleep(args.idle)
+    print(
+        f"idle with {len(mgr.outbound_retry)} retries pending: "
+        f"cpu {cpu_seconds() - cpu:.3f}s over {args.idle:.0f}s"
+    )
+
+    await mgr.stop(wait=False)
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
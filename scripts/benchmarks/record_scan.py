@@ -0,0 +1,126 @@
+"""Compare peak memory use of BaseRecord.query and BaseRecord.iter_query.
+
+A temporary Askar (SQLite) store is populated with connection records, then
+each scan mode runs in a fresh interpreter so that its peak resident set size
+can be measured in isolation:
+
+    python scripts/benchmarks/record_scan.py --count 1000000
+
+Peak RSS is reported relative to the RSS after opening the store.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.connections.models.conn_record import ConnRecord  # noqa: E402
+
+STORE_NAME = "record-scan-benchmark"
+INSERT_BATCH = 10000
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in megabytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def store_config(key: str) -> dict:
+    """Get the benchmark store configuration."""
+    return {"name": STORE_NAME, "key": key, "key_derivation_method": "RAW"}
+
+
+async def populate(key: str, count: int):
+    """Create the store and add `count` connection records to it."""
+    profile = await AskarProfileManager().provision(
+        InjectionContext(), {**store_config(key), "auto_recreate": True}
+    )
+    started = time.perf_counter()
+    for start in range(0, count, INSERT_BATCH):
+        records = [
+            ConnRecord(
+                their_label=f"Agent {idx}",
+                their_role=ConnRecord.Role.REQUESTER.rfc160,
+                state=ConnRecord.State.COMPLETED.rfc160,
+                invitation_key=f"{idx:044d}",
+            )
+            for idx in range(start, min(start + INSERT_BATCH, count))
+        ]
+        async with profile.session() as session:
+            await ConnRecord.save_all(session, records, event=False)
+    print(f"populated {count} records in {time.perf_counter() - started:.1f}s")
+    await profile.close()
+
+
+async def scan(key: str, mode: str, page_size: int):
+    """Scan all connection records and report the memory used."""
+    profile = await AskarProfileManager().open(InjectionContext(), store_config(key))
+    async with profile.session() as session:
+        baseline = peak_rss_mb()
+        started = time.perf_counter()
+        if mode == "query":
+            count = len(await ConnRecord.query(session))
+        else:
+            count = 0
+            async for _ in ConnRecord.iter_query(session, page_size=page_size):
+                count += 1
+        elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "mode": mode,
+                "records": count,
+                "seconds": round(elapsed, 2),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+                "scan_rss_mb": round(peak_rss_mb() - baseline, 1),
+            }
+        )
+    )
+    await profile.close()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--mode", choices=("query", "iter"), help=argparse.SUPPRESS)
+    parser.add_argument("--key", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(scan(args.key, args.mode, args.page_size))
+        return
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["ACAPY_HOME"] = home
+        key = asyncio.run(AskarProfileManager.generate_store_key())
+        asyncio.run(populate(key, args.count))
+        for mode in ("query", "iter"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--key",
+                    key,
+                    "--page-size",
+                    str(args.page_size),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
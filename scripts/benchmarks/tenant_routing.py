@@ -0,0 +1,96 @@
+"""Measure the cost of finding the tenant wallet for an inbound message.
+
+A base wallet holds a route and a wallet record for each of a number of
+tenants. The recipient keys of random tenants are resolved to their wallet
+records as the inbound message relay does, once by querying the route
+records in storage and once with the in-memory route index:
+
+    python scripts/benchmarks/tenant_routing.py --tenants 100000 --count 2000
+
+The time to load the route index at startup is reported as well.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.askar.profile import AskarProfileManager  # noqa: E402
+from aries_cloudagent.config.injection_context import InjectionContext  # noqa: E402
+from aries_cloudagent.multitenant.manager import MultitenantManager  # noqa: E402
+from aries_cloudagent.protocols.routing.v1_0.models.route_record import (  # noqa: E402
+    RouteRecord,
+)
+from aries_cloudagent.protocols.routing.v1_0.route_index import (  # noqa: E402
+    RouteIndex,
+)
+from aries_cloudagent.wallet.did_method import DIDMethods  # noqa: E402
+from aries_cloudagent.wallet.key_type import KeyTypes  # noqa: E402
+from aries_cloudagent.wallet.models.wallet_record import WalletRecord  # noqa: E402
+
+
+async def run(name: str, manager: MultitenantManager, keys: list, count: int):
+    """Resolve the recipient keys of random tenants to their wallets."""
+    lookups = random.Random(0).choices(keys, k=count)
+    started = time.perf_counter()
+    for key in lookups:
+        assert await manager._get_wallet_by_key(key)
+    elapsed = (time.perf_counter() - started) / count
+    print(f"{name:<10}{elapsed * 1e6:>10.1f} us/lookup")
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=100000)
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    context = InjectionContext()
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    manager = MultitenantManager(profile)
+
+    keys = [f"tenant-key-{idx}" for idx in range(args.tenants)]
+    async with profile.transaction() as txn:
+        wallet_ids = await WalletRecord.save_all(
+            txn, [WalletRecord(settings={}) for _ in range(args.tenants)]
+        )
+        await RouteRecord.save_all(
+            txn,
+            [
+                RouteRecord(wallet_id=wallet_id, recipient_key=key)
+                for wallet_id, key in zip(wallet_ids, keys)
+            ],
+        )
+        await txn.commit()
+
+    await run("storage", manager, keys, args.count)
+
+    route_index = RouteIndex()
+    started = time.perf_counter()
+    await route_index.load(profile)
+    elapsed = time.perf_counter() - started
+    print(f"index load{elapsed * 1e3:>10.1f} ms for {len(route_index)} routes")
+    profile.context.injector.bind_instance(RouteIndex, route_index)
+
+    await run("indexed", manager, keys, args.count)
+    await profile.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
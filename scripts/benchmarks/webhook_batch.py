@@ -0,0 +1,107 @@
+"""Compare webhook delivery with and without batching.
+
+State-change webhooks for a number of credential exchange records are sent
+to a local stub controller through OutboundTransportManager, as during bulk
+issuance where groups of records progress through their states together:
+
+    python scripts/benchmarks/webhook_batch.py --records 5000 --concurrent 20
+
+Each mode reports the number of requests received by the controller and the
+time until every webhook has been delivered.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.protocols.issue_credential.v2_0.models.cred_ex_record import (  # noqa: E402,E501
+    V20CredExRecord,
+)
+from aries_cloudagent.transport.outbound.manager import (  # noqa: E402
+    OutboundTransportManager,
+)
+
+STATES = ["offer-sent", "request-received", "credential-issued", "done"]
+
+
+async def start_stub() -> tuple:
+    """Start a stub controller counting requests and received webhooks."""
+    counts = {"requests": 0, "webhooks": 0}
+
+    async def handle(request: web.Request):
+        body = await request.json()
+        counts["requests"] += 1
+        counts["webhooks"] += len(body) if isinstance(body, list) else 1
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/topic/{topic}/", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", counts
+
+
+async def run(name: str, settings: dict, records: int, concurrent: int):
+    """Send the webhooks of all records and wait for their delivery."""
+    runner, endpoint, counts = await start_stub()
+    mgr = OutboundTransportManager(InMemoryProfile.test_profile(settings))
+    mgr.register("http")
+    await mgr.start()
+    await mgr.task_queue
+
+    started = time.perf_counter()
+    for start in range(0, records, concurrent):
+        for state in STATES:
+            for idx in range(start, min(start + concurrent, records)):
+                mgr.enqueue_webhook(
+                    V20CredExRecord.RECORD_TOPIC,
+                    {"cred_ex_id": f"cred-{idx}", "state": state},
+                    endpoint,
+                )
+            await asyncio.sleep(0)
+    while (
+        mgr.outbound_buffer
+        or mgr.outbound_new
+        or (mgr.webhook_batcher and mgr.webhook_batcher.pending_count)
+    ):
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<10}{records * len(STATES):>9} webhooks{counts['webhooks']:>9} delivered"
+        f"{counts['requests']:>8} requests{elapsed:>8.2f}s"
+    )
+    await mgr.stop()
+    await runner.cleanup()
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--concurrent", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    batch = {"admin.webhook_batch_size": args.batch_size}
+    for name, settings in (
+        ("single", {}),
+        ("batched", batch),
+        ("coalesced", {**batch, "admin.webhook_batch_coalesce": True}),
+    ):
+        await run(name, settings, args.records, args.concurrent)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())